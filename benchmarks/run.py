@@ -0,0 +1,323 @@
+"""Standalone benchmark runner for the dbapi hot paths.
+
+Micro-benchmarks (no I/O) cover the per-statement / per-row / per-
+parameter helpers; end-to-end benchmarks drive a real sync
+``Connection`` against :class:`dqlitedbapi.testing.LoopbackCluster`
+over loopback, so socket, framing, decoding and row conversion are
+all on the clock.
+
+Each benchmark is calibrated to run for about ``--round-time`` seconds
+per round; the best and median per-call times over ``--rounds`` rounds
+are reported. Results can be written to JSON and compared with a
+baseline; a median slower than the baseline by more than
+``--tolerance`` is flagged and makes the run exit 1::
+
+    PYTHONPATH=src python benchmarks/run.py
+    PYTHONPATH=src python benchmarks/run.py -k fetch --latency 0.0005
+    PYTHONPATH=src python benchmarks/run.py --save benchmarks/baseline.json
+    PYTHONPATH=src python benchmarks/run.py --compare benchmarks/baseline.json
+
+Absolute numbers are machine-dependent: refresh the baseline on the
+machine that compares against it, and treat the comparison as a
+review aid rather than a pass/fail gate in CI.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import dqlitedbapi
+from dqlitedbapi.connection import Connection, _submit_threadsafe
+from dqlitedbapi.cursor import _classify_caller_sql, _classify_statement, _convert_row
+from dqlitedbapi.testing import LoopbackCluster
+from dqlitedbapi.types import _convert_bind_param
+from dqlitewire.constants import ValueType
+
+Bench = Callable[[argparse.Namespace], contextlib.AbstractContextManager[Callable[[], object]]]
+
+_BENCHMARKS: dict[str, Bench] = {}
+
+_RESULT_ROWS = [(f"name-{i}", i * 0.5) for i in range(1000)]
+
+
+def _bench(name: str) -> Callable[[Callable[..., Iterator[Callable[[], object]]]], Bench]:
+    """Register a generator that sets up, yields the timed callable,
+    then tears down."""
+
+    def register(fn: Callable[..., Iterator[Callable[[], object]]]) -> Bench:
+        wrapped = contextlib.contextmanager(fn)
+        _BENCHMARKS[name] = wrapped
+        return wrapped
+
+    return register
+
+
+# --- micro-benchmarks -------------------------------------------------
+
+
+@_bench("classify_caller_sql")
+def _classify(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    sql = "SELECT id, name FROM users WHERE id = ? AND name = ? -- trailing; comment"
+    params = (1, "x")
+    yield lambda: _classify_caller_sql(sql, params)
+
+
+@_bench("classify_statement_miss")
+def _classify_miss(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    # What every ``execute`` pays on a statement-cache miss (varied SQL
+    # or ``statement_cache_size=0``) without a result cache.
+    sql = "SELECT id, name FROM users WHERE id = ? AND name = ? -- trailing; comment"
+    yield lambda: _classify_statement(sql)
+
+
+@_bench("convert_row")
+def _row(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    row = [1, "alice", 2.5, None, b"\x00\x01", 7, "x" * 32, 0.25]
+    types = [
+        int(t)
+        for t in (
+            ValueType.INTEGER,
+            ValueType.TEXT,
+            ValueType.FLOAT,
+            ValueType.NULL,
+            ValueType.BLOB,
+            ValueType.INTEGER,
+            ValueType.TEXT,
+            ValueType.FLOAT,
+        )
+    ]
+    yield lambda: _convert_row(row, types)
+
+
+@_bench("convert_row_datetime")
+def _row_datetime(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    row = [1, "2024-05-01 12:34:56.789+00:00", 1714566896]
+    types = [int(ValueType.INTEGER), int(ValueType.ISO8601), int(ValueType.UNIXTIME)]
+    yield lambda: _convert_row(row, types)
+
+
+@_bench("convert_bind_param")
+def _bind(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    values = [1, "alice", 2.5, None, b"\x00", True]
+    yield lambda: [_convert_bind_param(v) for v in values]
+
+
+@_bench("convert_bind_param_datetime")
+def _bind_datetime(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    value = datetime.datetime(2024, 5, 1, 12, 34, 56, tzinfo=datetime.UTC)
+    yield lambda: _convert_bind_param(value)
+
+
+# --- sync-over-async bridge -------------------------------------------
+
+
+async def _noop() -> int:
+    return 1
+
+
+@contextlib.contextmanager
+def _loop_thread() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield loop
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+@_bench("run_coroutine_threadsafe")
+def _stdlib_submit(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    """Reference point for ``submit_threadsafe``."""
+    with _loop_thread() as loop:
+        yield lambda: asyncio.run_coroutine_threadsafe(_noop(), loop).result()
+
+
+@_bench("submit_threadsafe")
+def _submit(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    with _loop_thread() as loop:
+        yield lambda: _submit_threadsafe(_noop(), loop).result()
+
+
+@_bench("run_sync")
+def _run_sync(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    conn = Connection("localhost:9001", timeout=5.0)
+    try:
+        yield lambda: conn._run_sync(_noop())
+    finally:
+        conn.close()
+
+
+@_bench("connect_when_connected")
+def _reconnect(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    conn = Connection("localhost:9001", timeout=5.0)
+    conn._async_conn = object()  # type: ignore[assignment]
+    try:
+        yield conn.connect
+    finally:
+        conn._async_conn = None
+        conn.close()
+
+
+# --- end-to-end against the loopback stand-in ---------------------------
+
+
+@contextlib.contextmanager
+def _cursor(args: argparse.Namespace, **server_kwargs: Any) -> Iterator[dqlitedbapi.Cursor]:
+    cluster = LoopbackCluster(**server_kwargs)
+    with cluster.serve_in_thread():
+        conn = dqlitedbapi.connect(cluster.address, timeout=10.0)
+        try:
+            cur = conn.cursor()
+            cur.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+            cur.executemany("INSERT INTO t (name, score) VALUES (?, ?)", _RESULT_ROWS)
+            cur.execute("CREATE TABLE w (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+            # Latency applies to the timed statements only.
+            cluster.latency = args.latency
+            yield cur
+        finally:
+            conn.close()
+
+
+@_bench("execute_fetchall_1000")
+def _fetchall(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    with _cursor(args) as cur:
+        yield lambda: cur.execute("SELECT id, name, score FROM t").fetchall()
+
+
+@_bench("execute_fetchall_1000_split_frames")
+def _fetchall_split(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    """Small continuation frames, dribbled onto the socket in pieces."""
+    with _cursor(args, rows_per_frame=50, chunk_size=1400) as cur:
+        yield lambda: cur.execute("SELECT id, name, score FROM t").fetchall()
+
+
+@_bench("execute_fetchmany_100_x10")
+def _fetchmany(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    def run() -> None:
+        cur.execute("SELECT id, name, score FROM t")
+        while cur.fetchmany(100):
+            pass
+
+    with _cursor(args) as cur:
+        yield run
+
+
+@_bench("execute_fetchone_1000")
+def _fetchone(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    def run() -> None:
+        cur.execute("SELECT id, name, score FROM t")
+        while cur.fetchone() is not None:
+            pass
+
+    with _cursor(args) as cur:
+        yield run
+
+
+@_bench("execute_insert")
+def _insert(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    with _cursor(args) as cur:
+        yield lambda: cur.execute("INSERT INTO w (name, score) VALUES (?, ?)", ("x", 1.5))
+
+
+@_bench("executemany_100")
+def _executemany(args: argparse.Namespace) -> Iterator[Callable[[], object]]:
+    params = [(f"name-{i}", i * 0.5) for i in range(100)]
+    with _cursor(args) as cur:
+        yield lambda: cur.executemany("INSERT INTO w (name, score) VALUES (?, ?)", params)
+
+
+# --- runner -----------------------------------------------------------
+
+
+def _measure(fn: Callable[[], object], rounds: int, round_time: float) -> dict[str, float]:
+    fn()  # warm up caches / connection
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= round_time / 10:
+            break
+        calls *= 4
+    calls = max(1, int(calls * round_time / max(elapsed, 1e-9)))
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        per_call.append((time.perf_counter() - start) / calls * 1e6)
+    return {
+        "best_us": round(min(per_call), 3),
+        "median_us": round(statistics.median(per_call), 3),
+        "calls": calls,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--round-time", type=float, default=0.2, help="seconds per round")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="server delay per reply, seconds"
+    )
+    parser.add_argument("--save", type=Path, help="write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare with a JSON baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed median slowdown (0.25 = 25%%)"
+    )
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, Any] = {}
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())["results"]
+
+    results: dict[str, dict[str, float]] = {}
+    regressions = []
+    for name, bench in _BENCHMARKS.items():
+        if args.filter and args.filter not in name:
+            continue
+        with bench(args) as fn:
+            result = results[name] = _measure(fn, args.rounds, args.round_time)
+        line = f"{name:38} best {result['best_us']:10.2f} µs  median {result['median_us']:10.2f} µs"
+        previous = baseline.get(name)
+        if previous is not None:
+            ratio = result["median_us"] / previous["median_us"]
+            line += f"  {ratio:5.2f}x baseline"
+            if ratio > 1 + args.tolerance:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line, flush=True)
+
+    if args.save is not None:
+        document = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "latency": args.latency,
+            },
+            "results": results,
+        }
+        args.save.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
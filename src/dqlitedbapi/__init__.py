@@ -22,6 +22,7 @@ state misuse portably should catch ``Error`` (the parent class).
 # ``DQLITEWIRE_ALLOW_FREE_THREADED=1`` is signalling they accept
 # the single-owner discipline across all layers.
 
+from collections.abc import Iterable, Sequence
 from typing import Final, Literal, NoReturn
 
 from dqlitedbapi._constants import (
@@ -31,7 +32,7 @@ from dqlitedbapi._constants import (
     SQLITE_VERSION_INFO as _SQLITE_VERSION_INFO,
 )
 from dqlitedbapi.connection import Connection
-from dqlitedbapi.cursor import Cursor
+from dqlitedbapi.cursor import _DEFAULT_STATEMENT_CACHE_SIZE, Cursor
 from dqlitedbapi.exceptions import (
     DatabaseError,
     DataError,
@@ -44,6 +45,9 @@ from dqlitedbapi.exceptions import (
     ProgrammingError,
     Warning,
 )
+from dqlitedbapi.instrumentation import Listener
+from dqlitedbapi.result_cache import ResultCache
+from dqlitedbapi.retry import ReadRetry
 from dqlitedbapi.types import (
     BINARY,
     DATETIME,
@@ -138,7 +142,7 @@ __all__ = [  # noqa: RUF022 - grouped by PEP 249 section, not alphabetical
 
 
 def connect(
-    address: str,
+    address: str | Sequence[str],
     *,
     database: str = "default",
     timeout: float = 10.0,
@@ -146,12 +150,22 @@ def connect(
     max_continuation_frames: int | None = _DEFAULT_MAX_CONTINUATION_FRAMES,
     trust_server_heartbeat: bool = False,
     close_timeout: float = 0.5,
+    shared_loop: bool = False,
+    statement_cache_size: int = _DEFAULT_STATEMENT_CACHE_SIZE,
+    executemany_batch_size: int | None = None,
+    result_cache: ResultCache | None = None,
+    listeners: Iterable[Listener] | None = None,
+    slow_query_threshold: float | None = None,
+    inline_loop: bool = False,
+    read_retry: ReadRetry | None = None,
     **unknown_kwargs: object,
 ) -> Connection:
     """Connect to a dqlite database.
 
     Args:
-        address: Node address in "host:port" format
+        address: Node address in "host:port" format, or several seeds
+            as a comma-separated string or a list; leader discovery
+            probes them concurrently and the first leader answer wins
         database: Database name to open
         timeout: Per-RPC-phase timeout in seconds — must be a positive
             finite number. The same budget is applied to each phase of
@@ -171,6 +185,37 @@ def connect(
         close_timeout: Budget (seconds) for the transport-drain during
             ``close()``. Forwarded to the underlying :class:`Connection`.
             Default 0.5 s is sized for LAN.
+        shared_loop: Run the Connection on a process-wide pool of
+            event-loop threads instead of a dedicated thread per
+            Connection. Forwarded to the underlying :class:`Connection`.
+            Default False.
+        statement_cache_size: Per-connection LRU bound for cached SQL
+            classification. ``0`` disables the cache. Default 128.
+            Forwarded to the underlying :class:`Connection`.
+        executemany_batch_size: Opt-in. Rows per multi-row ``VALUES``
+            statement when ``executemany`` runs a plain ``INSERT ...
+            VALUES (?, ...)``. Forwarded to the underlying
+            :class:`Connection`. Default None (one statement per row).
+        result_cache: Opt-in :class:`~dqlitedbapi.result_cache.ResultCache`
+            for repeated pure reads. Forwarded to the underlying
+            :class:`Connection`. Default None.
+        listeners: Callables receiving an
+            :class:`~dqlitedbapi.instrumentation.Event` per operation on
+            this connection. Forwarded to the underlying
+            :class:`Connection`.
+        slow_query_threshold: Seconds; operations at least this slow
+            are logged (fingerprint, redacted parameter shape, time
+            split) on ``dqlitedbapi.instrumentation.slow_query``.
+            Forwarded to the underlying :class:`Connection`. Default None.
+        inline_loop: Drive the Connection's event loop in the calling
+            thread instead of a background thread, removing the
+            cross-thread hand-off from every call. Not usable from a
+            thread running an event loop; exclusive with
+            ``shared_loop``. Forwarded to the underlying
+            :class:`Connection`. Default False.
+        read_retry: Opt-in :class:`~dqlitedbapi.retry.ReadRetry` that
+            replays pure reads failing on a leader change. Forwarded to
+            the underlying :class:`Connection`. Default None.
 
     Returns:
         A Connection object
@@ -200,6 +245,14 @@ def connect(
         max_continuation_frames=max_continuation_frames,
         trust_server_heartbeat=trust_server_heartbeat,
         close_timeout=close_timeout,
+        shared_loop=shared_loop,
+        statement_cache_size=statement_cache_size,
+        executemany_batch_size=executemany_batch_size,
+        result_cache=result_cache,
+        listeners=listeners,
+        slow_query_threshold=slow_query_threshold,
+        inline_loop=inline_loop,
+        read_retry=read_retry,
     )
 
 
@@ -0,0 +1,148 @@
+"""Column-oriented result builders behind ``Cursor.fetch_columns`` /
+``fetch_numpy`` / ``fetch_arrow_table`` (and the async siblings).
+
+NumPy and pyarrow are optional: neither is a dependency of this
+package. They are imported on first use, and a missing one surfaces
+as ``NotSupportedError`` — never an ``ImportError`` at package import.
+"""
+
+import array
+import importlib
+from collections.abc import Sequence
+from types import ModuleType
+from typing import Any, Final
+
+from dqlitedbapi.exceptions import DataError, NotSupportedError, ProgrammingError
+from dqlitewire.constants import ValueType
+
+# ``array.array`` typecodes for the homogeneous numeric columns
+# ``fetch_columns`` packs. Keyed by the *decoded* Python type, which is
+# a faithful image of the per-row wire type after ``_convert_row``:
+# only ``ValueType.INTEGER`` decodes to ``int`` (BOOLEAN is ``bool``,
+# UNIXTIME a ``datetime``) and only ``ValueType.FLOAT`` to ``float``.
+# Both are 64-bit on the wire, so ``q`` / ``d`` never truncate.
+_COLUMN_TYPECODES: Final[dict[type, str]] = {int: "q", float: "d"}
+
+_Column = array.array[Any] | list[Any]
+
+
+def _pack_columns(
+    description: Sequence[Sequence[Any]], values: Sequence[Sequence[Any]]
+) -> dict[str, _Column]:
+    """Build ``{column name: column}`` from per-column value sequences.
+
+    A column whose every value is an INTEGER (resp. FLOAT) — no NULLs,
+    no mixed storage classes — is packed into an ``array.array`` of
+    ``q`` (resp. ``d``): 8 bytes per value instead of a pointer plus a
+    boxed Python object. Everything else stays a ``list`` so SQLite's
+    per-row dynamic typing (NULLs, TEXT in an INTEGER column, mixed
+    ints and floats) round-trips unchanged.
+    """
+    names = [d[0] for d in description]
+    if len(set(names)) != len(names):
+        dupes = sorted({n for n in names if names.count(n) > 1})
+        raise ProgrammingError(
+            f"fetch_columns requires unique column names; alias the duplicates: {dupes}"
+        )
+    if not values:
+        return {name: [] for name in names}
+    columns: dict[str, _Column] = {}
+    for name, column in zip(names, values, strict=True):
+        kinds = set(map(type, column))
+        typecode = _COLUMN_TYPECODES.get(kinds.pop()) if len(kinds) == 1 else None
+        columns[name] = array.array(typecode, column) if typecode else list(column)
+    return columns
+
+
+def _require(module: str, feature: str) -> ModuleType:
+    """Import an optional dependency or raise ``NotSupportedError``."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise NotSupportedError(
+            f"{feature}() requires {module!r}, which is not installed; "
+            f"install it to enable this export"
+        ) from e
+
+
+def _arrow_type(pa: ModuleType, type_code: Any) -> Any:
+    """Arrow type for a column's wire ``ValueType``; ``None`` = infer.
+
+    ``type_code`` is the ``description`` entry, i.e. the wire type of
+    the first row. ISO8601 is inferred because the decoder yields
+    naive or offset-aware ``datetime`` (or ``time``) depending on the
+    stored text.
+    """
+    if type_code == ValueType.INTEGER:
+        return pa.int64()
+    if type_code == ValueType.FLOAT:
+        return pa.float64()
+    if type_code == ValueType.TEXT:
+        return pa.string()
+    if type_code == ValueType.BLOB:
+        return pa.binary()
+    if type_code == ValueType.BOOLEAN:
+        return pa.bool_()
+    if type_code == ValueType.UNIXTIME:
+        return pa.timestamp("us", tz="UTC")
+    return None
+
+
+def _columns_to_arrow_table(
+    description: Sequence[Sequence[Any]], values: Sequence[Sequence[Any]]
+) -> Any:
+    """Build a ``pyarrow.Table`` column by column.
+
+    Packed numeric columns are wrapped zero-copy via
+    ``Array.from_buffers``; the rest go through one bulk
+    ``pyarrow.array`` call per column with the wire-derived type. A
+    column whose rows disagree with the first row's wire type (SQLite
+    dynamic typing) falls back to Arrow's own inference; if Arrow
+    cannot represent it at all, ``DataError`` is raised.
+    """
+    pa = _require("pyarrow", "fetch_arrow_table")
+    columns = _pack_columns(description, values)
+    arrays = []
+    for (name, col), desc in zip(columns.items(), description, strict=True):
+        if isinstance(col, array.array):
+            arrow_type = pa.int64() if col.typecode == "q" else pa.float64()
+            arrays.append(pa.Array.from_buffers(arrow_type, len(col), [None, pa.py_buffer(col)]))
+            continue
+        try:
+            arrays.append(pa.array(col, type=_arrow_type(pa, desc[1])))
+        except (TypeError, ValueError):
+            try:
+                arrays.append(pa.array(col))
+            except (TypeError, ValueError) as e:
+                raise DataError(
+                    f"column {name!r} mixes storage classes Arrow cannot represent: {e}"
+                ) from e
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def _columns_to_numpy(
+    description: Sequence[Sequence[Any]], values: Sequence[Sequence[Any]]
+) -> dict[str, Any]:
+    """Build ``{column name: numpy.ndarray}``.
+
+    Packed numeric columns become ``int64`` / ``float64`` arrays that
+    share the ``array.array`` buffer (no copy); an all-BOOLEAN column
+    becomes ``bool``; anything else — NULLs, TEXT, BLOB, datetimes,
+    mixed storage classes — is an ``object`` array holding the same
+    values ``fetchall`` would return.
+    """
+    np = _require("numpy", "fetch_numpy")
+    columns = _pack_columns(description, values)
+    result: dict[str, Any] = {}
+    for name, col in columns.items():
+        if isinstance(col, array.array):
+            result[name] = np.frombuffer(col, dtype=np.int64 if col.typecode == "q" else np.float64)
+        elif col and all(type(v) is bool for v in col):
+            result[name] = np.array(col, dtype=bool)
+        else:
+            # ``empty`` + slice-assign keeps bytes / tuples as scalars
+            # instead of letting numpy broadcast them into extra dims.
+            arr = np.empty(len(col), dtype=object)
+            arr[:] = col
+            result[name] = arr
+    return result
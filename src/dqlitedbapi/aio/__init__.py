@@ -1,6 +1,7 @@
 """Async PEP 249-style interface for dqlite."""
 
 import logging
+from collections.abc import Iterable, Sequence
 from typing import Final, Literal
 
 # Re-export the stdlib-sqlite3-parity NotSupportedError stubs from
@@ -23,6 +24,8 @@ from dqlitedbapi._constants import (
 )
 from dqlitedbapi.aio.connection import AsyncConnection
 from dqlitedbapi.aio.cursor import AsyncCursor
+from dqlitedbapi.aio.pool import AsyncPool, create_pool
+from dqlitedbapi.cursor import _DEFAULT_STATEMENT_CACHE_SIZE
 from dqlitedbapi.exceptions import (
     DatabaseError,
     DataError,
@@ -35,6 +38,9 @@ from dqlitedbapi.exceptions import (
     ProgrammingError,
     Warning,
 )
+from dqlitedbapi.instrumentation import Listener
+from dqlitedbapi.result_cache import ResultCache
+from dqlitedbapi.retry import ReadRetry
 from dqlitedbapi.types import (
     BINARY,
     DATETIME,
@@ -97,9 +103,11 @@ __all__ = [  # noqa: RUF022 - grouped by PEP 249 section, not alphabetical
     # Functions
     "connect",
     "aconnect",
+    "create_pool",
     # Classes
     "AsyncConnection",
     "AsyncCursor",
+    "AsyncPool",
     # Exceptions
     "Warning",
     "Error",
@@ -140,7 +148,7 @@ __all__ = [  # noqa: RUF022 - grouped by PEP 249 section, not alphabetical
 
 
 def connect(
-    address: str,
+    address: str | Sequence[str],
     *,
     database: str = "default",
     timeout: float = 10.0,
@@ -148,6 +156,12 @@ def connect(
     max_continuation_frames: int | None = _DEFAULT_MAX_CONTINUATION_FRAMES,
     trust_server_heartbeat: bool = False,
     close_timeout: float = 0.5,
+    statement_cache_size: int = _DEFAULT_STATEMENT_CACHE_SIZE,
+    executemany_batch_size: int | None = None,
+    result_cache: ResultCache | None = None,
+    listeners: Iterable[Listener] | None = None,
+    slow_query_threshold: float | None = None,
+    read_retry: ReadRetry | None = None,
     **unknown_kwargs: object,
 ) -> AsyncConnection:
     """Create a dqlite connection (connects lazily on first use).
@@ -157,7 +171,9 @@ def connect(
     to be sync; the actual connection is made when the first query runs.
 
     Args:
-        address: Node address in "host:port" format
+        address: Node address in "host:port" format, or several seeds
+            as a comma-separated string or a list; leader discovery
+            probes them concurrently and the first leader answer wins
         database: Database name to open
         timeout: Per-RPC-phase timeout in seconds — must be a positive
             finite number. The same budget is applied to each phase
@@ -176,6 +192,27 @@ def connect(
         close_timeout: Budget (seconds) for the transport-drain during
             ``close()``. Forwarded to the underlying AsyncConnection.
             Default 0.5 s is sized for LAN.
+        statement_cache_size: Per-connection LRU bound for cached SQL
+            classification. ``0`` disables the cache. Default 128.
+            Forwarded to the underlying AsyncConnection.
+        executemany_batch_size: Opt-in. Rows per multi-row ``VALUES``
+            statement when ``executemany`` runs a plain ``INSERT ...
+            VALUES (?, ...)``. Forwarded to the underlying
+            AsyncConnection. Default None (one statement per row).
+        result_cache: Opt-in :class:`~dqlitedbapi.result_cache.ResultCache`
+            for repeated pure reads. Forwarded to the underlying
+            AsyncConnection. Default None.
+        listeners: Callables receiving an
+            :class:`~dqlitedbapi.instrumentation.Event` per operation on
+            this connection. Forwarded to the underlying
+            AsyncConnection.
+        slow_query_threshold: Seconds; operations at least this slow
+            are logged (fingerprint, redacted parameter shape, time
+            split) on ``dqlitedbapi.instrumentation.slow_query``.
+            Forwarded to the underlying AsyncConnection. Default None.
+        read_retry: Opt-in :class:`~dqlitedbapi.retry.ReadRetry` that
+            replays pure reads failing on a leader change. Forwarded to
+            the underlying AsyncConnection. Default None.
 
     Returns:
         An AsyncConnection object
@@ -200,11 +237,17 @@ def connect(
         max_continuation_frames=max_continuation_frames,
         trust_server_heartbeat=trust_server_heartbeat,
         close_timeout=close_timeout,
+        statement_cache_size=statement_cache_size,
+        executemany_batch_size=executemany_batch_size,
+        result_cache=result_cache,
+        listeners=listeners,
+        slow_query_threshold=slow_query_threshold,
+        read_retry=read_retry,
     )
 
 
 async def aconnect(
-    address: str,
+    address: str | Sequence[str],
     *,
     database: str = "default",
     timeout: float = 10.0,
@@ -212,6 +255,12 @@ async def aconnect(
     max_continuation_frames: int | None = _DEFAULT_MAX_CONTINUATION_FRAMES,
     trust_server_heartbeat: bool = False,
     close_timeout: float = 0.5,
+    statement_cache_size: int = _DEFAULT_STATEMENT_CACHE_SIZE,
+    executemany_batch_size: int | None = None,
+    result_cache: ResultCache | None = None,
+    listeners: Iterable[Listener] | None = None,
+    slow_query_threshold: float | None = None,
+    read_retry: ReadRetry | None = None,
     **unknown_kwargs: object,
 ) -> AsyncConnection:
     """Connect to a dqlite database asynchronously.
@@ -219,7 +268,9 @@ async def aconnect(
     Unlike connect(), this awaits the TCP connection before returning.
 
     Args:
-        address: Node address in "host:port" format
+        address: Node address in "host:port" format, or several seeds
+            as a comma-separated string or a list; leader discovery
+            probes them concurrently and the first leader answer wins
         database: Database name to open
         timeout: Per-RPC-phase timeout in seconds — must be a positive
             finite number. The same budget is applied to each phase
@@ -238,6 +289,27 @@ async def aconnect(
         close_timeout: Budget (seconds) for the transport-drain during
             ``close()``. Forwarded to the underlying AsyncConnection.
             Default 0.5 s is sized for LAN.
+        statement_cache_size: Per-connection LRU bound for cached SQL
+            classification. ``0`` disables the cache. Default 128.
+            Forwarded to the underlying AsyncConnection.
+        executemany_batch_size: Opt-in. Rows per multi-row ``VALUES``
+            statement when ``executemany`` runs a plain ``INSERT ...
+            VALUES (?, ...)``. Forwarded to the underlying
+            AsyncConnection. Default None (one statement per row).
+        result_cache: Opt-in :class:`~dqlitedbapi.result_cache.ResultCache`
+            for repeated pure reads. Forwarded to the underlying
+            AsyncConnection. Default None.
+        listeners: Callables receiving an
+            :class:`~dqlitedbapi.instrumentation.Event` per operation on
+            this connection. Forwarded to the underlying
+            AsyncConnection.
+        slow_query_threshold: Seconds; operations at least this slow
+            are logged (fingerprint, redacted parameter shape, time
+            split) on ``dqlitedbapi.instrumentation.slow_query``.
+            Forwarded to the underlying AsyncConnection. Default None.
+        read_retry: Opt-in :class:`~dqlitedbapi.retry.ReadRetry` that
+            replays pure reads failing on a leader change. Forwarded to
+            the underlying AsyncConnection. Default None.
 
     Returns:
         A connected AsyncConnection object
@@ -260,6 +332,12 @@ async def aconnect(
         max_continuation_frames=max_continuation_frames,
         trust_server_heartbeat=trust_server_heartbeat,
         close_timeout=close_timeout,
+        statement_cache_size=statement_cache_size,
+        executemany_batch_size=executemany_batch_size,
+        result_cache=result_cache,
+        listeners=listeners,
+        slow_query_threshold=slow_query_threshold,
+        read_retry=read_retry,
     )
     try:
         await conn.connect()
@@ -11,23 +11,36 @@ from types import TracebackType
 from typing import Any, NoReturn, Self
 
 from dqliteclient import DqliteConnection, get_current_pid
-from dqliteclient.connection import parse_address as _client_parse_address
 from dqlitedbapi import exceptions as _exc
 from dqlitedbapi.aio.cursor import AsyncCursor
 from dqlitedbapi.connection import (
     _build_and_connect,
+    _check_result_cache,
+    _CursorRegistry,
     _is_no_transaction_error,
+    _make_statement_cache,
+    _normalize_address,
     _validate_close_timeout,
     _validate_timeout,
     _wrap_positive_int,
 )
-from dqlitedbapi.cursor import _call_client
+from dqlitedbapi.cursor import _DEFAULT_STATEMENT_CACHE_SIZE, _call_client, _clear_messages
 from dqlitedbapi.exceptions import (
     InterfaceError,
     NotSupportedError,
     OperationalError,
     ProgrammingError,
 )
+from dqlitedbapi.instrumentation import (
+    Listener,
+    _active,
+    _check_listeners,
+    _check_slow_query_threshold,
+    _Span,
+    _span,
+)
+from dqlitedbapi.result_cache import ResultCache, _settle_pending_writes
+from dqlitedbapi.retry import ReadRetry, _check_read_retry
 from dqlitewire import (
     DEFAULT_MAX_CONTINUATION_FRAMES as _DEFAULT_MAX_CONTINUATION_FRAMES,
 )
@@ -150,9 +163,14 @@ class AsyncConnection:
     ProgrammingError = _exc.ProgrammingError
     NotSupportedError = _exc.NotSupportedError
 
+    # Instrumentation state; see the sync ``Connection`` sibling.
+    _slow_query_threshold: float | None = None
+    _active_span: _Span | None = None
+    _read_retry: ReadRetry | None = None
+
     def __init__(
         self,
-        address: str,
+        address: str | Sequence[str],
         *,
         database: str = "default",
         timeout: float = 10.0,
@@ -160,11 +178,19 @@ class AsyncConnection:
         max_continuation_frames: int | None = _DEFAULT_MAX_CONTINUATION_FRAMES,
         trust_server_heartbeat: bool = False,
         close_timeout: float = 0.5,
+        statement_cache_size: int = _DEFAULT_STATEMENT_CACHE_SIZE,
+        executemany_batch_size: int | None = None,
+        result_cache: ResultCache | None = None,
+        listeners: Iterable[Listener] | None = None,
+        slow_query_threshold: float | None = None,
+        read_retry: ReadRetry | None = None,
     ) -> None:
         """Initialize connection (does not connect yet).
 
         Args:
-            address: Node address in "host:port" format
+            address: Node address in "host:port" format, or several seeds
+                as a comma-separated string or a list; leader discovery
+                probes them concurrently and the first leader answer wins
             database: Database name to open
             timeout: Per-RPC-phase timeout in seconds (positive,
                 finite). Each phase of an operation (send, read, any
@@ -182,21 +208,27 @@ class AsyncConnection:
             close_timeout: Budget (seconds) for the transport-drain
                 during ``close()``. Forwarded to the underlying
                 DqliteConnection. Default 0.5 s is sized for LAN.
+            statement_cache_size: Per-connection LRU bound for cached
+                SQL classification; ``0`` disables it. See
+                ``Connection``.
+            executemany_batch_size: Opt-in multi-row rewrite of plain
+                ``INSERT ... VALUES (?, ...)`` in ``executemany``. See
+                ``Connection``. Default None.
+            result_cache: Opt-in shared result cache for pure reads.
+                See ``Connection``. Default None.
+            listeners: Per-connection instrumentation listeners. See
+                ``Connection``.
+            slow_query_threshold: Opt-in slow-query log threshold in
+                seconds. See ``Connection``. Default None.
+            read_retry: Opt-in replay of pure reads failing on a
+                leader change. See ``Connection``. Default None.
         """
         _validate_timeout(timeout)
         _validate_close_timeout(close_timeout)
         # Eager address parse, matching the sync Connection and the
         # underlying DqliteConnection. A typoed DSN surfaces at
         # construction, not at first-use.
-        if not isinstance(address, str):
-            raise InterfaceError(
-                f"address must be a 'host:port' string, got {type(address).__name__}"
-            )
-        try:
-            _client_parse_address(address)
-        except ValueError as e:
-            raise InterfaceError(f"Invalid address: {e}") from e
-        self._address = address
+        self._address = _normalize_address(address)
         self._database = database
         self._timeout = timeout
         self._max_total_rows = _wrap_positive_int(max_total_rows, "max_total_rows")
@@ -205,6 +237,16 @@ class AsyncConnection:
         )
         self._trust_server_heartbeat = trust_server_heartbeat
         self._close_timeout = close_timeout
+        self._statement_cache = _make_statement_cache(statement_cache_size)
+        self._executemany_batch_size = _wrap_positive_int(
+            executemany_batch_size, "executemany_batch_size"
+        )
+        self._result_cache = _check_result_cache(result_cache)
+        # See the sync ``Connection`` sibling.
+        self._cache_pending_writes: list[frozenset[str] | None] = []
+        self._listeners = _check_listeners(listeners)
+        self._slow_query_threshold = _check_slow_query_threshold(slow_query_threshold)
+        self._read_retry = _check_read_retry(read_retry)
         self._async_conn: DqliteConnection | None = None
         self._closed = False
         # Tracks the asyncio.Task that currently owns the
@@ -242,7 +284,7 @@ class AsyncConnection:
         # state (stdlib sqlite3 cascades). Buffered fetches on a
         # cursor whose AsyncConnection was externally closed used to
         # silently answer from stale in-memory rows.
-        self._cursors: weakref.WeakSet[AsyncCursor] = weakref.WeakSet()
+        self._cursors: _CursorRegistry[AsyncCursor] = _CursorRegistry()
         # Mutable 1-element flag the finalizer reads. ``close()`` sets
         # it to True so the finalizer knows the user closed
         # explicitly and skips the ResourceWarning. We do NOT attempt
@@ -264,7 +306,7 @@ class AsyncConnection:
             _async_unclosed_warning,
             self._closed_flag,
             self._connected_flag,
-            address,
+            self._address,
         )
 
     def _ensure_locks(self) -> tuple[asyncio.Lock, asyncio.Lock]:
@@ -382,6 +424,7 @@ class AsyncConnection:
                 max_continuation_frames=self._max_continuation_frames,
                 trust_server_heartbeat=self._trust_server_heartbeat,
                 close_timeout=self._close_timeout,
+                listeners=_active(self),
             )
             # A concurrent close() may have flipped _closed while we were
             # suspended in _build_and_connect. close() observes
@@ -502,7 +545,7 @@ class AsyncConnection:
                     cur._rowcount = -1
                     cur._lastrowid = None
                     cur._row_index = 0
-                    del cur.messages[:]
+                    _clear_messages(cur)
                     with contextlib.suppress(TypeError):
                         cur._connection = weakref.proxy(cur._connection)
             finally:
@@ -998,7 +1041,10 @@ class AsyncConnection:
                 "transaction state is ambiguous."
             )
         _, op_lock = self._ensure_locks()
+        span = _span(self, "commit", "COMMIT")
         async with op_lock:
+            if span is not None:
+                span.locked()
             # Re-check under the lock: a concurrent close() may have
             # acquired op_lock before us, closed the connection, and
             # released. The ``_protocol is None`` check is repeated
@@ -1042,7 +1088,17 @@ class AsyncConnection:
                 await _call_client(self._async_conn.execute("COMMIT"))
             except OperationalError as e:
                 if not _is_no_transaction_error(e):
+                    if span is not None:
+                        span.finish(error=e)
                     raise
+            except BaseException as e:
+                if span is not None:
+                    span.finish(error=e)
+                raise
+            finally:
+                _settle_pending_writes(self)
+            if span is not None:
+                span.finish()
 
     async def rollback(self) -> None:
         """Roll back any pending transaction.
@@ -1078,7 +1134,10 @@ class AsyncConnection:
                 "retrying commit / rollback."
             )
         _, op_lock = self._ensure_locks()
+        span = _span(self, "rollback", "ROLLBACK")
         async with op_lock:
+            if span is not None:
+                span.locked()
             # Re-check under the lock for the same race as commit().
             if (
                 self._closed
@@ -1102,7 +1161,17 @@ class AsyncConnection:
                 await _call_client(self._async_conn.execute("ROLLBACK"))
             except OperationalError as e:
                 if not _is_no_transaction_error(e):
+                    if span is not None:
+                        span.finish(error=e)
                     raise
+            except BaseException as e:
+                if span is not None:
+                    span.finish(error=e)
+                raise
+            finally:
+                _settle_pending_writes(self)
+            if span is not None:
+                span.finish()
 
     @contextlib.asynccontextmanager
     async def transaction(self) -> "AsyncIterator[None]":
@@ -1166,6 +1235,7 @@ class AsyncConnection:
             # guard above) would otherwise have its slot wiped.
             if self._transaction_owner is token:
                 self._transaction_owner = None
+            _settle_pending_writes(self)
 
     def cursor(self, **unknown_kwargs: object) -> AsyncCursor:
         """Return a new AsyncCursor object.
@@ -1186,7 +1256,7 @@ class AsyncConnection:
         boundary. Without the same check here, a forked child calling
         ``aconn.cursor()`` from sync context (the SA-glue shape) would
         silently register a parent-pinned cursor in the child's
-        ``self._cursors`` WeakSet and return a live wrapper. Match the
+        ``self._cursors`` registry and return a live wrapper. Match the
         sync sibling (``Connection.cursor`` enforces it via
         ``_check_thread``).
         """
@@ -1226,7 +1296,7 @@ class AsyncConnection:
         # the snapshot would skip the cascade and be returned to the
         # caller as a usable wrapper attached to a connection that is
         # mid-close. Defense-in-depth: if ``_closed`` flipped to True
-        # between the AsyncCursor construction and the WeakSet add,
+        # between the AsyncCursor construction and the registry add,
         # mark the cursor closed so its first await fails cleanly via
         # ``_check_closed`` rather than running against a torn-down
         # parent. The cascade handles the typical ordering; this
@@ -7,17 +7,33 @@ from collections.abc import Iterable, Sequence
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, NoReturn, Self
 
+from dqlitedbapi._columnar import (
+    _Column,
+    _columns_to_arrow_table,
+    _columns_to_numpy,
+    _pack_columns,
+)
 from dqlitedbapi.cursor import (
-    _EXECUTEMANY_REJECT_VERBS,
+    _apply_row_factory,
+    _buffer_wire_rows,
     _call_client,
     _classify_caller_sql,
+    _clear_messages,
+    _column_values,
+    _compact_rows,
     _convert_params,
-    _convert_row,
+    _executemany_statements,
     _ExecuteManyAccumulator,
-    _is_dml_with_returning,
-    _is_insert_or_replace,
-    _is_row_returning,
-    _strip_leading_comments,
+    _lookup_statement,
+    _materialize_rows,
+    _materialized_row,
+    _Messages,
+    _note_statement,
+    _read_cache_slot,
+    _serve_cached,
+    _StatementInfo,
+    _store_cached,
+    _take_rows,
     _to_signed_int64,
 )
 from dqlitedbapi.exceptions import (
@@ -26,6 +42,9 @@ from dqlitedbapi.exceptions import (
     NotSupportedError,
     ProgrammingError,
 )
+from dqlitedbapi.instrumentation import _bound_span, _span
+from dqlitedbapi.result_cache import _CacheSlot
+from dqlitedbapi.retry import _read_retry_for, _retry_read
 from dqlitedbapi.types import _Description
 
 if TYPE_CHECKING:
@@ -40,7 +59,7 @@ class AsyncCursor:
 
     # Mirrors ``Cursor.__slots__`` in the sync tree: stable attribute
     # set, allocated one per ``AsyncConnection.cursor()`` call.
-    # ``__weakref__`` lets ``AsyncConnection._cursors`` (a WeakSet)
+    # ``__weakref__`` lets ``AsyncConnection._cursors`` (weak refs)
     # hold a reference for the close-cascade.
     __slots__ = (
         "__weakref__",
@@ -48,14 +67,17 @@ class AsyncCursor:
         "_closed",
         "_completed_iterations",
         "_connection",
+        "_converted",
         "_description",
         "_executing_task",
         "_lastrowid",
+        "_messages",
+        "_raw_row_types",
         "_row_factory",
         "_row_index",
+        "_row_offset",
         "_rowcount",
         "_rows",
-        "messages",
     )
 
     def __init__(self, connection: "AsyncConnection") -> None:
@@ -63,8 +85,13 @@ class AsyncCursor:
         self._description: _Description = None
         self._rowcount = -1
         self._arraysize = 1
-        self._rows: list[tuple[Any, ...]] = []
+        self._rows: list[Any] = []
+        # Lazy conversion state; see ``_materialize_rows``.
+        self._raw_row_types: list[list[int]] | None = None
+        self._converted = 0
         self._row_index = 0
+        # Rows released by ``_compact_rows``; see the sync sibling.
+        self._row_offset = 0
         self._closed = False
         self._lastrowid: int | None = None
         # Per-cursor task token used to reject concurrent execute()
@@ -84,8 +111,8 @@ class AsyncCursor:
             if type(connection).__name__ == "AsyncConnection"
             else None
         )
-        # PEP 249 optional extension; see Cursor.messages.
-        self.messages: list[tuple[type[Exception], Exception | str]] = []
+        # Lazily allocated; see ``Cursor.messages``.
+        self._messages: _Messages | None = None
 
     @property
     def connection(self) -> "AsyncConnection":
@@ -167,6 +194,18 @@ class AsyncCursor:
         """
         return self._lastrowid
 
+    @property
+    def messages(self) -> _Messages:
+        """PEP 249 optional extension; see ``Cursor.messages``."""
+        msgs = self._messages
+        if msgs is None:
+            msgs = self._messages = []
+        return msgs
+
+    @messages.setter
+    def messages(self, value: _Messages) -> None:
+        self._messages = value
+
     @property
     def rownumber(self) -> int | None:
         """0-based index of the next row in the current result set.
@@ -178,7 +217,7 @@ class AsyncCursor:
         """
         if self._description is None:
             return None
-        return self._row_index
+        return self._row_offset + self._row_index
 
     @property
     def arraysize(self) -> int:
@@ -243,11 +282,17 @@ class AsyncCursor:
         """
         self._description = None
         self._rows = []
+        self._raw_row_types = None
+        self._row_offset = 0
         self._row_index = 0
         self._rowcount = -1
 
     async def _execute_unlocked(
-        self, operation: str, parameters: Sequence[Any] | None = None
+        self,
+        operation: str,
+        parameters: Sequence[Any] | None = None,
+        cache_slot: _CacheSlot | None = None,
+        info: _StatementInfo | None = None,
     ) -> None:
         """Body of a single ``execute`` call — caller already holds ``op_lock``.
 
@@ -262,19 +307,36 @@ class AsyncCursor:
         - holding ``op_lock``,
         - pre- and post-check ``_check_closed()``,
         - resetting execute state when this is the first iteration.
+
+        ``cache_slot`` / result-cache invalidation / ``info``: see the
+        sync ``Cursor._execute_async``.
         """
-        is_query = _is_row_returning(operation)
+        if info is None:
+            info = _lookup_statement(self._connection, operation)
+        is_query = info.row_returning
         params = _convert_params(parameters)
         self._check_closed()
+        # Slow-query phase split; see ``instrumentation._Span``.
+        span = _bound_span(self._connection)
+        connect_span = span if self._connection._async_conn is None else None
+        if connect_span is not None:
+            connect_span.phase_begin()
         conn = await self._connection._ensure_connection()
+        if connect_span is not None:
+            connect_span.phase_end("connect")
         # ``_ensure_connection`` awaits, so close() can still race
         # against this window. Re-check once more before touching
         # the wire.
         self._check_closed()
         if is_query:
+            if span is not None:
+                span.phase_begin()
             columns, column_types, row_types, rows = await _call_client(
                 conn.query_raw_typed(operation, params)
             )
+            if span is not None:
+                span.phase_end("wire")
+            _note_statement(self._connection, info)
             if not columns:
                 # PRAGMA write-form dispatches through the row-
                 # returning branch but produces no columns; match
@@ -284,6 +346,8 @@ class AsyncCursor:
                 # rationale.
                 self._description = None
                 self._rows = []
+                self._raw_row_types = None
+                self._row_offset = 0
                 self._row_index = 0
                 self._rowcount = -1
                 return
@@ -319,35 +383,51 @@ class AsyncCursor:
                     (name, type_codes[i], None, None, None, None, None)
                     for i, name in enumerate(columns)
                 )
-            # Per-row dispatch; see the sync ``_execute_async``
-            # companion for the rationale.
-            self._rows = [
-                _convert_row(row, row_types[i] if i < len(row_types) else column_types)
-                for i, row in enumerate(rows)
-            ]
+            if cache_slot is not None:
+                _store_cached(cache_slot, self._description, rows, row_types, column_types)
+            # Per-row types, converted lazily at fetch time; see the
+            # sync ``_execute_async`` companion for the rationale.
+            _buffer_wire_rows(self, rows, row_types, column_types)
             self._row_index = 0
             self._rowcount = len(rows)
         else:
+            if span is not None:
+                span.phase_begin()
             last_id, affected = await _call_client(conn.execute(operation, params))
+            if span is not None:
+                span.phase_end("wire")
+            _note_statement(self._connection, info)
             # stdlib-parity: lastrowid only updates on INSERT / REPLACE.
             # See ``_is_insert_or_replace`` in the sync cursor for
             # rationale — sync and async share the same contract.
-            if _is_insert_or_replace(operation):
+            if info.insert_or_replace:
                 self._lastrowid = _to_signed_int64(last_id)
             self._rowcount = _to_signed_int64(affected)
             self._description = None
             self._rows = []
+            self._raw_row_types = None
+            self._row_offset = 0
             # Parity with the SELECT branch and with executemany:
             # every execute must leave the cursor at row 0 of its
             # (possibly empty) result set so a subsequent SELECT
             # iterator starts from a clean state.
             self._row_index = 0
 
-    async def execute(self, operation: str, parameters: Sequence[Any] | None = None, /) -> Self:
+    async def execute(
+        self,
+        operation: str,
+        parameters: Sequence[Any] | None = None,
+        /,
+        *,
+        use_cache: bool = True,
+    ) -> Self:
         """Execute a database operation (query or command).
 
         Returns ``self`` so callers can chain ``.fetchall()`` etc.
 
+        ``use_cache``: see ``Cursor.execute``. A result-cache hit does
+        not take the connection's ``op_lock``.
+
         Concurrency: a single ``AsyncCursor`` is a single-task
         primitive. Two tasks issuing ``await cur.execute(...)``
         concurrently on the same cursor would otherwise silently
@@ -359,7 +439,7 @@ class AsyncCursor:
         """
         # PEP 249 §6.1.2: ``messages`` is cleared by every standard
         # cursor method before the call runs.
-        del self.messages[:]
+        _clear_messages(self)
         # Fast-path guard outside the lock so we fail quickly on an
         # already-closed cursor without taking the lock.
         self._check_closed()
@@ -389,13 +469,41 @@ class AsyncCursor:
             # Pre-flight classification of caller-supplied SQL — empty /
             # multi-statement / wrong ``?``-count. Mirrors the sync
             # sibling at cursor.py. See ``_classify_caller_sql`` docstring.
-            _classify_caller_sql(operation, parameters)
+            info = _lookup_statement(self._connection, operation)
+            _classify_caller_sql(operation, parameters, info)
 
             _, op_lock = self._connection._ensure_locks()
-            async with op_lock:
-                del self.messages[:]
-                self._check_closed()
-                await self._execute_unlocked(operation, parameters)
+            span = _span(self._connection, "execute", operation, parameters)
+            try:
+                slot = (
+                    _read_cache_slot(self._connection, operation, parameters, info)
+                    if use_cache
+                    else None
+                )
+                if slot is not None and _serve_cached(self, slot):
+                    if span is not None:
+                        span.finish(self, cached=True)
+                    return self
+                async with op_lock:
+                    if span is not None:
+                        span.locked()
+                    _clear_messages(self)
+                    self._check_closed()
+                    policy = _read_retry_for(self._connection, info)
+                    if policy is None:
+                        await self._execute_unlocked(operation, parameters, slot)
+                    else:
+                        await _retry_read(
+                            self._connection,
+                            policy,
+                            lambda: self._execute_unlocked(operation, parameters, slot),
+                        )
+            except BaseException as e:
+                if span is not None:
+                    span.finish(self, error=e)
+                raise
+            if span is not None:
+                span.finish(self)
         finally:
             # Clear the slot only if WE put it there — same-task
             # nesting (someone calling cur.execute() inside a row
@@ -435,7 +543,7 @@ class AsyncCursor:
         ``COMMIT``. See the ``Connection`` class docstring for the
         autocommit-by-default rationale.
         """
-        del self.messages[:]
+        _clear_messages(self)
         self._check_closed()
         # Reject concurrent execute/executemany on the same cursor
         # — see ``execute`` for full rationale.
@@ -447,46 +555,10 @@ class AsyncCursor:
             )
         self._executing_task = cur_task
         # Reject transaction-control verbs and pure queries up front
-        # (mirror of the sync sibling).
-        # See sync sibling for the leading ``;``-stripping loop and the
-        # trailing ``rstrip(";")`` rationale.
-        # Loop comment-strip + ;-strip together so a leading ``;``
-        # followed by a comment does not bypass the reject-list. See
-        # the sync sibling for full rationale.
-        head_normalised = operation
-        while True:
-            stripped = _strip_leading_comments(head_normalised).lstrip()
-            if stripped.startswith(";"):
-                head_normalised = stripped[1:]
-                continue
-            if stripped == head_normalised:
-                break
-            head_normalised = stripped
-        head_normalised = head_normalised.upper()
-        first_verb = head_normalised.split(maxsplit=1)[0].rstrip(";") if head_normalised else ""
-        if first_verb in _EXECUTEMANY_REJECT_VERBS:
-            raise ProgrammingError(
-                f"executemany() not supported for {first_verb}; "
-                "use execute() instead — transaction-control statements "
-                "take no parameters and cannot be batched."
-            )
-        if _is_row_returning(operation) and not _is_dml_with_returning(operation):
-            head_upper = operation.lstrip().upper()
-            if head_upper.startswith("PRAGMA"):
-                # See sync sibling: PRAGMA has per-call semantics and
-                # is never meaningfully batchable; surface the
-                # PRAGMA-specific guidance so the caller does not
-                # wonder whether a different PRAGMA would be
-                # acceptable.
-                raise ProgrammingError(
-                    "executemany() does not accept PRAGMA; PRAGMAs have "
-                    "per-call semantics and are not batchable. Use "
-                    "execute() for each PRAGMA."
-                )
-            raise ProgrammingError(
-                "executemany() can only execute DML statements; "
-                "use execute() for SELECT / VALUES / PRAGMA / EXPLAIN / WITH."
-            )
+        # (mirror of the sync sibling; see ``_executemany_rejection``).
+        rejection = _lookup_statement(self._connection, operation).executemany_rejection
+        if rejection is not None:
+            raise ProgrammingError(rejection)
 
         # Single source of truth for per-execute reset; see
         # ``_reset_execute_state``. Also zeroes ``_rowcount`` to -1 so
@@ -506,16 +578,21 @@ class AsyncCursor:
         # batch. The sync path is already atomic because ``_run_sync``
         # holds ``_op_lock`` for the outer coroutine; this restores
         # parity.
+        span = _span(self._connection, "executemany", operation, seq_of_parameters)
         try:
             _, op_lock = self._connection._ensure_locks()
             async with op_lock:
+                if span is not None:
+                    span.locked()
                 # PEP 249 §6.1.1 — clear messages under the lock; see
                 # ``execute`` and ``commit`` for the under-lock-clear
                 # rationale.
-                del self.messages[:]
+                _clear_messages(self)
                 self._check_closed()
                 try:
-                    for params in seq_of_parameters:
+                    for sql, params, iterations, info in _executemany_statements(
+                        self._connection, operation, seq_of_parameters
+                    ):
                         # Re-check before each iteration so a concurrent
                         # ``cursor.close()`` landing between iterations
                         # surfaces as "Cursor is closed" rather than being
@@ -523,10 +600,10 @@ class AsyncCursor:
                         # entry (or not at all for a single-iteration
                         # remainder).
                         self._check_closed()
-                        await self._execute_unlocked(operation, params)
+                        await self._execute_unlocked(sql, params, info=info)
                         self._check_closed()
                         acc.push(self)
-                        self._completed_iterations += 1
+                        self._completed_iterations += iterations
                 except BaseException:
                     # Mid-batch failure leaves _rowcount at the last
                     # iteration's value (misleading), so reset to
@@ -548,17 +625,25 @@ class AsyncCursor:
                     # path.
                     self._rowcount = -1
                     self._rows = []
+                    self._raw_row_types = None
+                    self._row_offset = 0
                     self._description = None
                     self._row_index = 0
-                    del self.messages[:]
+                    _clear_messages(self)
                     raise
                 # Final guard before apply; pairs with the ``_closed``
                 # check inside ``_ExecuteManyAccumulator.apply``.
                 self._check_closed()
                 acc.apply(self)
+        except BaseException as e:
+            if span is not None:
+                span.finish(self, error=e)
+            raise
         finally:
             if self._executing_task is cur_task:
                 self._executing_task = None
+        if span is not None:
+            span.finish(self)
         return self
 
     def _check_result_set(self) -> None:
@@ -574,7 +659,7 @@ class AsyncCursor:
         ``fetchmany`` / ``fetchall`` continue to use
         ``_check_result_set`` and raise.
         """
-        del self.messages[:]
+        _clear_messages(self)
         self._check_closed()
         # Surface a loop-binding mismatch up front so a caller awaiting
         # a fetch from a different loop than the one the connection
@@ -595,7 +680,7 @@ class AsyncCursor:
         if self._row_index >= len(self._rows):
             return None
 
-        row = self._rows[self._row_index]
+        row = _materialized_row(self, self._row_index)
         # Apply row_factory BEFORE advancing ``_row_index`` so a raise
         # inside a custom factory leaves the index unchanged. Without
         # this ordering, ``fetchmany``'s snapshot/restore at
@@ -605,8 +690,10 @@ class AsyncCursor:
         if self._row_factory is not None:
             transformed: tuple[Any, ...] = self._row_factory(self, row)
             self._row_index += 1
+            _compact_rows(self)
             return transformed
         self._row_index += 1
+        _compact_rows(self)
         return row
 
     async def fetchmany(self, size: int | None = None) -> list[tuple[Any, ...]]:
@@ -623,7 +710,7 @@ class AsyncCursor:
         omit ``size`` to default to ``self.arraysize``. See sync
         sibling for the rationale.
         """
-        del self.messages[:]
+        _clear_messages(self)
         self._check_closed()
         # Loop-binding check; see ``fetchone`` rationale.
         self._connection._check_loop_binding()
@@ -646,26 +733,9 @@ class AsyncCursor:
             # the sync sibling.
             return await self.fetchall()
 
-        # Snapshot ``_row_index`` BEFORE the per-iteration ``fetchone()``
-        # loop. On cancel/exception mid-loop, restore to (snapshot +
-        # delivered count) so rows that were "consumed" (advanced
-        # ``_row_index``) but never made it into the caller's
-        # ``result`` are not silently lost. Without the restore, a
-        # subsequent ``fetchmany()`` would skip those rows.
-        snapshot = self._row_index
-        result: list[tuple[Any, ...]] = []
-        try:
-            for _ in range(size):
-                row = await self.fetchone()
-                if row is None:
-                    break
-                result.append(row)
-        except BaseException:
-            # Restore _row_index so a retry sees the un-delivered rows.
-            self._row_index = snapshot + len(result)
-            raise
-
-        return result
+        # One slice + one factory pass; see the sync sibling and
+        # ``_take_rows`` for the index-restore contract.
+        return _take_rows(self, size)
 
     async def fetchall(self) -> list[tuple[Any, ...]]:
         """Fetch all remaining rows of a query result.
@@ -674,7 +744,7 @@ class AsyncCursor:
         when no result set is active (DML-only / never-executed).
         Stdlib parity with ``sqlite3.Cursor.fetchall``.
         """
-        del self.messages[:]
+        _clear_messages(self)
         self._check_closed()
         # Loop-binding check; see ``fetchone`` rationale.
         self._connection._check_loop_binding()
@@ -682,6 +752,8 @@ class AsyncCursor:
             # No result set active. Match stdlib by returning ``[]``.
             return []
 
+        _materialize_rows(self, len(self._rows))
+
         result = self._rows[self._row_index :]
         if self._row_factory is not None:
             # Apply factory BEFORE advancing ``_row_index``. Symmetric
@@ -689,12 +761,64 @@ class AsyncCursor:
             # discipline — a raise inside a custom factory leaves the
             # cursor index unchanged so the next fetchone returns the
             # same row.
-            transformed = [self._row_factory(self, row) for row in result]
+            transformed = _apply_row_factory(self, self._row_factory, result)
             self._row_index = len(self._rows)
+            _compact_rows(self)
             return transformed
         self._row_index = len(self._rows)
+        _compact_rows(self)
         return result
 
+    async def fetch_columns(self) -> dict[str, _Column]:
+        """Fetch all remaining rows column-wise.
+
+        Async sibling of :meth:`dqlitedbapi.Cursor.fetch_columns`:
+        INTEGER / FLOAT columns with no NULLs come back as
+        ``array.array``, everything else as ``list``. Consumes the rows
+        like :meth:`fetchall`; ``row_factory`` is not applied.
+        """
+        _clear_messages(self)
+        self._check_closed()
+        self._connection._check_loop_binding()
+        if self._description is None:
+            return {}
+        columns = _pack_columns(self._description, _column_values(self))
+        self._row_index = len(self._rows)
+        _compact_rows(self)
+        return columns
+
+    async def fetch_numpy(self) -> dict[str, Any]:
+        """Fetch all remaining rows as ``{column name: numpy.ndarray}``.
+
+        Async sibling of :meth:`dqlitedbapi.Cursor.fetch_numpy`;
+        requires NumPy.
+        """
+        _clear_messages(self)
+        self._check_closed()
+        self._connection._check_loop_binding()
+        if self._description is None:
+            return {}
+        result = _columns_to_numpy(self._description, _column_values(self))
+        self._row_index = len(self._rows)
+        _compact_rows(self)
+        return result
+
+    async def fetch_arrow_table(self) -> Any:
+        """Fetch all remaining rows as a ``pyarrow.Table``.
+
+        Async sibling of :meth:`dqlitedbapi.Cursor.fetch_arrow_table`;
+        requires pyarrow.
+        """
+        _clear_messages(self)
+        self._check_closed()
+        self._connection._check_loop_binding()
+        if self._description is None:
+            return None
+        table = _columns_to_arrow_table(self._description, _column_values(self))
+        self._row_index = len(self._rows)
+        _compact_rows(self)
+        return table
+
     def drain_rows(self) -> list[tuple[Any, ...]]:
         """Transfer ownership of the row buffer to the caller.
 
@@ -727,8 +851,11 @@ class AsyncCursor:
         ``sqlalchemy-dqlite/aio.py`` calls drain_rows last (after
         capturing the metadata fields) for that reason.
         """
+        _materialize_rows(self, len(self._rows))
         rows = self._rows
         self._rows = []
+        self._raw_row_types = None
+        self._row_offset = 0
         # Position the index at the (now empty) end so any
         # subsequent fetch* call returns the no-rows result instead
         # of indexing into the empty buffer with a stale index.
@@ -741,11 +868,13 @@ class AsyncCursor:
         Idempotent: a second call is a no-op.
         """
         # PEP 249 §6.1.2 messages-clear contract; see Cursor.close.
-        del self.messages[:]
+        _clear_messages(self)
         if self._closed:
             return
         self._closed = True
         self._rows = []
+        self._raw_row_types = None
+        self._row_offset = 0
         self._description = None
         # Scrub the remaining state fields so every post-close reader
         # sees a consistent "no operation performed" surface. Symmetric
@@ -759,8 +888,8 @@ class AsyncCursor:
         # does not pin the connection's loop-bound ``asyncio.Lock``,
         # ``weakref.finalize`` registration, or any other
         # connection-lifecycle state past the user's intended
-        # lifetime. The connection's ``_cursors`` is already a
-        # ``WeakSet``; this fixes the reverse direction. See
+        # lifetime. The connection's ``_cursors`` only holds weak
+        # references; this fixes the reverse direction. See
         # ``Cursor.close`` for full rationale.
         with contextlib.suppress(
             TypeError
@@ -778,7 +907,7 @@ class AsyncCursor:
         """
         # PEP 249 §6.1.1 — clear "prior to executing the call" so the
         # contract holds even on the cross-loop rejection path.
-        del self.messages[:]
+        _clear_messages(self)
         # Validate input shape symmetric with the sync sibling so a
         # caller-side bug (e.g. passing a string) surfaces at the call
         # site rather than being silently absorbed. PEP 249 §7 keeps
@@ -818,7 +947,7 @@ class AsyncCursor:
 
     def setoutputsize(self, size: int, column: int | None = None) -> None:
         """Set output size (no-op for dqlite). See ``setinputsizes``."""
-        del self.messages[:]
+        _clear_messages(self)
         # Validate input shape symmetric with sync sibling.
         if not isinstance(size, int) or isinstance(size, bool):
             raise ProgrammingError(f"setoutputsize expects an int, got {type(size).__name__}")
@@ -845,7 +974,7 @@ class AsyncCursor:
         # that clear ``Connection.messages`` / ``Cursor.messages``.
         # Clear before any guard so the contract holds even on the
         # closed-cursor / cross-loop / not-supported paths.
-        del self.messages[:]
+        _clear_messages(self)
         # PEP 249 §6.1.2 — closed-cursor ops raise.
         self._check_closed()
         # Loop-binding check: parallel to the sync side's
@@ -860,7 +989,7 @@ class AsyncCursor:
     def nextset(self) -> NoReturn:
         """PEP 249 optional extension — not supported."""
         # PEP 249 §6.1.1 — clear before any guard.
-        del self.messages[:]
+        _clear_messages(self)
         # PEP 249 §6.1.2 — closed-cursor ops raise.
         self._check_closed()
         # Loop-binding check; see ``callproc`` for rationale. Use
@@ -879,7 +1008,7 @@ class AsyncCursor:
         # the not-supported path so a future code path that populates
         # ``messages`` cannot leave stale entries visible after the
         # caller observed the rejection. Clear before any guard.
-        del self.messages[:]
+        _clear_messages(self)
         # PEP 249 §6.1.2 — closed-cursor ops raise.
         self._check_closed()
         # Loop-binding check; see ``callproc`` for rationale. Use
@@ -906,7 +1035,7 @@ class AsyncCursor:
         GC-time coroutine-was-never-awaited warning — defeating the
         diagnostic-leak prevention this stub family was added for.
         """
-        del self.messages[:]
+        _clear_messages(self)
         self._check_closed()
         self._connection._check_loop_binding()
         raise NotSupportedError(
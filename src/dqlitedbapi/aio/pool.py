@@ -0,0 +1,524 @@
+"""Native asyncio pool of :class:`~dqlitedbapi.aio.AsyncConnection`.
+
+Async sibling of :class:`dqlitedbapi.pool.ConnectionPool`. Without it
+an asyncio service either ``aconnect``-s per request — paying leader
+discovery plus the handshake on every burst — or hand-rolls an
+``asyncio.Queue`` of connections with none of the reset / health
+discipline below.
+
+Like every ``AsyncConnection`` it hands out, the pool is bound to the
+event loop it is first used on; its asyncio primitives are created
+lazily on that loop (the ``AsyncConnection._ensure_locks`` pattern)
+and a call from any other loop raises ``ProgrammingError``.
+"""
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import time
+import weakref
+from collections.abc import AsyncIterator, Sequence
+from types import TracebackType
+from typing import Any, NoReturn, Self
+
+from dqliteclient import get_current_pid
+from dqlitedbapi import leader_watch as _leader_watch
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.connection import _normalize_address, _validate_timeout
+from dqlitedbapi.exceptions import Error, InterfaceError, OperationalError, ProgrammingError
+
+__all__ = ["AsyncPool", "create_pool"]
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledConnection:
+    """Pool bookkeeping for one ``AsyncConnection``."""
+
+    __slots__ = ("conn", "created_at", "last_used")
+
+    def __init__(self, conn: AsyncConnection) -> None:
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+def _validate_optional_seconds(value: float | None, name: str) -> None:
+    """``None`` disables; anything else must be a positive finite number."""
+    if value is None:
+        return
+    try:
+        _validate_timeout(value)
+    except ProgrammingError as e:
+        raise ProgrammingError(f"{name} must be a positive finite number or None") from e
+
+
+class AsyncPool:
+    """Pool of :class:`AsyncConnection` objects bound to one event loop.
+
+    Build with :func:`create_pool` and check connections out with
+    ``async with pool.acquire() as conn``. On release the pool rolls
+    back a transaction the borrower left open (it never commits on
+    the caller's behalf); a connection whose reset fails or is
+    cancelled is discarded rather than handed to the next borrower.
+
+    A background task runs every ``health_check_interval`` seconds:
+    it closes idle connections past ``max_idle`` (never dropping below
+    ``min_size``) or ``max_lifetime``, pings the rest with ``SELECT 1``
+    to weed out sockets a leader flip or a node restart killed, and
+    re-opens connections back up to ``min_size``.
+
+    With :mod:`dqlitedbapi.leader_watch` enabled, a leader change
+    closes idle connections bound to the deposed node (refilling to
+    ``min_size`` against the new leader), and checked-out ones are
+    discarded on release.
+    """
+
+    def __init__(
+        self,
+        address: str | Sequence[str],
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 30.0,
+        max_idle: float | None = 600.0,
+        max_lifetime: float | None = 3600.0,
+        health_check_interval: float | None = 30.0,
+        **connect_kwargs: Any,
+    ) -> None:
+        """Validate configuration; no I/O happens until :meth:`start`.
+
+        Args:
+            address: Node address in "host:port" format, or a list /
+                comma-separated string of seeds, forwarded to
+                every :class:`AsyncConnection`.
+            min_size: Connections opened concurrently by :meth:`start`
+                and maintained by the health check.
+            max_size: Upper bound on open connections.
+            acquire_timeout: Seconds :meth:`acquire` waits for a free
+                slot before raising ``OperationalError``.
+            max_idle: Seconds an idle connection may sit unused before
+                it is closed. ``None`` disables idle eviction.
+            max_lifetime: Seconds after which a connection is recycled
+                on its next checkout, release, or health check.
+                ``None`` disables.
+            health_check_interval: Seconds between background health
+                passes. ``None`` disables the background task.
+            **connect_kwargs: Forwarded to :class:`AsyncConnection`
+                (``database``, ``timeout``, ...).
+        """
+        if isinstance(max_size, bool) or not isinstance(max_size, int) or max_size < 1:
+            raise ProgrammingError(f"max_size must be a positive int, got {max_size!r}")
+        if isinstance(min_size, bool) or not isinstance(min_size, int) or min_size < 0:
+            raise ProgrammingError(f"min_size must be a non-negative int, got {min_size!r}")
+        if min_size > max_size:
+            raise ProgrammingError(f"min_size ({min_size}) must not exceed max_size ({max_size})")
+        _validate_optional_seconds(acquire_timeout, "acquire_timeout")
+        _validate_optional_seconds(max_idle, "max_idle")
+        _validate_optional_seconds(max_lifetime, "max_lifetime")
+        _validate_optional_seconds(health_check_interval, "health_check_interval")
+        # Surface a typoed AsyncConnection kwarg here, not on the first
+        # burst.
+        try:
+            inspect.signature(AsyncConnection).bind(address, **connect_kwargs)
+        except TypeError as e:
+            raise ProgrammingError(f"invalid AsyncConnection argument: {e}") from e
+        self._address = _normalize_address(address)
+        self._connect_kwargs = connect_kwargs
+        self._min_size = min_size
+        self._max_size = max_size
+        self._acquire_timeout = acquire_timeout
+        self._max_idle = max_idle
+        self._max_lifetime = max_lifetime
+        self._health_check_interval = health_check_interval
+        self._creator_pid = get_current_pid()
+        self._closed = False
+        # LIFO: the most recently released connection is reused first
+        # so the coldest age out under ``max_idle``.
+        self._idle: list[_PooledConnection] = []
+        self._checked_out: dict[int, _PooledConnection] = {}
+        # Open connections plus in-flight opens (reserved slots).
+        self._size = 0
+        self._loop_ref: weakref.ref[asyncio.AbstractEventLoop] | None = None
+        self._available: asyncio.Condition | None = None
+        self._health_task: asyncio.Task[None] | None = None
+        # Leader-watch recycles in flight (strong refs for the loop).
+        self._recycle_tasks: set[asyncio.Task[None]] = set()
+        # Background closes started by ``_discard_soon``.
+        self._discard_tasks: set[asyncio.Task[None]] = set()
+        _leader_watch._register_pool(self)
+
+    def _ensure_loop(self) -> asyncio.Condition:
+        """Bind to the running loop on first use; reject any other."""
+        if get_current_pid() != self._creator_pid:
+            raise InterfaceError(
+                "Pool used after fork; reconstruct from configuration in the target process."
+            )
+        loop = asyncio.get_running_loop()
+        if self._available is None:
+            self._loop_ref = weakref.ref(loop)
+            self._available = asyncio.Condition()
+        else:
+            bound = self._loop_ref() if self._loop_ref is not None else None
+            if bound is not loop:
+                raise ProgrammingError(
+                    f"AsyncPool used from a different event loop "
+                    f"(bound id=0x{id(bound):x}, current id=0x{id(loop):x}); "
+                    "pools are loop-bound like the connections they hold."
+                )
+        return self._available
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (idle and checked out)."""
+        return self._size
+
+    async def start(self) -> None:
+        """Open ``min_size`` connections concurrently and start the
+        background health check. Called by :func:`create_pool`."""
+        self._ensure_loop()
+        if self._closed:
+            raise InterfaceError(f"Pool is closed (id={id(self)})")
+        missing = self._min_size - self._size
+        if missing > 0:
+            self._size += missing
+            results = await asyncio.gather(
+                *(self._open() for _ in range(missing)), return_exceptions=True
+            )
+            opened = [r for r in results if isinstance(r, _PooledConnection)]
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                # All-or-nothing warmup: a half-filled pool that reports
+                # success would hide an unreachable cluster until load.
+                self._size -= len(opened)
+                await asyncio.gather(*(self._discard(r) for r in opened))
+                raise errors[0]
+            self._idle.extend(opened)
+        if self._health_check_interval is not None and self._health_task is None:
+            self._health_task = asyncio.create_task(
+                self._health_loop(self._health_check_interval),
+                name=f"dqlitedbapi-pool-health-{id(self):x}",
+            )
+
+    async def _open(self) -> _PooledConnection:
+        """Open a connection for an already-reserved slot; release the
+        slot on failure."""
+        try:
+            conn = AsyncConnection(self._address, **self._connect_kwargs)
+            try:
+                await conn.connect()
+            except BaseException:
+                with contextlib.suppress(Exception):
+                    await conn.close()
+                raise
+        except BaseException:
+            self._size -= 1
+            await self._notify()
+            raise
+        return _PooledConnection(conn)
+
+    async def _notify(self, n: int = 1) -> None:
+        available = self._available
+        if available is None:
+            return
+        async with available:
+            available.notify(n)
+
+    async def _discard(self, rec: _PooledConnection) -> None:
+        """Close a connection the pool no longer tracks (slot already freed)."""
+        try:
+            await rec.conn.close()
+        except Exception:
+            # Never let a teardown error mask the borrower's own
+            # exception propagating out of ``acquire()``.
+            logger.debug("AsyncPool: error closing %r", rec.conn, exc_info=True)
+            rec.conn.force_close_transport()
+        except BaseException:
+            rec.conn.force_close_transport()
+            raise
+
+    def _discard_soon(self, rec: _PooledConnection) -> None:
+        """``_discard`` in a task the pool tracks (``close()`` waits for
+        it), for callers that must not await: a cancel landing on the
+        await would leak the connection."""
+        task = asyncio.get_running_loop().create_task(self._discard(rec))
+        self._discard_tasks.add(task)
+        task.add_done_callback(self._discard_tasks.discard)
+
+    def _expired(self, rec: _PooledConnection, now: float) -> bool:
+        return self._max_lifetime is not None and now - rec.created_at >= self._max_lifetime
+
+    async def _ping(self, rec: _PooledConnection) -> bool:
+        try:
+            cur = rec.conn.cursor()
+            try:
+                await cur.execute("SELECT 1")
+            finally:
+                await cur.close()
+        except Error:
+            logger.debug("AsyncPool: health ping failed for %r", rec.conn, exc_info=True)
+            return False
+        return True
+
+    async def _checkout(self) -> AsyncConnection:
+        available = self._ensure_loop()
+        if self._closed:
+            raise InterfaceError(f"Pool is closed (id={id(self)})")
+        rec: _PooledConnection | None = None
+        victims: list[_PooledConnection] = []
+        try:
+            async with asyncio.timeout(self._acquire_timeout), available:
+                while True:
+                    if self._closed:
+                        raise InterfaceError(f"Pool is closed (id={id(self)})")
+                    if self._idle:
+                        rec = self._idle.pop()
+                        if (
+                            not rec.conn.closed
+                            and not self._expired(rec, time.monotonic())
+                            and not _leader_watch._demoted(self._address, rec.conn)
+                        ):
+                            break
+                        self._size -= 1
+                        victims.append(rec)
+                        rec = None
+                        continue
+                    if self._size < self._max_size:
+                        self._size += 1  # reserve; opened below
+                        break
+                    await available.wait()
+        except TimeoutError:
+            raise OperationalError(
+                f"timed out after {self._acquire_timeout}s waiting for a pooled "
+                f"connection (max_size={self._max_size})"
+            ) from None
+        finally:
+            # Not awaited: a cancel here would strand the slot reserved
+            # (or the connection popped) above.
+            for victim in victims:
+                self._discard_soon(victim)
+        if rec is None:
+            rec = await self._open()
+        self._checked_out[id(rec.conn)] = rec
+        return rec.conn
+
+    async def _checkin(self, conn: AsyncConnection) -> None:
+        rec = self._checked_out.pop(id(conn), None)
+        if rec is None or rec.conn is not conn:
+            raise ProgrammingError("connection was not checked out from this pool")
+        keep = (
+            not self._closed
+            and not conn.closed
+            and not self._expired(rec, time.monotonic())
+            and not _leader_watch._demoted(self._address, conn)
+        )
+        try:
+            # Never hand the next borrower someone else's open
+            # transaction. ``in_transaction`` is local state; the
+            # ROLLBACK is a round-trip only when one is open.
+            if keep and conn.in_transaction:
+                await conn.rollback()
+        except Error:
+            logger.debug("AsyncPool: reset failed for %r", conn, exc_info=True)
+            keep = False
+        except BaseException:
+            # Cancelled mid-reset: the wire state is unknown, so the
+            # connection cannot be reused. Tear it down synchronously
+            # (no awaits left in a cancelled task) and free the slot.
+            self._size -= 1
+            conn.force_close_transport()
+            raise
+        if keep and not self._closed:
+            rec.last_used = time.monotonic()
+            self._idle.append(rec)
+            await self._notify()
+            return
+        self._size -= 1
+        await self._notify()
+        await self._discard(rec)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncConnection]:
+        """Check a connection out for the duration of the ``async with``
+        block.
+
+        The block may ``commit()`` or use ``conn.transaction()``;
+        anything left uncommitted is rolled back on release.
+        """
+        conn = await self._checkout()
+        try:
+            yield conn
+        finally:
+            await self._checkin(conn)
+
+    def _recycle_demoted(self, leader: str) -> None:
+        """Close idle connections bound to a node other than ``leader``.
+
+        Called by the leader watcher from a worker thread: hands the
+        work to the pool's loop.
+        """
+        loop = self._loop_ref() if self._loop_ref is not None else None
+        if loop is None or self._closed or get_current_pid() != self._creator_pid:
+            return
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(self._start_recycle, leader)
+
+    def _start_recycle(self, leader: str) -> None:
+        task = asyncio.get_running_loop().create_task(self._drop_demoted(leader))
+        self._recycle_tasks.add(task)
+        task.add_done_callback(self._recycle_tasks.discard)
+
+    async def _drop_demoted(self, leader: str) -> None:
+        victims = []
+        keep = []
+        for rec in self._idle:
+            client = rec.conn._async_conn
+            if client is not None and client._address != leader:
+                victims.append(rec)
+            else:
+                keep.append(rec)
+        if not victims:
+            return
+        self._idle = keep
+        self._size -= len(victims)
+        await self._notify(len(victims))
+        await asyncio.gather(*(self._discard(r) for r in victims), return_exceptions=True)
+        if not self._closed and self._size < self._min_size:
+            try:
+                await self.start()
+            except Exception:
+                logger.warning("AsyncPool: refill after leader change failed", exc_info=True)
+
+    async def _health_loop(self, interval: float) -> None:
+        while not self._closed:
+            await asyncio.sleep(interval)
+            try:
+                await self._health_check()
+            except Exception:
+                logger.warning("AsyncPool: health check failed", exc_info=True)
+
+    async def _health_check(self) -> None:
+        """One health pass: evict stale idle connections, ping the
+        survivors, and refill to ``min_size``."""
+        now = time.monotonic()
+        survivors: list[_PooledConnection] = []
+        victims: list[_PooledConnection] = []
+        for rec in self._idle:
+            stale = self._max_idle is not None and now - rec.last_used >= self._max_idle
+            if (
+                rec.conn.closed
+                or self._expired(rec, now)
+                or (stale and self._size - len(victims) > self._min_size)
+            ):
+                victims.append(rec)
+            else:
+                survivors.append(rec)
+        # Take the survivors out of circulation while they are pinged
+        # so no borrower can check one out mid-ping.
+        self._idle = []
+        self._size -= len(victims)
+        try:
+            ok = await asyncio.gather(*(self._ping(rec) for rec in survivors))
+        except BaseException:
+            # Cancelled (``close()`` stops this task) or failed mid-
+            # ping: the survivors are reachable from nowhere else, so
+            # tear them down synchronously and free their slots.
+            self._size -= len(survivors)
+            for rec in survivors + victims:
+                rec.conn.force_close_transport()
+            raise
+        for rec, healthy in zip(survivors, ok, strict=True):
+            if healthy:
+                self._idle.append(rec)
+            else:
+                self._size -= 1
+                victims.append(rec)
+        self._idle.sort(key=lambda r: r.last_used)
+        if victims:
+            await self._notify(len(victims))
+            await asyncio.gather(*(self._discard(r) for r in victims), return_exceptions=True)
+        if not self._closed and self._size < self._min_size:
+            await self.start()
+
+    async def close(self) -> None:
+        """Close idle connections, stop the health check, and refuse
+        further checkouts.
+
+        Connections still checked out are closed when released.
+        Idempotent.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        task, self._health_task = self._health_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        idle, self._idle = self._idle, []
+        self._size -= len(idle)
+        available = self._available
+        if available is not None:
+            async with available:
+                available.notify_all()
+        await asyncio.gather(*(self._discard(r) for r in idle), return_exceptions=True)
+        if self._discard_tasks:
+            await asyncio.gather(*self._discard_tasks, return_exceptions=True)
+
+    def __repr__(self) -> str:
+        state = "closed" if self._closed else f"size={self._size}/{self._max_size}"
+        return f"<AsyncPool address={self._address!r} {state}>"
+
+    def __reduce__(self) -> NoReturn:
+        raise TypeError(
+            f"cannot pickle {type(self).__name__!r} object — it owns live "
+            "connections; build a new pool in the consumer process instead"
+        )
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+
+async def create_pool(
+    address: str | Sequence[str],
+    *,
+    min_size: int = 1,
+    max_size: int = 10,
+    acquire_timeout: float = 30.0,
+    max_idle: float | None = 600.0,
+    max_lifetime: float | None = 3600.0,
+    health_check_interval: float | None = 30.0,
+    **connect_kwargs: Any,
+) -> AsyncPool:
+    """Create an :class:`AsyncPool` and open ``min_size`` connections.
+
+    Arguments are as for :class:`AsyncPool`; ``connect_kwargs`` are
+    forwarded to every :class:`AsyncConnection`. Raises the first
+    connect error if warmup fails (no connections are left open).
+    """
+    pool = AsyncPool(
+        address,
+        min_size=min_size,
+        max_size=max_size,
+        acquire_timeout=acquire_timeout,
+        max_idle=max_idle,
+        max_lifetime=max_lifetime,
+        health_check_interval=health_check_interval,
+        **connect_kwargs,
+    )
+    await pool.start()
+    return pool
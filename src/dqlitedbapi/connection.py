@@ -8,7 +8,7 @@ import os
 import threading
 import warnings
 import weakref
-from collections.abc import Coroutine, Iterable, Sequence
+from collections.abc import Coroutine, Iterable, Iterator, Sequence
 from types import TracebackType
 from typing import Any, Final, NoReturn, Self
 
@@ -18,7 +18,14 @@ from dqliteclient.cluster import ClusterClient
 from dqliteclient.connection import parse_address as _client_parse_address
 from dqliteclient.node_store import MemoryNodeStore
 from dqlitedbapi import exceptions as _exc
-from dqlitedbapi.cursor import Cursor, _call_client
+from dqlitedbapi import instrumentation as _instrumentation
+from dqlitedbapi.cursor import (
+    _DEFAULT_STATEMENT_CACHE_SIZE,
+    Cursor,
+    _call_client,
+    _clear_messages,
+    _StatementCache,
+)
 from dqlitedbapi.exceptions import (
     DatabaseError,
     DataError,
@@ -27,6 +34,15 @@ from dqlitedbapi.exceptions import (
     OperationalError,
     ProgrammingError,
 )
+from dqlitedbapi.instrumentation import (
+    Listener,
+    _check_listeners,
+    _check_slow_query_threshold,
+    _Span,
+    _span,
+)
+from dqlitedbapi.result_cache import ResultCache, _settle_pending_writes
+from dqlitedbapi.retry import ReadRetry, _check_read_retry
 from dqlitewire import (
     DEFAULT_MAX_CONTINUATION_FRAMES as _DEFAULT_MAX_CONTINUATION_FRAMES,
 )
@@ -93,6 +109,24 @@ _NO_TX_SUBSTRINGS: Final[tuple[str, ...]] = NO_TRANSACTION_MESSAGE_SUBSTRINGS
 # bound — keep them in step via the constant.
 _LOOP_THREAD_JOIN_TIMEOUT_SECONDS: Final[float] = 5.0
 
+# Number of background loop threads in the process-wide shared pool
+# used by ``Connection(shared_loop=True)``. Sync Connections opted in
+# to the pool are spread across at most this many threads (least-
+# loaded first) instead of each owning a dedicated thread + loop. A
+# handful of threads is enough: every sync call parks its caller on
+# ``Future.result`` while the loop thread only multiplexes socket
+# readiness, so one loop comfortably serves dozens of Connections.
+# More than one keeps a single slow callback (a large row decode)
+# from stalling every pooled Connection in the process.
+_SHARED_LOOP_POOL_SIZE: Final[int] = 4
+
+# Happy-eyeballs stagger for multi-seed leader discovery: the next seed
+# is probed once the previous ones have been silent this long (or at
+# once when one fails). RFC 8305's recommended Connection Attempt
+# Delay; short enough that a black-holed seed costs a fraction of a
+# second, long enough that a healthy first seed answers alone.
+_SEED_STAGGER_SECONDS: Final[float] = 0.25
+
 
 def _validate_timeout(timeout: float) -> None:
     """Raise ProgrammingError if ``timeout`` is not a positive finite number.
@@ -137,6 +171,57 @@ def _wrap_positive_int(value: int | None, name: str) -> int | None:
         raise ProgrammingError(str(e)) from e
 
 
+def _normalize_address(address: object) -> str:
+    """Validate ``address`` and return its canonical string form.
+
+    ``address`` is one ``"host:port"`` seed, a comma-separated string
+    of seeds, or a sequence of seed strings; the result joins the
+    seeds with ``","`` (a single seed is returned unchanged). Each
+    seed is parsed eagerly so a typoed DSN surfaces as
+    ``InterfaceError`` at construction rather than at first use.
+    """
+    if isinstance(address, str):
+        seeds = [s.strip() for s in address.split(",")] if "," in address else [address]
+    elif isinstance(address, list | tuple) and all(isinstance(s, str) for s in address):
+        seeds = [s.strip() for s in address]
+    else:
+        raise InterfaceError(
+            f"address must be a 'host:port' string or a list of them, got {type(address).__name__}"
+        )
+    seeds = [s for s in seeds if s] or [""]
+    for seed in seeds:
+        try:
+            _client_parse_address(seed)
+        except ValueError as e:
+            raise InterfaceError(f"Invalid address: {e}") from e
+    return ",".join(dict.fromkeys(seeds))
+
+
+def _check_result_cache(result_cache: object) -> ResultCache | None:
+    """Validate the ``result_cache`` connect argument."""
+    if result_cache is not None and not isinstance(result_cache, ResultCache):
+        raise ProgrammingError(
+            f"result_cache must be a ResultCache or None, got {type(result_cache).__name__}"
+        )
+    return result_cache
+
+
+def _make_statement_cache(statement_cache_size: int) -> _StatementCache:
+    """Validate ``statement_cache_size`` and build the connection's cache.
+
+    Zero is allowed (disables retention); negatives, bools and
+    non-integers raise ``ProgrammingError`` at construction, matching
+    the ``_wrap_positive_int`` contract for the other sizing knobs.
+    """
+    if isinstance(statement_cache_size, bool) or not isinstance(statement_cache_size, int):
+        raise ProgrammingError(
+            f"statement_cache_size must be an int, got {type(statement_cache_size).__name__}"
+        )
+    if statement_cache_size < 0:
+        raise ProgrammingError(f"statement_cache_size must be >= 0, got {statement_cache_size}")
+    return _StatementCache(statement_cache_size)
+
+
 def _validate_close_timeout(close_timeout: float) -> None:
     """Raise ProgrammingError if ``close_timeout`` is not a positive finite number.
 
@@ -288,6 +373,22 @@ def _get_resolve_leader_cluster(
         return cluster
 
 
+def _forget_leader(address: str) -> None:
+    """Clear every cached ``ClusterClient``'s leader hint naming ``address``.
+
+    Called once ``address`` is known to have lost leadership, so the
+    next ``find_leader`` goes straight to the sweep instead of first
+    probing the deposed node. Safe from any thread: the hint is a
+    single attribute write, and a client on another loop simply
+    rediscovers on its next lookup.
+    """
+    with _RESOLVE_LEADER_CACHE_LOCK:
+        clusters = list(_RESOLVE_LEADER_CACHE.values())
+    for cluster in clusters:
+        if cluster._get_last_known_leader() == address:
+            cluster._set_last_known_leader(None)
+
+
 async def _resolve_leader(
     address: str,
     *,
@@ -323,7 +424,17 @@ async def _resolve_leader(
     leader's address on success; raises the underlying
     ``ClusterError`` / ``ClusterPolicyError`` for the surrounding
     error-translation arms in :func:`_build_and_connect` to handle.
+    A comma-separated multi-seed ``address`` goes through
+    :func:`_race_seeds` instead.
     """
+    if "," in address:
+        return await _race_seeds(
+            tuple(address.split(",")),
+            timeout=timeout,
+            max_total_rows=max_total_rows,
+            max_continuation_frames=max_continuation_frames,
+            trust_server_heartbeat=trust_server_heartbeat,
+        )
     cluster = _get_resolve_leader_cluster(
         address=address,
         timeout=timeout,
@@ -334,6 +445,94 @@ async def _resolve_leader(
     return await cluster.find_leader()
 
 
+# Seed list -> the seed that last answered first, so the next
+# discovery from the same list starts with it (a dead first seed then
+# costs nothing after one connect). Plain strings only, so an
+# inherited copy is harmless across fork; bounded like the
+# ``ClusterClient`` cache it sits next to.
+_SEED_PREFERENCE: dict[tuple[str, ...], str] = {}
+
+
+async def _race_seeds(
+    seeds: tuple[str, ...],
+    *,
+    timeout: float,
+    max_total_rows: int | None,
+    max_continuation_frames: int | None,
+    trust_server_heartbeat: bool,
+) -> str:
+    """Resolve the leader from several seeds, happy-eyeballs style.
+
+    Each seed is resolved through its own cached single-seed
+    :class:`ClusterClient` (so the per-seed leader hint and single-
+    flight collapse apply as for a single address). The probes start
+    ``_SEED_STAGGER_SECONDS`` apart, beginning with the seed that won
+    last time; a probe that fails starts the next one immediately. The
+    first leader answer wins and the other probes are cancelled. Only
+    when every seed has failed is a ``ClusterError`` raised, listing
+    each seed's error; a ``ClusterPolicyError`` propagates at once,
+    since the same policy would reject every seed's answer.
+    """
+    preferred = _SEED_PREFERENCE.get(seeds)
+    order = iter(sorted(seeds, key=lambda s: s != preferred))
+    probes: dict[asyncio.Task[str], str] = {}
+    errors: list[str] = []
+    causes: list[Exception] = []
+    launched = 0
+
+    def launch() -> bool:
+        nonlocal launched
+        seed = next(order, None)
+        if seed is None:
+            return False
+        task = asyncio.ensure_future(
+            _resolve_leader(
+                seed,
+                timeout=timeout,
+                max_total_rows=max_total_rows,
+                max_continuation_frames=max_continuation_frames,
+                trust_server_heartbeat=trust_server_heartbeat,
+            )
+        )
+        probes[task] = seed
+        launched += 1
+        return True
+
+    launch()
+    try:
+        while probes:
+            stagger = _SEED_STAGGER_SECONDS if launched < len(seeds) else None
+            done, _ = await asyncio.wait(
+                probes, timeout=stagger, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                launch()
+                continue
+            for task in done:
+                seed = probes.pop(task)
+                exc = task.exception()
+                if exc is None:
+                    if len(_SEED_PREFERENCE) >= _RESOLVE_LEADER_CACHE_MAX:
+                        _SEED_PREFERENCE.clear()
+                    _SEED_PREFERENCE[seeds] = seed
+                    return task.result()
+                if isinstance(exc, _client_exc.ClusterPolicyError) or not isinstance(
+                    exc, Exception
+                ):
+                    raise exc
+                errors.append(f"{seed}: {exc}")
+                causes.append(exc)
+                launch()
+    finally:
+        for task in probes:
+            task.cancel()
+        if probes:
+            await asyncio.gather(*probes, return_exceptions=True)
+    raise _client_exc.ClusterError(
+        f"no seed answered with a leader ({'; '.join(errors)})"
+    ) from ExceptionGroup("seed probes", causes)
+
+
 async def _build_and_connect(
     address: str,
     *,
@@ -343,6 +542,7 @@ async def _build_and_connect(
     max_continuation_frames: int | None,
     trust_server_heartbeat: bool,
     close_timeout: float,
+    listeners: tuple[Listener, ...] = (),
 ) -> DqliteConnection:
     """Build a DqliteConnection with the given governors and connect it.
 
@@ -363,9 +563,44 @@ async def _build_and_connect(
     Mirrors the canonical go-dqlite/driver layering — applications
     should not need to special-case leader-flips between
     connections; the dbapi handles the redirect transparently.
+
+    ``listeners`` receive a ``"leader_discovery"`` event for step 1
+    and a ``"connect"`` event for the whole sequence (see
+    :mod:`dqlitedbapi.instrumentation`).
     """
+    kwargs: dict[str, Any] = {
+        "database": database,
+        "timeout": timeout,
+        "max_total_rows": max_total_rows,
+        "max_continuation_frames": max_continuation_frames,
+        "trust_server_heartbeat": trust_server_heartbeat,
+        "close_timeout": close_timeout,
+    }
+    if not listeners:
+        return await _connect_to_leader(address, None, **kwargs)
+    span = _Span(listeners, "connect", None, None, address)
+    try:
+        conn = await _connect_to_leader(
+            address, _Span(listeners, "leader_discovery", None, None, address), **kwargs
+        )
+    except BaseException as e:
+        span.finish(error=e)
+        raise
+    span.finish(leader=conn.address)
+    return conn
+
+
+async def _find_leader(
+    address: str,
+    *,
+    timeout: float,
+    max_total_rows: int | None,
+    max_continuation_frames: int | None,
+    trust_server_heartbeat: bool,
+) -> str:
+    """Step 1 of :func:`_build_and_connect`, with PEP 249 error mapping."""
     try:
-        leader_address = await _resolve_leader(
+        return await _resolve_leader(
             address,
             timeout=timeout,
             max_total_rows=max_total_rows,
@@ -397,6 +632,34 @@ async def _build_and_connect(
             raw_message=raw_msg,
         ) from e
 
+
+async def _connect_to_leader(
+    address: str,
+    discovery: _Span | None,
+    *,
+    database: str,
+    timeout: float,
+    max_total_rows: int | None,
+    max_continuation_frames: int | None,
+    trust_server_heartbeat: bool,
+    close_timeout: float,
+) -> DqliteConnection:
+    """Body of :func:`_build_and_connect`; ``discovery`` times step 1."""
+    try:
+        leader_address = await _find_leader(
+            address,
+            timeout=timeout,
+            max_total_rows=max_total_rows,
+            max_continuation_frames=max_continuation_frames,
+            trust_server_heartbeat=trust_server_heartbeat,
+        )
+    except BaseException as e:
+        if discovery is not None:
+            discovery.finish(error=e)
+        raise
+    if discovery is not None:
+        discovery.finish(leader=leader_address)
+
     conn = DqliteConnection(
         leader_address,
         database=database,
@@ -609,9 +872,78 @@ def _safe_writer_close(writer: Any) -> None:
         )
 
 
+def _submit_threadsafe[T](
+    coro: Coroutine[Any, Any, T], loop: asyncio.AbstractEventLoop
+) -> concurrent.futures.Future[T]:
+    """``asyncio.run_coroutine_threadsafe`` with one loop hop fewer.
+
+    Same contract — returns a ``concurrent.futures.Future`` whose
+    ``cancel()`` propagates to the task, and raises
+    ``RuntimeError("Event loop is closed")`` when the loop is gone —
+    but the per-call bookkeeping is cut down for ``_run_sync``'s hot
+    path:
+
+    * The task is created with ``eager_start=True`` inside the
+      scheduling callback, so work that completes without suspending
+      (a cached ``_get_async_connection``, a commit that finds nothing
+      to do, a result-cache hit) finishes in the same loop iteration
+      that picked the callback up, with no task-step callback queued.
+    * The result is copied into the concurrent future directly, either
+      inline (eager completion) or from the task's done callback,
+      instead of through asyncio's ``_chain_future`` which wraps the
+      copy in a second ``call_soon``.
+
+    The coroutine still always runs on the loop thread inside a task,
+    so ``asyncio.timeout`` / ``get_running_loop`` in the client layer
+    see exactly what they saw before.
+    """
+    future: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+    def _copy_state(task: asyncio.Task[T]) -> None:
+        # ``set_running_or_notify_cancel`` is deferred to completion
+        # (as in ``_chain_future``) so ``future.cancel()`` from the
+        # calling thread still succeeds while the task is in flight.
+        if task.cancelled():
+            future.cancel()
+            return
+        if not future.set_running_or_notify_cancel():
+            return
+        exc = task.exception()
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(task.result())
+
+    def _start() -> None:
+        if future.cancelled():
+            coro.close()
+            return
+        try:
+            task = asyncio.Task(coro, loop=loop, eager_start=True)
+        except BaseException as e:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(e)
+            raise
+        if task.done():
+            _copy_state(task)
+            return
+        task.add_done_callback(_copy_state)
+
+        def _propagate_cancel(f: concurrent.futures.Future[T]) -> None:
+            if f.cancelled():
+                # RuntimeError if the loop closed under the caller.
+                with contextlib.suppress(RuntimeError):
+                    loop.call_soon_threadsafe(task.cancel)
+
+        future.add_done_callback(_propagate_cancel)
+
+    loop.call_soon_threadsafe(_start)
+    return future
+
+
 def _cleanup_loop_thread(
     loop: asyncio.AbstractEventLoop,
-    thread: threading.Thread,
+    thread: threading.Thread | None,
     closed_flag: list[bool],
     address: str,
 ) -> None:
@@ -654,37 +986,244 @@ def _cleanup_loop_thread(
                     stacklevel=2,
                 )
     finally:
-        # Narrow suppression to the specific exceptions loop/thread
-        # teardown can legitimately raise during finalization. Wider
-        # ``except Exception: pass`` would hide programmer bugs like a
-        # missing attribute reference introduced during a refactor.
-        try:
-            if not loop.is_closed():
-                loop.call_soon_threadsafe(loop.stop)
-        except RuntimeError:  # pragma: no cover - race: loop closed mid-call
-            # Loop was closed between is_closed() and the threadsafe
-            # call. Log at debug so the swallow is observable for
-            # operators triaging finalize-time anomalies; the
-            # ``pragma: no cover`` stays because the path is genuinely
-            # racy and not reproducible in tests.
-            logger.debug(
-                "Connection._cleanup_loop_thread: loop.call_soon_threadsafe "
-                "raised RuntimeError (loop likely closed mid-call)",
-                exc_info=True,
-            )
+        _stop_loop_thread(
+            loop,
+            thread,
+            join_timeout=_LOOP_THREAD_JOIN_TIMEOUT_SECONDS,
+            where="Connection._cleanup_loop_thread",
+        )
+
+
+def _stop_loop_thread(
+    loop: asyncio.AbstractEventLoop,
+    thread: threading.Thread | None,
+    *,
+    join_timeout: float,
+    where: str,
+) -> None:
+    """Stop ``loop``, join the thread running it, then close the loop.
+
+    Shared teardown tail of the GC finalizer (``_cleanup_loop_thread``)
+    and the shared-loop pool's last-reference release
+    (``_release_shared_loop``). ``where`` prefixes the debug log lines
+    so operators can tell which path swallowed a teardown race.
+    ``thread`` is None for an ``inline_loop`` Connection's loop, which
+    no thread runs between calls.
+    """
+    # Narrow suppression to the specific exceptions loop/thread
+    # teardown can legitimately raise during finalization. Wider
+    # ``except Exception: pass`` would hide programmer bugs like a
+    # missing attribute reference introduced during a refactor.
+    try:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+    except RuntimeError:  # pragma: no cover - race: loop closed mid-call
+        # Loop was closed between is_closed() and the threadsafe
+        # call. Log at debug so the swallow is observable for
+        # operators triaging finalize-time anomalies; the
+        # ``pragma: no cover`` stays because the path is genuinely
+        # racy and not reproducible in tests.
+        logger.debug(
+            "%s: loop.call_soon_threadsafe raised RuntimeError (loop likely closed mid-call)",
+            where,
+            exc_info=True,
+        )
+    # ``RuntimeError`` covers the "cannot join current thread" case:
+    # a GC pass triggered on the loop thread itself can run the
+    # finalizer there.
+    if thread is not None:
         with contextlib.suppress(RuntimeError):
-            thread.join(timeout=_LOOP_THREAD_JOIN_TIMEOUT_SECONDS)
-        try:
-            if not loop.is_closed():
-                loop.close()
-        except RuntimeError:  # pragma: no cover - race: loop restarted mid-finalize
-            # Raised if the loop was somehow restarted mid-finalization.
-            # Same operator-visibility rationale as above.
-            logger.debug(
-                "Connection._cleanup_loop_thread: loop.close() raised "
-                "RuntimeError (loop likely restarted mid-finalize)",
-                exc_info=True,
-            )
+            thread.join(timeout=join_timeout)
+    try:
+        if not loop.is_closed():
+            loop.close()
+    except RuntimeError:  # pragma: no cover - race: loop restarted mid-finalize
+        # Raised if the loop was somehow restarted mid-finalization,
+        # or the join above timed out with the loop still running.
+        # Same operator-visibility rationale as above.
+        logger.debug(
+            "%s: loop.close() raised RuntimeError (loop likely still running)",
+            where,
+            exc_info=True,
+        )
+
+
+class _LoopRunner:
+    """One background event-loop thread in the shared-loop pool.
+
+    ``refcount`` counts the ``Connection`` objects currently assigned
+    to the runner; it is only read or written under
+    ``_SHARED_LOOP_LOCK``. ``pid`` records the process that started
+    the thread so a runner inherited across ``fork()`` (whose thread
+    did not survive) is never released — and never joined — from the
+    child.
+    """
+
+    __slots__ = ("loop", "pid", "refcount", "thread")
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="dqlitedbapi-shared-loop",
+            daemon=True,
+        )
+        self.pid = get_current_pid()
+        self.refcount = 0
+        self.thread.start()
+
+
+# Process-wide pool backing ``Connection(shared_loop=True)``. A
+# dedicated loop thread per Connection means a 50-slot SQLAlchemy
+# ``QueuePool`` carries 50 idle OS threads and 50 event loops; the
+# pool caps that at ``_SHARED_LOOP_POOL_SIZE`` threads for the whole
+# process.
+#
+# Lifetime is reference-counted: ``_acquire_shared_loop`` starts a
+# runner lazily (until the pool is full, then hands out the least-
+# loaded one) and ``_release_shared_loop`` stops, joins and closes a
+# runner when its last Connection lets go — an idle process holds no
+# loop threads at all, same as with dedicated loops.
+#
+# Fork-safety: mirrors ``_RESOLVE_LEADER_CACHE``. The first acquire in
+# a child observes the pid mismatch and drops the inherited runners
+# without touching them; their threads did not cross the fork and
+# their loops' selectors reference parent-owned FDs.
+_SHARED_LOOP_RUNNERS: list[_LoopRunner] = []
+_SHARED_LOOP_PID: int = os.getpid()
+_SHARED_LOOP_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def _acquire_shared_loop() -> _LoopRunner:
+    """Assign the caller to a shared loop runner and take a reference.
+
+    Must be paired with exactly one ``_release_shared_loop`` call.
+    """
+    global _SHARED_LOOP_PID
+    with _SHARED_LOOP_LOCK:
+        pid = get_current_pid()
+        if pid != _SHARED_LOOP_PID:
+            _SHARED_LOOP_RUNNERS.clear()
+            _SHARED_LOOP_PID = pid
+        if len(_SHARED_LOOP_RUNNERS) < _SHARED_LOOP_POOL_SIZE:
+            runner = _LoopRunner()
+            _SHARED_LOOP_RUNNERS.append(runner)
+        else:
+            runner = min(_SHARED_LOOP_RUNNERS, key=lambda r: r.refcount)
+        runner.refcount += 1
+        return runner
+
+
+def _release_shared_loop(runner: _LoopRunner, *, join_timeout: float) -> None:
+    """Drop one reference to ``runner``; tear it down on the last one.
+
+    The stop / join / close runs outside ``_SHARED_LOOP_LOCK`` so a
+    slow join (a wedged wire read on a sibling's behalf) never blocks
+    other threads acquiring a runner. The runner is unlinked from the
+    pool first, so no new Connection can be assigned to a loop that
+    is shutting down.
+    """
+    with _SHARED_LOOP_LOCK:
+        if runner.pid != get_current_pid() or runner.refcount <= 0:
+            return
+        runner.refcount -= 1
+        if runner.refcount:
+            return
+        with contextlib.suppress(ValueError):
+            _SHARED_LOOP_RUNNERS.remove(runner)
+    _stop_loop_thread(
+        runner.loop,
+        runner.thread,
+        join_timeout=join_timeout,
+        where="Connection._release_shared_loop",
+    )
+
+
+def _cleanup_shared_loop_ref(
+    runner: _LoopRunner,
+    inner_box: list[DqliteConnection | None],
+    closed_flag: list[bool],
+    address: str,
+) -> None:
+    """Finalizer counterpart of ``_cleanup_loop_thread`` for
+    ``Connection(shared_loop=True)``.
+
+    The shared loop keeps running for sibling Connections, so the
+    transport of a leaked Connection would otherwise stay registered
+    with its selector until the runner's last reference goes away.
+    ``inner_box`` is a 1-element list holding the most recent
+    ``DqliteConnection`` (the finalizer cannot reach ``self``); its
+    writer is closed on the loop before the reference is dropped.
+    """
+    try:
+        if closed_flag[0] is False:
+            with contextlib.suppress(RuntimeError):
+                warnings.warn(
+                    f"Connection(address={address!r}) was garbage-collected "
+                    f"without close(); releasing shared event-loop thread. Call "
+                    f"Connection.close() explicitly to avoid this warning.",
+                    ResourceWarning,
+                    stacklevel=2,
+                )
+    finally:
+        inner = inner_box[0]
+        inner_box[0] = None
+        if inner is not None and runner.pid == get_current_pid():
+            proto = getattr(inner, "_protocol", None)
+            writer = getattr(proto, "_writer", None) if proto is not None else None
+            if writer is not None:
+                with contextlib.suppress(RuntimeError):
+                    runner.loop.call_soon_threadsafe(_safe_writer_close, writer)
+        _release_shared_loop(runner, join_timeout=_LOOP_THREAD_JOIN_TIMEOUT_SECONDS)
+
+
+# Dead-reference prune floor for ``_CursorRegistry``.
+_CURSOR_REGISTRY_MIN_PRUNE: Final[int] = 64
+
+
+class _CursorRegistry[C]:
+    """Weak record of a connection's outstanding cursors.
+
+    Replaces a ``weakref.WeakSet``. ``WeakSet.add`` allocates a
+    weakref carrying a Python-level removal callback that then runs
+    when each cursor is collected — once per statement under
+    SQLAlchemy, which opens and drops a cursor for every execute.
+    Here ``add`` is a callback-free ``weakref.ref`` plus a list
+    append; dead references are pruned in bulk once the list doubles
+    past its last live size, keeping it O(live cursors) amortised.
+
+    Provides the slice of the set protocol the close cascade uses:
+    ``add``, iteration over live cursors, ``len``, ``in``, ``clear``.
+    """
+
+    __slots__ = ("_limit", "_refs")
+
+    def __init__(self) -> None:
+        self._refs: list[weakref.ref[C]] = []
+        self._limit = _CURSOR_REGISTRY_MIN_PRUNE
+
+    def add(self, cursor: C) -> None:
+        refs = self._refs
+        refs.append(weakref.ref(cursor))
+        if len(refs) > self._limit:
+            refs[:] = [r for r in refs if r() is not None]
+            self._limit = max(_CURSOR_REGISTRY_MIN_PRUNE, 2 * len(refs))
+
+    def __iter__(self) -> Iterator[C]:
+        for ref in self._refs:
+            cursor = ref()
+            if cursor is not None:
+                yield cursor
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, cursor: object) -> bool:
+        return any(c is cursor for c in self)
+
+    def clear(self) -> None:
+        self._refs = []
+        self._limit = _CURSOR_REGISTRY_MIN_PRUNE
 
 
 class Connection:
@@ -731,9 +1270,20 @@ class Connection:
     ProgrammingError = _exc.ProgrammingError
     NotSupportedError = _exc.NotSupportedError
 
+    # Class-level defaults so instances built via ``__new__`` in tests
+    # read as "no listeners" on the ``_run_sync`` hot path.
+    _listeners: tuple[Listener, ...] = ()
+    _slow_query_threshold: float | None = None
+    _inline_loop: bool = False
+    _read_retry: ReadRetry | None = None
+    # The observed operation in flight (see ``instrumentation._Span``);
+    # ``_run_sync`` stamps its lock wait, the cursor wire paths its
+    # connect / wire phases. ``None`` whenever nothing is observed.
+    _active_span: _Span | None = None
+
     def __init__(
         self,
-        address: str,
+        address: str | Sequence[str],
         *,
         database: str = "default",
         timeout: float = 10.0,
@@ -741,11 +1291,21 @@ class Connection:
         max_continuation_frames: int | None = _DEFAULT_MAX_CONTINUATION_FRAMES,
         trust_server_heartbeat: bool = False,
         close_timeout: float = 0.5,
+        shared_loop: bool = False,
+        statement_cache_size: int = _DEFAULT_STATEMENT_CACHE_SIZE,
+        executemany_batch_size: int | None = None,
+        result_cache: ResultCache | None = None,
+        listeners: Iterable[Listener] | None = None,
+        slow_query_threshold: float | None = None,
+        inline_loop: bool = False,
+        read_retry: ReadRetry | None = None,
     ) -> None:
         """Initialize connection (does not connect yet).
 
         Args:
-            address: Node address in "host:port" format
+            address: Node address in "host:port" format, or several seeds
+                as a comma-separated string or a list; leader discovery
+                probes them concurrently and the first leader answer wins
             database: Database name to open
             timeout: Per-RPC-phase timeout in seconds (must be positive
                 and finite; validated here so direct ``Connection(...)``
@@ -772,9 +1332,55 @@ class Connection:
                 :class:`DqliteConnection`. The default (0.5 s) is
                 sized for LAN; callers with higher-latency links or
                 strict shutdown SLAs can override.
+            shared_loop: When True, run this Connection's async client
+                on a thread from a small process-wide pool of event-loop
+                threads instead of a dedicated thread per Connection.
+                Cuts thread count and RSS for processes holding many
+                Connections (large SQLAlchemy pools). Default False.
+            inline_loop: When True, drive this Connection's event loop
+                in the calling thread for the duration of each call
+                instead of on a background thread: the socket I/O runs
+                directly on the caller's stack, with no cross-thread
+                hand-off per statement. Such a Connection cannot be
+                used from a thread that is already running an event
+                loop (``ProgrammingError``). Mutually exclusive with
+                ``shared_loop``. Default False.
+            statement_cache_size: Number of distinct SQL strings whose
+                classification (row-returning, placeholder count,
+                executemany admissibility, ...) is cached per
+                Connection, LRU-evicted. ``0`` disables the cache.
+                Default 128, matching stdlib ``cached_statements``.
+            executemany_batch_size: Opt-in. When set, ``executemany``
+                of a plain ``INSERT ... VALUES (?, ...)`` (no
+                RETURNING / upsert / SELECT body) sends up to this many
+                parameter sets per multi-row ``VALUES`` statement
+                instead of one round-trip per set. ``rowcount`` is
+                unchanged; ``completed_iterations`` advances per chunk.
+                Default None (one statement per parameter set).
+            result_cache: Opt-in :class:`~dqlitedbapi.result_cache.ResultCache`
+                answering repeated pure reads from memory. Share one
+                instance across a pool. Default None (no caching).
+            listeners: Callables receiving an
+                :class:`~dqlitedbapi.instrumentation.Event` for every
+                operation on this connection, in addition to the
+                process-wide ``instrumentation.add_listener`` ones.
+            slow_query_threshold: Opt-in. Seconds; an ``execute`` /
+                ``executemany`` / ``commit`` / ``rollback`` taking at
+                least this long is logged as a warning on the
+                ``dqlitedbapi.instrumentation.slow_query`` logger, with
+                its fingerprint, a redacted parameter shape and a
+                lock-wait / connect / wire / driver time split.
+                Default None (no slow-query log).
+            read_retry: Opt-in :class:`~dqlitedbapi.retry.ReadRetry`
+                replaying a pure read outside a transaction that fails
+                on a leader change, after reconnecting to the new
+                leader. The replay stays within this ``timeout`` as a
+                whole. Default None (the error surfaces).
         """
         _validate_timeout(timeout)
         _validate_close_timeout(close_timeout)
+        if inline_loop and shared_loop:
+            raise ProgrammingError("inline_loop and shared_loop are mutually exclusive")
         # Eager address parse so a typoed DSN surfaces as
         # ``InterfaceError`` at the operator's config-load site rather
         # than at first-use — the sibling ``DqliteConnection``
@@ -782,15 +1388,7 @@ class Connection:
         # layer. Map the client's ``ValueError`` / ``TypeError`` to
         # PEP 249's ``InterfaceError`` ("problems with the database
         # interface rather than the database itself").
-        if not isinstance(address, str):
-            raise InterfaceError(
-                f"address must be a 'host:port' string, got {type(address).__name__}"
-            )
-        try:
-            _client_parse_address(address)
-        except ValueError as e:
-            raise InterfaceError(f"Invalid address: {e}") from e
-        self._address = address
+        self._address = _normalize_address(address)
         self._database = database
         self._timeout = timeout
         self._max_total_rows = _wrap_positive_int(max_total_rows, "max_total_rows")
@@ -799,6 +1397,20 @@ class Connection:
         )
         self._trust_server_heartbeat = trust_server_heartbeat
         self._close_timeout = close_timeout
+        self._shared_loop = shared_loop
+        self._inline_loop = bool(inline_loop)
+        self._statement_cache = _make_statement_cache(statement_cache_size)
+        self._executemany_batch_size = _wrap_positive_int(
+            executemany_batch_size, "executemany_batch_size"
+        )
+        self._result_cache = _check_result_cache(result_cache)
+        # Tables written inside the current explicit transaction, re-
+        # invalidated in every result cache when it ends; see
+        # ``result_cache._note_write``.
+        self._cache_pending_writes: list[frozenset[str] | None] = []
+        self._listeners = _check_listeners(listeners)
+        self._slow_query_threshold = _check_slow_query_threshold(slow_query_threshold)
+        self._read_retry = _check_read_retry(read_retry)
         self._async_conn: DqliteConnection | None = None
         self._closed = False
         # stdlib ``sqlite3.Connection.row_factory`` parity. None means
@@ -806,6 +1418,10 @@ class Connection:
         self._row_factory: Any = None
         self._loop: asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None = None
+        # Set only under ``shared_loop=True``: the pool runner whose
+        # loop/thread ``_loop`` / ``_thread`` alias. Close paths
+        # release the runner reference instead of stopping the loop.
+        self._loop_runner: _LoopRunner | None = None
         self._loop_lock = threading.Lock()
         self._op_lock = threading.Lock()
         self._connect_lock: asyncio.Lock | None = None
@@ -830,11 +1446,15 @@ class Connection:
         # closing over ``self`` and preventing GC.
         self._closed_flag: list[bool] = [False]
         self._finalizer: weakref.finalize[Any, Any] | None = None
+        # 1-element list mirroring the latest ``_async_conn`` for the
+        # shared-loop finalizer (``_cleanup_shared_loop_ref``), which
+        # must close a leaked transport without closing over ``self``.
+        self._inner_box: list[DqliteConnection | None] = [None]
         # Track outstanding cursors weakly so Connection.close() can
         # scrub their state (stdlib sqlite3 cascades; buffered fetches
         # on a cursor whose Connection was externally closed used to
         # silently succeed against stale in-memory rows).
-        self._cursors: weakref.WeakSet[Cursor] = weakref.WeakSet()
+        self._cursors: _CursorRegistry[Cursor] = _CursorRegistry()
 
     def _check_thread(self) -> None:
         """Raise on cross-process (fork) or cross-thread misuse.
@@ -864,14 +1484,36 @@ class Connection:
         created so a Connection that's garbage-collected without an
         explicit ``close()`` still cleans up its thread. (GC'd connections
         used to leak daemon threads forever.)
+
+        Under ``shared_loop=True`` the loop is borrowed from the
+        process-wide pool (``_acquire_shared_loop``) instead; the
+        finalizer then drops the pool reference rather than stopping a
+        loop sibling Connections are still using. Under
+        ``inline_loop=True`` no thread is started: ``_run_inline``
+        runs the loop on the caller's thread, one call at a time.
         """
         if self._loop is not None and not self._loop.is_closed():
             return self._loop
         with self._loop_lock:
-            if self._loop is None or self._loop.is_closed():
+            if self._shared_loop:
+                if self._loop_runner is None:
+                    runner = _acquire_shared_loop()
+                    self._loop_runner = runner
+                    self._loop = runner.loop
+                    self._thread = runner.thread
+                    self._finalizer = weakref.finalize(
+                        self,
+                        _cleanup_shared_loop_ref,
+                        runner,
+                        self._inner_box,
+                        self._closed_flag,
+                        self._address,
+                    )
+            elif self._loop is None or self._loop.is_closed():
                 self._loop = asyncio.new_event_loop()
-                self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
-                self._thread.start()
+                if not self._inline_loop:
+                    self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+                    self._thread.start()
                 # Finalizer can't close over self — it'd keep the
                 # Connection alive. Capture primitives only. The
                 # closed-flag list is mutated by close() so the
@@ -884,7 +1526,10 @@ class Connection:
                     self._closed_flag,
                     self._address,
                 )
-        return self._loop
+            loop = self._loop
+        # Every branch above leaves a live loop on ``self._loop``.
+        assert loop is not None
+        return loop
 
     def _run_sync[T](self, coro: Coroutine[Any, Any, T]) -> T:
         """Run an async coroutine from sync code.
@@ -986,11 +1631,16 @@ class Connection:
                     "may indicate re-entry from a signal handler or concurrent "
                     "use from another thread)"
                 )
+            span = self._active_span
+            if span is not None:
+                span.locked()
+            if self._inline_loop:
+                return self._run_inline(coro)
             loop = self._ensure_loop()
             try:
-                future = asyncio.run_coroutine_threadsafe(coro, loop)
+                future = _submit_threadsafe(coro, loop)
             except RuntimeError as e:
-                # ``asyncio.run_coroutine_threadsafe`` raises bare
+                # ``_submit_threadsafe`` raises bare
                 # ``RuntimeError("Event loop is closed")`` when the
                 # loop is closed between ``_ensure_loop()`` returning
                 # and the schedule call landing — the canonical race
@@ -1267,6 +1917,71 @@ class Connection:
             if acquired:
                 self._op_lock.release()
 
+    def _run_inline[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """``_run_sync`` body under ``inline_loop=True``; ``_op_lock`` held.
+
+        Runs ``coro`` to completion on the Connection's private loop in
+        the calling thread. Same contract as the background-thread
+        path: bounded by ``self._timeout`` (``OperationalError``, and
+        the connection is invalidated so the next call reconnects), and
+        a ``KeyboardInterrupt`` / ``SystemExit`` that lands mid-call
+        cancels the operation and invalidates the connection before
+        re-raising. Without a loop thread there is no hand-off to race,
+        so none of the thread path's recovery arms are needed.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            raise ProgrammingError(
+                "inline_loop Connection used from a thread that is running an event "
+                "loop; use dqlitedbapi.aio, or a Connection without inline_loop"
+            )
+        loop = self._ensure_loop()
+        task = loop.create_task(self._inline_body(coro))
+        try:
+            return loop.run_until_complete(task)
+        except (KeyboardInterrupt, SystemExit):
+            if task.done() and not task.cancelled():
+                # Finished before the signal landed, or the signal
+                # landed inside the coroutine's own frame; either way
+                # the task has unwound. Only the latter tears the wire.
+                if not isinstance(task.exception(), KeyboardInterrupt | SystemExit):
+                    raise
+            else:
+                task.cancel()
+            dying = self._async_conn
+            self._async_conn = None
+            if dying is not None:
+                dying._invalidate(InterfaceError("operation interrupted"))
+            if not task.done():
+                # Let the cancellation unwind (bounded) so the task is
+                # not destroyed pending. A second KI propagates.
+                try:
+                    loop.run_until_complete(asyncio.wait({task}, timeout=1.0))
+                except Exception:
+                    logger.debug(
+                        "inline KI/SystemExit cleanup: unexpected error during bounded cancel-wait",
+                        exc_info=True,
+                    )
+            raise
+
+    async def _inline_body[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        try:
+            async with asyncio.timeout(self._timeout):
+                return await coro
+        except TimeoutError as e:
+            # ``asyncio.timeout`` has already cancelled and unwound
+            # ``coro``; it may have half-written a request, so poison
+            # the wire as the thread path does.
+            dying = self._async_conn
+            self._async_conn = None
+            if dying is not None:
+                dying._invalidate(OperationalError(f"sync timeout after {self._timeout}s"))
+            raise OperationalError(f"Operation timed out after {self._timeout} seconds") from e
+
     async def _get_async_connection(self) -> DqliteConnection:
         """Get or create the underlying async connection."""
         if self._closed:
@@ -1290,7 +2005,9 @@ class Connection:
                 max_continuation_frames=self._max_continuation_frames,
                 trust_server_heartbeat=self._trust_server_heartbeat,
                 close_timeout=self._close_timeout,
+                listeners=_instrumentation._active(self),
             )
+            self._inner_box[0] = self._async_conn
 
         return self._async_conn
 
@@ -1315,6 +2032,11 @@ class Connection:
         self._check_thread()
         if self._closed:
             raise InterfaceError(f"Connection is closed (id={id(self)})")
+        # Already connected: ``_get_async_connection`` would return the
+        # cached client without touching the wire, so skip the loop
+        # round-trip (and the op-lock) entirely.
+        if self._async_conn is not None:
+            return
         # _get_async_connection is a coroutine; route through _run_sync
         # so we share the same loop-in-thread the cursor path uses.
         self._run_sync(self._get_async_connection())
@@ -1348,7 +2070,7 @@ class Connection:
                 cur._rowcount = -1
                 cur._lastrowid = None
                 cur._row_index = 0
-                del cur.messages[:]
+                _clear_messages(cur)
                 with contextlib.suppress(TypeError):
                     cur._connection = weakref.proxy(cur._connection)
         finally:
@@ -1474,7 +2196,12 @@ class Connection:
                     inner = self._async_conn
                     proto = getattr(inner, "_protocol", None)
                     writer = getattr(proto, "_writer", None) if proto is not None else None
-                    if writer is not None and self._loop is not None and not self._loop.is_closed():
+                    if (
+                        writer is not None
+                        and self._thread is not None
+                        and self._loop is not None
+                        and not self._loop.is_closed()
+                    ):
                         # ``StreamWriter.close()`` mutates transport
                         # state (calls ``self._loop._remove_reader(...)``
                         # under the hood) and is documented as not
@@ -1492,13 +2219,27 @@ class Connection:
                         with contextlib.suppress(RuntimeError):
                             self._loop.call_soon_threadsafe(_safe_writer_close, writer)
                     elif writer is not None:
-                        # Loop is closed / unavailable — the
-                        # ``_safe_writer_close`` synchronous call
-                        # is the best we can do to flush FIN.
+                        # Loop is closed / unavailable, or is the
+                        # ``inline_loop`` one (not running: this thread
+                        # drives it) — the ``_safe_writer_close``
+                        # synchronous call is the best we can do to
+                        # flush FIN.
                         with contextlib.suppress(Exception):
                             writer.close()
                     self._async_conn = None
-                if self._loop is not None and not self._loop.is_closed():
+                self._inner_box[0] = None
+                if self._loop_runner is not None:
+                    # Shared loop: sibling Connections still run on it.
+                    # Drop this Connection's reference; the last one
+                    # out stops / joins / closes the runner. The
+                    # writer.close scheduled above is already queued
+                    # ahead of any ``loop.stop`` the release queues.
+                    runner = self._loop_runner
+                    self._loop_runner = None
+                    self._loop = None
+                    self._thread = None
+                    _release_shared_loop(runner, join_timeout=_LOOP_THREAD_JOIN_TIMEOUT_SECONDS)
+                elif self._loop is not None and not self._loop.is_closed():
                     # ``is_closed()`` is a TOCTOU check — the loop
                     # could be closed by a concurrent finalizer /
                     # interpreter-shutdown sweep between the check
@@ -1591,20 +2332,41 @@ class Connection:
             inner = self._async_conn
             self._async_conn = None
             loop = self._loop
-            if loop is not None and not loop.is_closed():
-                if inner is not None:
-                    proto = getattr(inner, "_protocol", None)
-                    writer = getattr(proto, "_writer", None) if proto is not None else None
-                    if writer is not None:
-                        # ``StreamWriter.close()`` is not thread-safe;
-                        # schedule on the owning loop. The
-                        # ``loop.stop`` we queue immediately afterwards
-                        # is itself a ``call_soon_threadsafe`` and the
-                        # loop processes ready callbacks in FIFO order,
-                        # so the writer.close lands first and FIN goes
-                        # out before ``run_forever`` exits.
-                        with contextlib.suppress(RuntimeError):
-                            loop.call_soon_threadsafe(_safe_writer_close, writer)
+            if inner is not None and loop is not None and not loop.is_closed():
+                proto = getattr(inner, "_protocol", None)
+                writer = getattr(proto, "_writer", None) if proto is not None else None
+                if writer is not None and self._inline_loop and not loop.is_running():
+                    # Idle ``inline_loop``: nothing else touches the
+                    # transport; close it directly.
+                    _safe_writer_close(writer)
+                elif writer is not None:
+                    # ``StreamWriter.close()`` is not thread-safe;
+                    # schedule on the owning loop. The ``loop.stop``
+                    # we queue immediately afterwards is itself a
+                    # ``call_soon_threadsafe`` and the loop processes
+                    # ready callbacks in FIFO order, so the
+                    # writer.close lands first and FIN goes out
+                    # before ``run_forever`` exits.
+                    with contextlib.suppress(RuntimeError):
+                        loop.call_soon_threadsafe(_safe_writer_close, writer)
+            self._inner_box[0] = None
+            if self._loop_runner is not None:
+                # Shared loop: never stop a loop sibling Connections
+                # are using. Release the reference (the last one out
+                # tears the runner down, bounded by ``close_timeout``).
+                runner = self._loop_runner
+                self._loop_runner = None
+                self._loop = None
+                self._thread = None
+                _release_shared_loop(runner, join_timeout=self._close_timeout)
+            elif self._inline_loop and loop is not None and loop.is_running():
+                # An ``inline_loop`` call is in flight on the creator
+                # thread. Stopping the loop under it would surface as a
+                # bare ``RuntimeError`` there; the writer close queued
+                # above fails its read instead, and the loop is closed
+                # at GC.
+                self._loop = None
+            elif loop is not None and not loop.is_closed():
                 with contextlib.suppress(RuntimeError):
                     loop.call_soon_threadsafe(loop.stop)
                 if self._thread is not None:
@@ -1770,7 +2532,16 @@ class Connection:
         # same way a fresh connection would.
         if not getattr(self._async_conn, "in_transaction", False):
             return
-        self._run_sync(self._commit_async())
+        span = _span(self, "commit", "COMMIT", bind=True)
+        if span is None:
+            self._run_sync(self._commit_async())
+            return
+        try:
+            self._run_sync(self._commit_async())
+        except BaseException as e:
+            span.finish(error=e)
+            raise
+        span.finish()
 
     async def _commit_async(self) -> None:
         """Async implementation of commit."""
@@ -1793,6 +2564,8 @@ class Connection:
         except OperationalError as e:
             if not _is_no_transaction_error(e):
                 raise
+        finally:
+            _settle_pending_writes(self)
 
     def rollback(self) -> None:
         """Roll back any pending transaction.
@@ -1813,7 +2586,16 @@ class Connection:
         # wire round-trip on the autocommit-by-default common case.
         if not getattr(self._async_conn, "in_transaction", False):
             return
-        self._run_sync(self._rollback_async())
+        span = _span(self, "rollback", "ROLLBACK", bind=True)
+        if span is None:
+            self._run_sync(self._rollback_async())
+            return
+        try:
+            self._run_sync(self._rollback_async())
+        except BaseException as e:
+            span.finish(error=e)
+            raise
+        span.finish()
 
     async def _rollback_async(self) -> None:
         """Async implementation of rollback."""
@@ -1830,6 +2612,8 @@ class Connection:
         except OperationalError as e:
             if not _is_no_transaction_error(e):
                 raise
+        finally:
+            _settle_pending_writes(self)
 
     def cursor(self, **unknown_kwargs: object) -> Cursor:
         """Return a new Cursor object.
@@ -3,12 +3,19 @@
 import contextlib
 import re
 import weakref
-from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Final, NoReturn, Protocol, Self
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, NoReturn, Protocol, Self
 
 import dqliteclient.exceptions as _client_exc
 import dqlitewire.exceptions as _wire_exc
+from dqlitedbapi._columnar import (
+    _Column,
+    _columns_to_arrow_table,
+    _columns_to_numpy,
+    _pack_columns,
+)
 from dqlitedbapi.exceptions import (
     DatabaseError,
     DataError,
@@ -19,12 +26,24 @@ from dqlitedbapi.exceptions import (
     OperationalError,
     ProgrammingError,
 )
+from dqlitedbapi.instrumentation import _bound_span, _span
+from dqlitedbapi.result_cache import (
+    _LIVE_CACHES,
+    _cache_slot,
+    _CachedResult,
+    _CacheSlot,
+    _connection_cache,
+    _normalize_identifier,
+    _note_write,
+)
+from dqlitedbapi.retry import _read_retry_for, _retry_read
 from dqlitedbapi.types import (
     _convert_bind_param,
     _datetime_from_iso8601,
     _datetime_from_unixtime,
     _Description,
 )
+from dqlitewire import LEADER_ERROR_CODES
 from dqlitewire.constants import (
     DQLITE_NOTFOUND,
     DQLITE_PARSE,
@@ -200,6 +219,12 @@ def _classify_operational(
     return _CODE_TO_EXCEPTION.get(primary_sqlite_code(code), OperationalError)
 
 
+# Installed by ``leader_watch.enable``: called on every leader-class
+# or lost-connection error so the watcher re-resolves the leader at once. ``None`` (one
+# global read per error) when no watcher runs.
+_leader_error_hook: Callable[[], None] | None = None
+
+
 async def _call_client[T](coro: Awaitable[T]) -> T:
     """Await a client-layer coroutine, mapping its exceptions into the
     PEP 249 hierarchy. Preserves the original via ``from``.
@@ -233,6 +258,8 @@ async def _call_client[T](coro: Awaitable[T]) -> T:
         # ``__str__`` prefixes ``[code]`` so using ``str(e)`` would put
         # the code in the message text AND as the ``code=`` attribute.
         exc_cls = _classify_operational(e.code)
+        if _leader_error_hook is not None and e.code in LEADER_ERROR_CODES:
+            _leader_error_hook()
         # Plumb the full server text through ``raw_message`` so callers
         # that want the un-truncated diagnostic (operators reading
         # logs, structured-error tooling) don't have to walk
@@ -255,6 +282,9 @@ async def _call_client[T](coro: Awaitable[T]) -> T:
         # the ``or str(e)`` fallback covers raises that constructed
         # the error without explicit raw_message.
         code = getattr(e, "code", None)
+        # A lost node is as likely a deposed leader as a leader code.
+        if _leader_error_hook is not None:
+            _leader_error_hook()
         raw_msg = e.raw_message or str(e)
         raise OperationalError(str(e), code=code, raw_message=raw_msg) from e
     except _client_exc.ClusterPolicyError as e:
@@ -386,6 +416,264 @@ def _convert_row(row: Sequence[Any], row_types: Sequence[int]) -> tuple[Any, ...
     return tuple(result)
 
 
+# Wire types that carry a result-side converter. A row whose per-row
+# types are disjoint from this set only needs ``tuple(row)``.
+_CONVERTED_WIRE_TYPES: Final[frozenset[int]] = frozenset(_RESULT_CONVERTERS)
+
+
+class _BufferedRowsCursor(Protocol):
+    """Structural shape shared by :class:`Cursor` / :class:`AsyncCursor`
+    for lazy row materialisation (see :func:`_materialize_rows`)."""
+
+    _rows: list[Any]
+    _raw_row_types: list[list[int]] | None
+    _converted: int
+    _row_index: int
+    _row_offset: int
+
+
+class _FetchRowsCursor(_BufferedRowsCursor, Protocol):
+    """A :class:`_BufferedRowsCursor` that also applies ``row_factory``
+    (see :func:`_take_rows`). The executemany accumulator only
+    materialises, so it needs the narrower protocol."""
+
+    _row_factory: Callable[[Any, Any], Any] | None
+
+
+def _materialize_rows(cursor: _BufferedRowsCursor, stop: int) -> None:
+    """Convert buffered wire rows up to index ``stop`` (exclusive).
+
+    ``execute`` stores the wire rows as-is and records their per-row
+    types in ``_raw_row_types``; rows ``[0, _converted)`` are finished
+    tuples and the rest are raw wire lists. Fetch verbs call this
+    before reading, so ``datetime`` parsing and the per-row tuple are
+    paid only for rows actually fetched — an existence check that
+    reads one row of a large result converts one row. Per row, the
+    ``isdisjoint`` test is the "needs conversion" bit: rows with no
+    converter-bearing type skip ``_convert_row`` entirely.
+
+    The watermark advances row by row so a ``DataError`` from a
+    malformed cell leaves earlier rows converted exactly once and the
+    bad row raw (the next fetch raises again rather than returning a
+    half-decoded row).
+    """
+    # ``getattr``: cursors assembled via ``__new__`` and duck-typed
+    # stand-ins (tests, adapters) never ran ``__init__``; absent state
+    # means "already materialised".
+    row_types = getattr(cursor, "_raw_row_types", None)
+    if row_types is None:
+        return
+    rows = cursor._rows
+    stop = min(stop, len(rows))
+    i = cursor._converted
+    try:
+        while i < stop:
+            types = row_types[i]
+            row = rows[i]
+            if _CONVERTED_WIRE_TYPES.isdisjoint(types):
+                rows[i] = tuple(row)
+            else:
+                rows[i] = _convert_row(row, types)
+            i += 1
+    finally:
+        cursor._converted = i
+    if i >= len(rows):
+        cursor._raw_row_types = None
+
+
+def _materialized_row(cursor: _BufferedRowsCursor, index: int) -> tuple[Any, ...]:
+    """Row ``index`` of the buffer, converted (see :func:`_materialize_rows`).
+
+    The buffer holds raw wire lists past the conversion watermark, so
+    its entries are untyped; this is the typed boundary the fetch
+    verbs return through. A buffer seeded without ``_raw_row_types``
+    (result-cache hits, tests) may hold lists; those are tupled here.
+    """
+    _materialize_rows(cursor, index + 1)
+    row = cursor._rows[index]
+    return row if isinstance(row, tuple) else tuple(row)
+
+
+def _apply_row_factory(
+    cursor: Any, factory: Callable[[Any, Any], Any], rows: list[Any]
+) -> list[Any]:
+    """Apply ``factory`` to every row, preferring its ``batch`` hook."""
+    batch_factory = getattr(factory, "batch", None)
+    if callable(batch_factory):
+        return list(batch_factory(cursor, rows))
+    return [factory(cursor, row) for row in rows]
+
+
+def _take_rows(cursor: _FetchRowsCursor, size: int) -> list[Any]:
+    """Vectorised body of ``fetchmany`` for the sync and async cursors.
+
+    The caller validates once; this slices ``_rows`` for the whole
+    batch, materialises it in one pass, and applies ``row_factory``
+    batch-wise. A factory exposing a callable ``batch`` attribute gets
+    one ``factory.batch(cursor, rows)`` call for the whole slice
+    (all-or-nothing: on a raise the index is untouched). Otherwise the
+    factory runs per row, and on any exception — including
+    ``KeyboardInterrupt`` / ``CancelledError`` — ``_row_index`` lands
+    at ``start + delivered``, the same snapshot/restore contract the
+    ``fetchone`` loop this replaced had: no row replayed, none skipped.
+    """
+    start = cursor._row_index
+    stop = min(start + size, len(cursor._rows))
+    if stop <= start:
+        return []
+    _materialize_rows(cursor, stop)
+    batch = cursor._rows[start:stop]
+    factory = cursor._row_factory
+    if factory is None:
+        cursor._row_index = stop
+        _compact_rows(cursor)
+        return batch
+    if callable(getattr(factory, "batch", None)):
+        result = _apply_row_factory(cursor, factory, batch)
+        cursor._row_index = stop
+        _compact_rows(cursor)
+        return result
+    result = []
+    try:
+        for row in batch:
+            result.append(factory(cursor, row))
+    except BaseException:
+        cursor._row_index = start + len(result)
+        raise
+    cursor._row_index = stop
+    _compact_rows(cursor)
+    return result
+
+
+def _column_values(cursor: _BufferedRowsCursor) -> list[Sequence[Any]]:
+    """Transpose the unfetched rows into per-column value sequences.
+
+    The columnar counterpart of :func:`_materialize_rows`: the buffered
+    rows (finished tuples and raw wire lists alike) are transposed as
+    they are — no per-row tuple is built — and result-side conversion
+    then runs column by column, only on columns where some raw row
+    carries a converter-bearing wire type. The cursor is left
+    untouched, so a ``DataError`` from a malformed cell leaves every
+    row unfetched.
+    """
+    rows = cursor._rows
+    start = cursor._row_index
+    values: list[Sequence[Any]] = list(zip(*rows[start:], strict=True))
+    row_types = getattr(cursor, "_raw_row_types", None)
+    raw_from = max(start, cursor._converted) if row_types is not None else len(rows)
+    if row_types is None or raw_from >= len(rows):
+        return values
+    offset = raw_from - start
+    for j, types in enumerate(zip(*row_types[raw_from:], strict=True)):
+        if _CONVERTED_WIRE_TYPES.isdisjoint(types):
+            continue
+        column = list(values[j])
+        for k, tcode in enumerate(types, offset):
+            converter = _RESULT_CONVERTERS.get(tcode)
+            if converter is not None and column[k] is not None:
+                column[k] = converter(column[k])
+        values[j] = column
+    return values
+
+
+# Consumed rows are released once at least this many have been
+# fetched AND they make up at least half the buffer. The half rule
+# bounds the memmove in ``del rows[:n]`` to the rows released, so
+# compaction is amortised O(1) per fetched row.
+_COMPACT_MIN_ROWS: Final[int] = 1024
+
+
+def _compact_rows(cursor: _BufferedRowsCursor) -> None:
+    """Drop already-fetched rows from the cursor's buffer.
+
+    Without this a cursor iterated over millions of rows keeps every
+    consumed row alive until the next ``execute`` / ``close``. The
+    dropped count moves into ``_row_offset`` so ``rownumber`` keeps
+    reporting the absolute position; ``_row_index`` and the lazy
+    conversion watermark are rebased onto the shortened buffer.
+    """
+    consumed = cursor._row_index
+    if consumed < _COMPACT_MIN_ROWS:
+        return
+    rows = cursor._rows
+    if consumed * 2 < len(rows):
+        return
+    del rows[:consumed]
+    row_types = getattr(cursor, "_raw_row_types", None)
+    if row_types is not None:
+        del row_types[:consumed]
+        cursor._converted = max(cursor._converted - consumed, 0)
+    cursor._row_offset += consumed
+    cursor._row_index = 0
+
+
+def _buffer_wire_rows(
+    cursor: _BufferedRowsCursor,
+    rows: list[list[Any]],
+    row_types: list[list[int]],
+    column_types: list[int],
+) -> None:
+    """Install a fresh wire result for lazy conversion."""
+    if len(row_types) < len(rows):
+        # Defensive: a short per-row type list falls back to the
+        # first-row ``column_types`` for the remainder, matching the
+        # eager path this replaced.
+        row_types = row_types + [column_types] * (len(rows) - len(row_types))
+    cursor._rows = rows
+    cursor._converted = 0
+    cursor._row_offset = 0
+    cursor._raw_row_types = row_types if rows else None
+
+
+class _CachedReadCursor(_BufferedRowsCursor, Protocol):
+    """Cursor state a result-cache hit installs (see ``_serve_cached``)."""
+
+    _description: _Description
+    _rowcount: int
+
+
+def _read_cache_slot(
+    connection: Any, operation: str, parameters: Sequence[Any] | None, info: "_StatementInfo"
+) -> _CacheSlot | None:
+    """Result-cache slot for this ``execute``, or ``None`` if uncached."""
+    # Cache first: table extraction is only paid where a cache exists.
+    if _connection_cache(connection) is None or info.read_tables is None:
+        return None
+    return _cache_slot(connection, operation, _convert_params(parameters), info.read_tables)
+
+
+def _serve_cached(cursor: _CachedReadCursor, slot: _CacheSlot) -> bool:
+    """Install the cached result for ``slot``; ``False`` on a miss.
+
+    The cached wire rows are shallow-copied into the cursor: the fetch
+    verbs convert (and compaction trims) the cursor's own lists in
+    place, and the entry must stay raw for the next hit.
+    """
+    result = slot.cache._get(slot.key)
+    if result is None:
+        return False
+    cursor._description = result.description
+    _buffer_wire_rows(cursor, list(result.rows), list(result.row_types), result.column_types)
+    cursor._row_index = 0
+    cursor._rowcount = len(result.rows)
+    return True
+
+
+def _store_cached(
+    slot: _CacheSlot,
+    description: _Description,
+    rows: list[list[Any]],
+    row_types: list[list[int]],
+    column_types: list[int],
+) -> None:
+    slot.cache._put(
+        slot.key,
+        slot.generation,
+        slot.tables,
+        _CachedResult(description, list(rows), list(row_types), column_types),
+    )
+
+
 def _reject_non_sequence_params(params: Any) -> None:
     """Reject mappings, unordered containers, and str/bytes per PEP 249 qmark rules.
 
@@ -539,6 +827,7 @@ def _is_multi_statement(sql: str) -> bool:
 def _classify_caller_sql(
     operation: str,
     parameters: Sequence[Any] | None,
+    info: "_StatementInfo | None" = None,
 ) -> None:
     """Pre-flight classification of caller-supplied SQL.
 
@@ -565,14 +854,19 @@ def _classify_caller_sql(
     comments via ``_strip_sql_noise`` first so a ``;`` / ``?``
     inside a quoted token / comment is not treated as syntactically
     significant.
+
+    ``info`` is the statement's cached classification record (see
+    ``_StatementCache``); when omitted the SQL is classified here.
     """
+    if info is None:
+        info = _classify_statement(operation)
     # Empty-SQL: ``_strip_leading_comments`` returns "" if the SQL
     # is blank, whitespace, or comment-only. Stdlib raises
     # ``ProgrammingError`` for ``""``; match.
-    if not _strip_leading_comments(operation):
+    if info.empty:
         raise ProgrammingError("empty statement")
     # Multi-statement: stdlib raises with this exact wording.
-    if _is_multi_statement(operation):
+    if info.multi_statement:
         raise ProgrammingError("You can only execute one statement at a time.")
     # ``?``-count vs len(parameters). Only validate when parameters
     # is provided (``None`` / ``()`` are valid for parameterless SQL).
@@ -584,9 +878,7 @@ def _classify_caller_sql(
             param_count = len(parameters)
         except TypeError:
             return  # caller will trip the binding-layer rejection
-        # Count ``?`` placeholders in the noise-stripped SQL.
-        cleaned = _strip_sql_noise(operation)
-        placeholder_count = cleaned.count("?")
+        placeholder_count = info.placeholder_count
         if placeholder_count != param_count:
             raise ProgrammingError(
                 f"Incorrect number of bindings supplied. The current "
@@ -608,9 +900,12 @@ class _ExecuteManyCursor(Protocol):
 
     _rowcount: int
     _description: _Description
-    _rows: list[tuple[Any, ...]]
+    _rows: list[Any]
     _row_index: int
     _closed: bool
+    _raw_row_types: list[list[int]] | None
+    _converted: int
+    _row_offset: int
 
 
 class _ExecuteManyAccumulator:
@@ -667,6 +962,7 @@ class _ExecuteManyAccumulator:
             # RETURNING path.
             if self.description is None:
                 self.description = cursor._description
+            _materialize_rows(cursor, len(cursor._rows))
             self.rows.extend(cursor._rows)
             self.total_affected += len(cursor._rows)
             if self._max_rows is not None and len(self.rows) > self._max_rows:
@@ -714,6 +1010,8 @@ class _ExecuteManyAccumulator:
         if self.description is not None:
             cursor._description = self.description
             cursor._rows = self.rows
+            cursor._raw_row_types = None
+            cursor._row_offset = 0
             cursor._row_index = 0
 
 
@@ -831,6 +1129,97 @@ def _is_dml_with_returning(sql: str) -> bool:
     return body.startswith(("INSERT", "UPDATE", "DELETE", "REPLACE"))
 
 
+def _keep_quoted_identifier(match: re.Match[str]) -> str:
+    text = match.group(0)
+    return text if text[0] in '"[`' else " "
+
+
+def _strip_sql_literals(sql: str) -> str:
+    """``_strip_sql_noise`` that keeps quoted identifiers.
+
+    String literals and comments still become a space, but ``"t"`` /
+    ``[t]`` / `` `t` `` survive so the table-name extraction below can
+    see quoted table names.
+    """
+    return _SQL_NOISE_RE.sub(_keep_quoted_identifier, sql)
+
+
+_IDENTIFIER = r'"(?:[^"]|"")*"|\[[^\]]*\]|`(?:[^`]|``)*`|[^\W\d][\w$]*'
+_IDENTIFIER_RE = re.compile(_IDENTIFIER)
+# Target of a DML statement, optionally schema-qualified. ``UPDATE OR
+# <conflict>`` and ``DELETE FROM`` forms included; ``INTO`` covers
+# INSERT / REPLACE / INSERT OR <conflict>.
+_WRITE_TARGET_RE = re.compile(
+    rf"\b(?:INTO|UPDATE(?:\s+OR\s+[A-Z]+)?|DELETE\s+FROM)\s+"
+    rf"((?:{_IDENTIFIER})(?:\s*\.\s*(?:{_IDENTIFIER}))?)",
+    re.IGNORECASE,
+)
+# Statements that change no table data.
+_NO_WRITE_VERBS: Final[tuple[str, ...]] = (
+    "SELECT",
+    "VALUES",
+    "PRAGMA",
+    "EXPLAIN",
+    "BEGIN",
+    "COMMIT",
+    "END",
+    "ROLLBACK",
+    "SAVEPOINT",
+    "RELEASE",
+)
+# Reads whose answer changes without any table write: connection-state
+# functions, randomness, and the clock (``CURRENT_*`` keywords, and the
+# date / time functions called with ``'now'`` or no time value). Run
+# over the raw SQL, so a match inside a literal or comment merely
+# leaves that read uncached.
+_VOLATILE_READ_RE = re.compile(
+    r"\b(?:LAST_INSERT_ROWID|CHANGES|TOTAL_CHANGES|RANDOM|RANDOMBLOB)\s*\("
+    r"|\bCURRENT_(?:TIMESTAMP|DATE|TIME)\b"
+    r"|\b(?:DATE|TIME|DATETIME|JULIANDAY|UNIXEPOCH|STRFTIME|TIMEDIFF)\s*\("
+    r"\s*(?:\)|[^)]*'now')",
+    re.IGNORECASE,
+)
+
+
+def _result_cache_tables(sql: str) -> tuple[frozenset[str] | None, frozenset[str] | None]:
+    """Table names the result cache keys invalidation on: ``(read, written)``.
+
+    ``read`` is set only for a pure read — a leading ``SELECT`` /
+    ``VALUES``, possibly behind a ``WITH`` clause — that calls no
+    volatile function (``random()``, ``last_insert_rowid()``,
+    ``CURRENT_TIMESTAMP``, ``date('now')``, ...), and holds every
+    identifier the statement mentions. That is a deliberate superset
+    (column names and aliases ride along): a write to any table the
+    read touches always matches, and a spurious match only costs an
+    early eviction.
+
+    ``written`` covers everything else: empty for statements that
+    change no data, the target table for INSERT / REPLACE / UPDATE /
+    DELETE, and ``None`` ("unknown — invalidate everything") for DDL,
+    ``VACUUM`` and anything the extractor cannot read.
+    """
+    normalized = _strip_leading_comments(_strip_sql_noise(sql)).upper().lstrip("(")
+    body = _strip_leading_with_clause(normalized)
+    if body.startswith(("SELECT", "VALUES")):
+        if _VOLATILE_READ_RE.search(sql):
+            return None, frozenset()
+        names = _IDENTIFIER_RE.findall(_strip_sql_literals(sql))
+        return frozenset(_normalize_identifier(n) for n in names), frozenset()
+    if body.startswith(_NO_WRITE_VERBS):
+        return None, frozenset()
+    if body.startswith(("INSERT", "REPLACE", "UPDATE", "DELETE")):
+        targets = set()
+        for match in _WRITE_TARGET_RE.finditer(_strip_sql_literals(sql)):
+            # Last dotted segment: ``main.t`` writes ``t``.
+            name = _normalize_identifier(_IDENTIFIER_RE.findall(match.group(1))[-1])
+            # ``ON CONFLICT ... DO UPDATE SET`` reads as an UPDATE of
+            # a table named SET.
+            if name != "set":
+                targets.add(name)
+        return None, frozenset(targets) or None
+    return None, None
+
+
 _INT64_OVERFLOW_THRESHOLD: Final[int] = 1 << 63
 _UINT64_RANGE: Final[int] = 1 << 64
 
@@ -873,6 +1262,329 @@ def _is_insert_or_replace(sql: str) -> bool:
     return normalized.startswith(("INSERT", "REPLACE"))
 
 
+def _executemany_rejection(sql: str) -> str | None:
+    """Return the ``ProgrammingError`` message ``executemany`` raises
+    for ``sql``, or ``None`` if the statement is admissible.
+
+    Rejects transaction-control verbs and pure queries (stdlib
+    ``sqlite3.Cursor.executemany`` does the same) so the caller's
+    frame sees the error before any batch runs. Shared by the sync
+    and async cursors.
+
+    Leading semicolons and interleaved whitespace are stripped BEFORE
+    the verb extraction so ``";BEGIN ..."`` (semicolon-prefixed) and
+    ``"; ; BEGIN ..."`` (semicolon-whitespace-semicolon) cannot bypass
+    the reject-list. The trailing ``rstrip(";")`` then canonicalises a
+    verb glued to a trailing semicolon (``"BEGIN;"``, ``"COMMIT;"``)
+    into the bare verb. Without both ends, ``executemany(";BEGIN
+    INSERT ...", ...)`` or ``executemany("BEGIN; INSERT ...", ...)``
+    was silently admitted and re-ran the bare statement N times.
+    Comment-strip and ``;``-strip loop together so a leading ``;``
+    followed by a comment (``"; /* x */ SAVEPOINT foo"``) does not
+    bypass the reject-list either — each iteration consumes a comment
+    or a ``;`` (or both) and re-strips before checking the verb.
+    """
+    head_normalised = sql
+    while True:
+        stripped = _strip_leading_comments(head_normalised).lstrip()
+        if stripped.startswith(";"):
+            head_normalised = stripped[1:]
+            continue
+        if stripped == head_normalised:
+            break
+        head_normalised = stripped
+    head_normalised = head_normalised.upper()
+    first_verb = head_normalised.split(maxsplit=1)[0].rstrip(";") if head_normalised else ""
+    if first_verb in _EXECUTEMANY_REJECT_VERBS:
+        return (
+            f"executemany() not supported for {first_verb}; "
+            "use execute() instead — transaction-control statements "
+            "take no parameters and cannot be batched."
+        )
+    if _is_row_returning(sql) and not _is_dml_with_returning(sql):
+        if sql.lstrip().upper().startswith("PRAGMA"):
+            # Specific guidance for PRAGMA: it has per-call side-effect
+            # semantics and is never meaningfully batchable, even when
+            # the syntactic shape would fit an executemany loop. The
+            # grouped message below would leave the user wondering
+            # whether a different PRAGMA would be acceptable.
+            return (
+                "executemany() does not accept PRAGMA; PRAGMAs have "
+                "per-call semantics and are not batchable. Use "
+                "execute() for each PRAGMA."
+            )
+        return (
+            "executemany() can only execute DML statements; "
+            "use execute() for SELECT / VALUES / PRAGMA / EXPLAIN / WITH."
+        )
+    return None
+
+
+# ``VALUES (?, ?, ...)`` as the last thing in the statement: one tuple of
+# bare ``?`` placeholders, an optional trailing ``;``, nothing else. The
+# tail admits no quotes or comments, so a raw-text match is only wrong
+# if it sits inside a comment/literal — ``_split_values_insert``
+# re-checks against the noise-stripped text for that.
+_VALUES_TUPLE_TAIL_RE = re.compile(
+    r"\bVALUES\s*\(\s*\?(?:\s*,\s*\?)*\s*\)\s*;?\s*\Z",
+    re.IGNORECASE,
+)
+_VALUES_KEYWORD_RE = re.compile(r"\bVALUES\b", re.IGNORECASE)
+_SELECT_KEYWORD_RE = re.compile(r"\bSELECT\b", re.IGNORECASE)
+
+
+def _split_values_insert(sql: str) -> tuple[str, int] | None:
+    """Split a plain ``INSERT ... VALUES (?, ...)`` into the text up to
+    and including ``VALUES`` and the placeholder count of its tuple.
+
+    Returns ``None`` for anything a multi-row rewrite could change the
+    meaning of: RETURNING (SQLite does not order RETURNING rows within
+    one statement), upserts and other trailing clauses, CTE prefixes,
+    ``INSERT ... SELECT`` / compound ``VALUES ... UNION VALUES``
+    bodies, numbered / named placeholders, and placeholders outside the
+    VALUES tuple.
+    """
+    if not _is_insert_or_replace(sql) or _is_row_returning(sql):
+        return None
+    match = _VALUES_TUPLE_TAIL_RE.search(sql)
+    if match is None:
+        return None
+    cleaned = _strip_sql_noise(sql)
+    if _VALUES_TUPLE_TAIL_RE.search(cleaned) is None:
+        return None
+    if len(_VALUES_KEYWORD_RE.findall(cleaned)) != 1 or _SELECT_KEYWORD_RE.search(cleaned):
+        return None
+    width = match.group(0).count("?")
+    if cleaned.count("?") != width:
+        return None
+    return sql[: match.start()] + "VALUES ", width
+
+
+class _CacheTables:
+    """``_result_cache_tables(sql)``, computed on first use and kept.
+
+    Table extraction costs several times every other classifier
+    combined, and only the result cache and ``ReadRetry`` consult it;
+    a connection with neither, in a process with no live
+    ``ResultCache``, never runs it.
+    """
+
+    __slots__ = ("_sql", "_tables")
+
+    def __init__(self, sql: str) -> None:
+        self._sql = sql
+        self._tables: tuple[frozenset[str] | None, frozenset[str] | None] | None = None
+
+    def get(self) -> tuple[frozenset[str] | None, frozenset[str] | None]:
+        tables = self._tables
+        if tables is None:
+            tables = self._tables = _result_cache_tables(self._sql)
+        return tables
+
+
+class _StatementInfo(NamedTuple):
+    """Frozen classification record for one SQL string.
+
+    Every field is a pure function of the SQL text (parameters play no
+    part), which is what makes the record safe to cache by text. See
+    ``_classify_statement`` for how each field is derived;
+    ``read_tables`` / ``written_tables`` are computed on first access.
+    """
+
+    empty: bool
+    multi_statement: bool
+    placeholder_count: int
+    row_returning: bool
+    insert_or_replace: bool
+    executemany_rejection: str | None
+    values_insert: tuple[str, int] | None
+    cache_tables: _CacheTables
+
+    @property
+    def read_tables(self) -> frozenset[str] | None:
+        """See :func:`_result_cache_tables`; ``None`` unless a pure read."""
+        return self.cache_tables.get()[0]
+
+    @property
+    def written_tables(self) -> frozenset[str] | None:
+        """See :func:`_result_cache_tables`."""
+        return self.cache_tables.get()[1]
+
+
+def _classify_statement(sql: str) -> _StatementInfo:
+    """Run every classifier the execute paths consult over ``sql`` once.
+
+    Each helper re-runs ``_SQL_NOISE_RE`` / ``_strip_leading_comments``
+    over the text; doing it once per distinct statement (via
+    ``_StatementCache``) rather than once per call is the point.
+    """
+    return _StatementInfo(
+        empty=not _strip_leading_comments(sql),
+        multi_statement=_is_multi_statement(sql),
+        placeholder_count=_strip_sql_noise(sql).count("?"),
+        row_returning=_is_row_returning(sql),
+        insert_or_replace=_is_insert_or_replace(sql),
+        executemany_rejection=_executemany_rejection(sql),
+        values_insert=_split_values_insert(sql),
+        cache_tables=_CacheTables(sql),
+    )
+
+
+def _note_statement(connection: Any, info: _StatementInfo) -> None:
+    """``_note_write`` for a finished statement unless it is a pure read.
+
+    Free, table extraction included, while no ``ResultCache`` is alive.
+    """
+    if _LIVE_CACHES and info.read_tables is None:
+        _note_write(connection, info.written_tables)
+
+
+# Default ``statement_cache_size``. Mirrors stdlib ``sqlite3.connect``'s
+# ``cached_statements=128``: ORM workloads reuse a few hundred distinct
+# statements at most, and each entry is one short tuple.
+_DEFAULT_STATEMENT_CACHE_SIZE: Final[int] = 128
+
+
+class _StatementCache:
+    """Bounded LRU mapping SQL text to its ``_StatementInfo``.
+
+    One per connection (``statement_cache_size``). The classifiers are
+    regex- and slice-heavy and an ORM issues the same few hundred
+    statements over and over, so the per-call cost collapses to one
+    dict lookup. Not thread-safe on its own: the owning connection
+    already serialises cursor use (thread affinity on the sync side,
+    ``op_lock`` / single-task cursors on the async side).
+
+    ``maxsize == 0`` disables retention: every lookup classifies from
+    scratch, matching the pre-cache behaviour.
+    """
+
+    __slots__ = ("_entries", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: OrderedDict[str, _StatementInfo] = OrderedDict()
+        self._maxsize = maxsize
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, sql: str) -> _StatementInfo:
+        entries = self._entries
+        info = entries.get(sql)
+        if info is not None:
+            entries.move_to_end(sql)
+            return info
+        info = _classify_statement(sql)
+        if self._maxsize > 0:
+            entries[sql] = info
+            if len(entries) > self._maxsize:
+                entries.popitem(last=False)
+        return info
+
+
+def _lookup_statement(connection: Any, sql: str) -> _StatementInfo:
+    """Classify ``sql`` through ``connection``'s statement cache.
+
+    Falls back to an uncached classification when the connection has
+    no cache — unit tests drive cursors against ``MagicMock``
+    connections, whose auto-attributes must not be mistaken for one.
+    A non-``str`` operation also bypasses the cache (it may not be
+    hashable) and surfaces whatever the classifiers raise for it.
+    """
+    cache = getattr(connection, "_statement_cache", None)
+    if isinstance(cache, _StatementCache) and type(sql) is str:
+        return cache.lookup(sql)
+    return _classify_statement(sql)
+
+
+# Upper bound on bound parameters per rewritten INSERT: SQLite's default
+# ``SQLITE_MAX_VARIABLE_NUMBER`` since 3.32 (below the advertised
+# ``sqlite_version`` floor) and the wire codec's params-tuple cap.
+_MAX_BOUND_PARAMETERS: Final[int] = 32766
+
+
+def _executemany_statements(
+    connection: Any,
+    operation: str,
+    seq_of_parameters: Iterable[Sequence[Any]],
+) -> Iterator[tuple[str, Sequence[Any] | None, int, _StatementInfo | None]]:
+    """Yield ``(sql, parameters, iterations, info)`` for an ``executemany`` loop.
+
+    By default this is one ``(operation, params, 1)`` per parameter
+    set. With the connection's ``executemany_batch_size`` set and a
+    plain ``INSERT ... VALUES (?, ...)`` (see ``_split_values_insert``),
+    consecutive parameter sets are folded into multi-row
+    ``VALUES (...), (...)`` statements of up to that many rows (fewer
+    if the row is wide enough to hit ``_MAX_BOUND_PARAMETERS``), so a
+    bulk load costs one Raft round-trip per chunk rather than per row.
+
+    ``iterations`` is the number of parameter sets the yielded
+    statement covers; callers add it to ``_completed_iterations`` only
+    once the statement succeeded. A chunk is a single statement, so a
+    failing row rolls back its whole chunk and the count stays exact.
+    A parameter set whose length does not match the tuple raises
+    ``ProgrammingError`` — silently shifting the remaining values into
+    the wrong columns is the failure mode the per-row path cannot have.
+
+    ``info`` is the classification to execute the statement with, or
+    ``None`` to look it up as usual. A chunk carries ``operation``'s
+    own record (repeating the ``VALUES`` row changes none of its
+    fields), so the synthesized SQL never enters the connection's
+    ``_StatementCache`` — one entry per chunk width would evict the
+    caller's real statements.
+    """
+    batch_size = getattr(connection, "_executemany_batch_size", None)
+    info = None
+    prefix, width, rows_per_chunk = "", 0, 0
+    # ``type(...) is int`` keeps ``MagicMock`` connections in unit tests
+    # on the per-row path.
+    if type(batch_size) is int:
+        info = _lookup_statement(connection, operation)
+        if info.values_insert is not None:
+            prefix, width = info.values_insert
+            rows_per_chunk = min(batch_size, _MAX_BOUND_PARAMETERS // width)
+    if rows_per_chunk <= 1:
+        for params in seq_of_parameters:
+            yield operation, params, 1, None
+        return
+    row_sql = "(" + ", ".join("?" * width) + ")"
+    full_chunk_sql = prefix + ", ".join([row_sql] * rows_per_chunk)
+    flat: list[Any] = []
+    rows = 0
+    for params in seq_of_parameters:
+        _reject_non_sequence_params(params)
+        values = [] if params is None else list(params)
+        if len(values) != width:
+            raise ProgrammingError(
+                f"Incorrect number of bindings supplied. The current "
+                f"statement uses {width}, and there are "
+                f"{len(values)} supplied."
+            )
+        flat.extend(values)
+        rows += 1
+        if rows == rows_per_chunk:
+            yield full_chunk_sql, flat, rows, info
+            flat = []
+            rows = 0
+    if rows:
+        yield prefix + ", ".join([row_sql] * rows), flat, rows, info
+
+
+_Messages = list[tuple[type[Exception], Exception | str]]
+
+
+def _clear_messages(obj: Any) -> None:
+    """PEP 249 "cleared prior to executing the call" step.
+
+    ``messages`` is allocated on first read (see ``Cursor.messages``),
+    so an object nobody inspected has no list to clear — and clearing
+    must not allocate one. Shared by the cursors and connections.
+    """
+    msgs = obj._messages
+    if msgs:
+        msgs.clear()
+
+
 class Cursor:
     """PEP 249 compliant database cursor."""
 
@@ -881,22 +1593,25 @@ class Cursor:
     # win at SA-engine scale. Mirrors ``_ExecuteManyAccumulator``'s
     # existing slots pattern. Subclasses without their own
     # ``__slots__`` retain a ``__dict__`` (stdlib ``datetime`` pattern).
-    # ``__weakref__`` is needed so ``Connection._cursors`` (a WeakSet)
-    # can hold a reference to the cursor; slotted classes need it
-    # declared explicitly.
+    # ``__weakref__`` is needed so ``Connection._cursors`` (a
+    # ``_CursorRegistry`` of weak references) can track the cursor;
+    # slotted classes need it declared explicitly.
     __slots__ = (
         "__weakref__",
         "_arraysize",
         "_closed",
         "_completed_iterations",
         "_connection",
+        "_converted",
         "_description",
         "_lastrowid",
+        "_messages",
+        "_raw_row_types",
         "_row_factory",
         "_row_index",
+        "_row_offset",
         "_rowcount",
         "_rows",
-        "messages",
     )
 
     def __init__(self, connection: "Connection") -> None:
@@ -904,8 +1619,15 @@ class Cursor:
         self._description: _Description = None
         self._rowcount = -1
         self._arraysize = 1
-        self._rows: list[tuple[Any, ...]] = []
+        self._rows: list[Any] = []
+        # Lazy conversion state; see ``_materialize_rows``. ``None``
+        # means every entry of ``_rows`` is already a finished tuple.
+        self._raw_row_types: list[list[int]] | None = None
+        self._converted = 0
         self._row_index = 0
+        # Rows already released by ``_compact_rows``; ``rownumber`` is
+        # ``_row_offset + _row_index``.
+        self._row_offset = 0
         self._closed = False
         self._lastrowid: int | None = None
         # Count of executemany() iterations that completed
@@ -932,10 +1654,8 @@ class Cursor:
             if type(connection).__name__ == "Connection"
             else None
         )
-        # PEP 249 optional extension. Currently no driver path appends
-        # to this list; it's here so consumers can rely on the
-        # attribute existing and being mutable.
-        self.messages: list[tuple[type[Exception], Exception | str]] = []
+        # Backing store for the lazily allocated ``messages`` list.
+        self._messages: _Messages | None = None
 
     @property
     def connection(self) -> "Connection":
@@ -1003,7 +1723,9 @@ class Cursor:
         recovering from a cancelled executemany can read this to know
         which prefix of ``seq_of_parameters`` already persisted.
         Complements ``rowcount`` which resets to PEP 249's
-        "undetermined" sentinel (-1) on the cancel path.
+        "undetermined" sentinel (-1) on the cancel path. Under
+        ``executemany_batch_size`` the count advances a whole chunk at
+        a time (a chunk is one statement and commits atomically).
 
         Resets to 0 at the start of every new executemany call.
         """
@@ -1035,6 +1757,24 @@ class Cursor:
         """
         return self._lastrowid
 
+    @property
+    def messages(self) -> _Messages:
+        """PEP 249 optional extension: diagnostics for this cursor.
+
+        No driver path currently appends here; consumers can rely on
+        the attribute existing and being mutable. The list is created
+        on first read — a cursor per statement is the SQLAlchemy
+        pattern, and almost none of them ever look at ``messages``.
+        """
+        msgs = self._messages
+        if msgs is None:
+            msgs = self._messages = []
+        return msgs
+
+    @messages.setter
+    def messages(self, value: _Messages) -> None:
+        self._messages = value
+
     @property
     def rownumber(self) -> int | None:
         """0-based index of the next row in the current result set.
@@ -1046,7 +1786,7 @@ class Cursor:
         """
         if self._description is None:
             return None
-        return self._row_index
+        return self._row_offset + self._row_index
 
     @property
     def arraysize(self) -> int:
@@ -1085,7 +1825,10 @@ class Cursor:
 
         Set to a callable ``factory(cursor, row) -> Any`` to wrap each
         fetched tuple before returning. ``None`` (default) returns
-        plain tuples per PEP 249. Common factories:
+        plain tuples per PEP 249. If the factory also has a callable
+        ``batch`` attribute, ``fetchmany`` / ``fetchall`` call
+        ``factory.batch(cursor, rows)`` once per call instead of the
+        factory once per row. Common factories:
 
         - ``sqlite3.Row`` (stdlib): tuple-like with index AND
           column-name access.
@@ -1126,15 +1869,29 @@ class Cursor:
         """
         self._description = None
         self._rows = []
+        self._raw_row_types = None
+        self._row_offset = 0
         self._row_index = 0
         self._rowcount = -1
 
-    def execute(self, operation: str, parameters: Sequence[Any] | None = None, /) -> Self:
+    def execute(
+        self,
+        operation: str,
+        parameters: Sequence[Any] | None = None,
+        /,
+        *,
+        use_cache: bool = True,
+    ) -> Self:
         """Execute a database operation (query or command).
 
         Returns ``self`` so callers can chain ``.fetchall()`` etc.
+
+        When the connection has a ``result_cache``, a pure read is
+        answered from it if possible (see ``dqlitedbapi.result_cache``);
+        ``use_cache=False`` always goes to the server and does not
+        store the result.
         """
-        del self.messages[:]
+        _clear_messages(self)
         # ``_check_closed`` BEFORE ``_check_thread``: ``Cursor.close()``
         # swaps ``self._connection`` for a ``weakref.proxy``; once the
         # parent ``Connection`` is GC'd, ``_connection._check_thread()``
@@ -1158,25 +1915,85 @@ class Cursor:
         # caller bug surfaces with the right class at the user's
         # call site rather than as ``OperationalError`` (server
         # rejection) or silent data loss (multi-statement drop).
-        _classify_caller_sql(operation, parameters)
+        info = _lookup_statement(self._connection, operation)
+        _classify_caller_sql(operation, parameters, info)
 
-        self._connection._run_sync(self._execute_async(operation, parameters))
+        # Instrumentation covers calls that pass the pre-flight checks
+        # above; ``None`` (and no timing at all) without listeners or a
+        # ``slow_query_threshold``.
+        span = _span(self._connection, "execute", operation, parameters, bind=True)
+        try:
+            # A result-cache hit never leaves the calling thread.
+            slot = (
+                _read_cache_slot(self._connection, operation, parameters, info)
+                if use_cache
+                else None
+            )
+            if slot is not None and _serve_cached(self, slot):
+                if span is not None:
+                    span.finish(self, cached=True)
+                return self
+
+            policy = _read_retry_for(self._connection, info)
+            if policy is None:
+                self._connection._run_sync(self._execute_async(operation, parameters, slot))
+            else:
+                self._connection._run_sync(
+                    _retry_read(
+                        self._connection,
+                        policy,
+                        lambda: self._execute_async(operation, parameters, slot),
+                    )
+                )
+        except BaseException as e:
+            if span is not None:
+                span.finish(self, error=e)
+            raise
+        if span is not None:
+            span.finish(self)
         return self
 
-    async def _execute_async(self, operation: str, parameters: Sequence[Any] | None = None) -> None:
+    async def _execute_async(
+        self,
+        operation: str,
+        parameters: Sequence[Any] | None = None,
+        cache_slot: _CacheSlot | None = None,
+        info: _StatementInfo | None = None,
+    ) -> None:
         """Async implementation of execute.
 
         Routes through DqliteConnection's public API (execute/query_raw_typed)
         which goes through _run_protocol(), providing the _in_use guard,
         connection invalidation on fatal errors, and leader-change detection.
+
+        ``cache_slot`` is where a cacheable read's result is stored.
+        Every statement that is not a pure read invalidates the result
+        caches for the tables it writes (``_note_write``). ``info`` is a
+        precomputed classification of ``operation`` (see
+        ``_executemany_statements``); ``None`` looks it up.
         """
+        # Slow-query phase split; see ``instrumentation._Span``.
+        span = _bound_span(self._connection)
+        connect_span = span if self._connection._async_conn is None else None
+        if connect_span is not None:
+            connect_span.phase_begin()
         conn = await self._connection._get_async_connection()
+        if connect_span is not None:
+            connect_span.phase_end("connect")
         params = _convert_params(parameters)
+        if info is None:
+            info = _lookup_statement(self._connection, operation)
 
-        if _is_row_returning(operation):
+        if info.row_returning:
+            if span is not None:
+                span.phase_begin()
             columns, column_types, row_types, rows = await _call_client(
                 conn.query_raw_typed(operation, params)
             )
+            if span is not None:
+                span.phase_end("wire")
+            # DML ... RETURNING, PRAGMA, EXPLAIN.
+            _note_statement(self._connection, info)
             if not columns:
                 # ``_is_row_returning`` classifies ``PRAGMA`` as row-
                 # returning, which is correct for the read form
@@ -1190,6 +2007,8 @@ class Cursor:
                 # row-returning branch's literal ``len(rows)``).
                 self._description = None
                 self._rows = []
+                self._raw_row_types = None
+                self._row_offset = 0
                 self._row_index = 0
                 self._rowcount = -1
                 return
@@ -1243,28 +2062,34 @@ class Cursor:
                     (name, type_codes[i], None, None, None, None, None)
                     for i, name in enumerate(columns)
                 )
+            if cache_slot is not None:
+                _store_cached(cache_slot, self._description, rows, row_types, column_types)
             # Per-row dispatch: SQLite's dynamic typing means two rows in
-            # the same column can carry different wire types. Use
-            # ``row_types[i]`` rather than ``column_types`` so a row
-            # whose wire type diverges from row 0 is decoded correctly.
-            self._rows = [
-                _convert_row(row, row_types[i] if i < len(row_types) else column_types)
-                for i, row in enumerate(rows)
-            ]
+            # the same column can carry different wire types, so each
+            # row keeps its own ``row_types[i]``. Conversion is deferred
+            # to the fetch verbs (``_materialize_rows``).
+            _buffer_wire_rows(self, rows, row_types, column_types)
             self._row_index = 0
             self._rowcount = len(rows)
         else:
+            if span is not None:
+                span.phase_begin()
             last_id, affected = await _call_client(conn.execute(operation, params))
+            if span is not None:
+                span.phase_end("wire")
+            _note_statement(self._connection, info)
             # stdlib-parity: lastrowid only updates on INSERT / REPLACE.
             # UPDATE / DELETE / DDL leave the previous INSERT's rowid
             # in place — the wire returns 0 / stale values on those
             # paths and unconditionally writing would zero the sticky
             # value. See ``_is_insert_or_replace`` for rationale.
-            if _is_insert_or_replace(operation):
+            if info.insert_or_replace:
                 self._lastrowid = _to_signed_int64(last_id)
             self._rowcount = _to_signed_int64(affected)
             self._description = None
             self._rows = []
+            self._raw_row_types = None
+            self._row_offset = 0
             # Parity with the SELECT branch and with executemany: every
             # execute must leave the cursor at row 0 of its (possibly
             # empty) result set so a subsequent SELECT iterator starts
@@ -1296,13 +2121,23 @@ class Cursor:
         executemany on this driver to obtain a rowid; use a single-row
         execute instead, or read the id from RETURNING rows.
 
+        Round-trips: each parameter set is one request/response on the
+        connection, and the client layer admits exactly one request in
+        flight per connection (its protocol lock and ``_in_use`` guard
+        serialise every RPC), so requests cannot be pipelined. Plain
+        ``INSERT ... VALUES`` batches can be folded into multi-row
+        statements with ``executemany_batch_size``; for keyed UPDATE /
+        DELETE batches the equivalent is a single set-based statement
+        (e.g. ``UPDATE t SET v = s.column2 FROM (VALUES (?, ?), ...)
+        AS s WHERE t.k = s.column1``) issued through ``execute``.
+
         Rejected calls (transaction-control verbs, non-DML row-returning
         shapes) preserve the prior ``lastrowid`` — no batch ran, so the
         cursor docstring's lifecycle contract holds (only ``close()``
         scrubs ``lastrowid``). This matches the async sibling's rejection
         path.
         """
-        del self.messages[:]
+        _clear_messages(self)
         # See ``execute``'s prelude comment for the ordering rationale.
         self._check_closed()
         self._connection._check_thread()
@@ -1319,60 +2154,24 @@ class Cursor:
         # Reject transaction-control verbs and pure queries up front so
         # the caller's frame sees the ProgrammingError rather than
         # having it surface deep inside the async helper. stdlib
-        # sqlite3.Cursor.executemany does the same.
-        # Strip leading semicolons + interleaved whitespace BEFORE the
-        # verb extraction so ``";BEGIN ..."`` (semicolon-prefixed) and
-        # ``"; ; BEGIN ..."`` (semicolon-whitespace-semicolon) cannot
-        # bypass the reject-list. The trailing ``rstrip(";")`` then
-        # canonicalises a verb glued to a trailing semicolon
-        # (``"BEGIN;"``, ``"COMMIT;"``) into the bare verb. Without
-        # both ends, ``executemany(";BEGIN INSERT ...", ...)`` or
-        # ``executemany("BEGIN; INSERT ...", ...)`` was silently
-        # admitted and re-ran the bare statement N times.
-        # Loop comment-strip + ;-strip together so a leading ``;``
-        # followed by a comment (``"; /* x */ SAVEPOINT foo"``) does
-        # not bypass the reject-list — the original single-pass
-        # comment-strip-then-semicolon-loop missed comments that sat
-        # AFTER a leading ``;``. Each iteration consumes either a
-        # comment or a ``;`` (or both) and re-strips before checking
-        # the verb.
-        head_normalised = operation
-        while True:
-            stripped = _strip_leading_comments(head_normalised).lstrip()
-            if stripped.startswith(";"):
-                head_normalised = stripped[1:]
-                continue
-            if stripped == head_normalised:
-                break
-            head_normalised = stripped
-        head_normalised = head_normalised.upper()
-        first_verb = head_normalised.split(maxsplit=1)[0].rstrip(";") if head_normalised else ""
-        if first_verb in _EXECUTEMANY_REJECT_VERBS:
-            raise ProgrammingError(
-                f"executemany() not supported for {first_verb}; "
-                "use execute() instead — transaction-control statements "
-                "take no parameters and cannot be batched."
-            )
-        if _is_row_returning(operation) and not _is_dml_with_returning(operation):
-            head_upper = operation.lstrip().upper()
-            if head_upper.startswith("PRAGMA"):
-                # Specific guidance for PRAGMA: it has per-call
-                # side-effect semantics and is never meaningfully
-                # batchable, even when the syntactic shape would fit
-                # an executemany loop. The grouped message above
-                # would leave the user wondering whether a different
-                # PRAGMA would be acceptable.
-                raise ProgrammingError(
-                    "executemany() does not accept PRAGMA; PRAGMAs have "
-                    "per-call semantics and are not batchable. Use "
-                    "execute() for each PRAGMA."
-                )
-            raise ProgrammingError(
-                "executemany() can only execute DML statements; "
-                "use execute() for SELECT / VALUES / PRAGMA / EXPLAIN / WITH."
-            )
-
-        self._connection._run_sync(self._executemany_async(operation, seq_of_parameters))
+        # sqlite3.Cursor.executemany does the same. See
+        # ``_executemany_rejection`` for the verb-extraction rules.
+        rejection = _lookup_statement(self._connection, operation).executemany_rejection
+        if rejection is not None:
+            raise ProgrammingError(rejection)
+
+        # One event for the whole batch; the per-iteration
+        # ``_execute_async`` calls below emit none.
+        span = _span(self._connection, "executemany", operation, seq_of_parameters, bind=True)
+        if span is None:
+            self._connection._run_sync(self._executemany_async(operation, seq_of_parameters))
+            return self
+        try:
+            self._connection._run_sync(self._executemany_async(operation, seq_of_parameters))
+        except BaseException as e:
+            span.finish(self, error=e)
+            raise
+        span.finish(self)
         return self
 
     async def _executemany_async(
@@ -1408,10 +2207,12 @@ class Cursor:
         self._completed_iterations = 0
         acc = _ExecuteManyAccumulator(max_rows=self._connection._max_total_rows)
         try:
-            for params in seq_of_parameters:
-                await self._execute_async(operation, params)
+            for sql, params, iterations, info in _executemany_statements(
+                self._connection, operation, seq_of_parameters
+            ):
+                await self._execute_async(sql, params, info=info)
                 acc.push(self)
-                self._completed_iterations += 1
+                self._completed_iterations += iterations
             # stdlib ``sqlite3.Cursor.executemany`` does NOT update
             # ``lastrowid`` — the value reflects no single row across
             # the batch and is "left unchanged" per the docs. We clear
@@ -1447,9 +2248,11 @@ class Cursor:
             # cancel get the count for idempotent compensation.
             self._rowcount = -1
             self._rows = []
+            self._raw_row_types = None
+            self._row_offset = 0
             self._description = None
             self._row_index = 0
-            del self.messages[:]
+            _clear_messages(self)
             raise
         acc.apply(self)
 
@@ -1473,7 +2276,7 @@ class Cursor:
         ``_check_result_set`` and raise on no-result-set, matching
         stdlib's distinction.
         """
-        del self.messages[:]
+        _clear_messages(self)
         # See ``execute``'s prelude comment for the ordering rationale.
         self._check_closed()
         self._connection._check_thread()
@@ -1487,7 +2290,7 @@ class Cursor:
         if self._row_index >= len(self._rows):
             return None
 
-        row = self._rows[self._row_index]
+        row = _materialized_row(self, self._row_index)
         # Apply row_factory BEFORE advancing ``_row_index`` so a raise
         # inside a custom factory leaves the index unchanged. The next
         # ``fetchone()`` call returns the same row (which is the
@@ -1499,8 +2302,10 @@ class Cursor:
         if self._row_factory is not None:
             transformed: tuple[Any, ...] = self._row_factory(self, row)
             self._row_index += 1
+            _compact_rows(self)
             return transformed
         self._row_index += 1
+        _compact_rows(self)
         return row
 
     def fetchmany(self, size: int | None = None) -> list[tuple[Any, ...]]:
@@ -1524,7 +2329,7 @@ class Cursor:
         gets an empty list under dqlite. Pass ``None`` or omit
         ``size`` to default to ``self.arraysize``.
         """
-        del self.messages[:]
+        _clear_messages(self)
         # See ``execute``'s prelude comment for the ordering rationale.
         self._check_closed()
         self._connection._check_thread()
@@ -1552,22 +2357,9 @@ class Cursor:
             # invariant), but the per-call argument follows stdlib.
             return self.fetchall()
 
-        # Snapshot _row_index before the loop; restore on
-        # cancel/exception so partially-iterated rows are not
-        # silently consumed. See aio/cursor.py for rationale.
-        snapshot = self._row_index
-        result: list[tuple[Any, ...]] = []
-        try:
-            for _ in range(size):
-                row = self.fetchone()
-                if row is None:
-                    break
-                result.append(row)
-        except BaseException:
-            self._row_index = snapshot + len(result)
-            raise
-
-        return result
+        # One slice + one factory pass instead of ``size`` fetchone()
+        # calls; see ``_take_rows`` for the index-restore contract.
+        return _take_rows(self, size)
 
     def fetchall(self) -> list[tuple[Any, ...]]:
         """Fetch all remaining rows of a query result.
@@ -1578,7 +2370,7 @@ class Cursor:
         a DML returns ``[]`` rather than raising. Symmetric with
         ``fetchone`` / ``fetchmany`` parity.
         """
-        del self.messages[:]
+        _clear_messages(self)
         # See ``execute``'s prelude comment for the ordering rationale.
         self._check_closed()
         self._connection._check_thread()
@@ -1586,6 +2378,8 @@ class Cursor:
             # No result set active. Match stdlib by returning ``[]``.
             return []
 
+        _materialize_rows(self, len(self._rows))
+
         result = self._rows[self._row_index :]
         if self._row_factory is not None:
             # Apply factory BEFORE advancing ``_row_index`` so a raise
@@ -1598,15 +2392,84 @@ class Cursor:
             # sense AND surfaced no rows to the caller — an asymmetry
             # vs the sibling fetch verbs.
             try:
-                transformed = [self._row_factory(self, row) for row in result]
+                transformed = _apply_row_factory(self, self._row_factory, result)
             except BaseException:
                 # Index unchanged; raise propagates the factory error.
                 raise
             self._row_index = len(self._rows)
+            _compact_rows(self)
             return transformed
         self._row_index = len(self._rows)
+        _compact_rows(self)
         return result
 
+    def fetch_columns(self) -> dict[str, _Column]:
+        """Fetch all remaining rows column-wise.
+
+        Returns ``{column name: column}`` in ``description`` order.
+        INTEGER / FLOAT columns with no NULLs come back as compact
+        ``array.array`` (typecode ``q`` / ``d``); any other column is a
+        ``list``. The arrays expose the buffer protocol, so
+        ``memoryview(col)`` and ``numpy.frombuffer(col, dtype=...)`` view
+        them without copying.
+
+        Consumes the rows like :meth:`fetchall`. ``row_factory`` is not
+        applied — the result is column-oriented. Returns ``{}`` when no
+        result set is active; raises ``ProgrammingError`` if two
+        result columns share a name.
+        """
+        _clear_messages(self)
+        self._check_closed()
+        self._connection._check_thread()
+        if self._description is None:
+            return {}
+        columns = _pack_columns(self._description, _column_values(self))
+        self._row_index = len(self._rows)
+        _compact_rows(self)
+        return columns
+
+    def fetch_numpy(self) -> dict[str, Any]:
+        """Fetch all remaining rows as ``{column name: numpy.ndarray}``.
+
+        Requires NumPy (raises ``NotSupportedError`` if it is not
+        importable). NULL-free INTEGER / FLOAT columns are ``int64`` /
+        ``float64`` arrays built in one bulk copy; other columns are
+        ``object`` arrays. Consumes the rows like :meth:`fetchall`;
+        ``row_factory`` is not applied. Returns ``{}`` when no result
+        set is active.
+        """
+        _clear_messages(self)
+        self._check_closed()
+        self._connection._check_thread()
+        if self._description is None:
+            return {}
+        result = _columns_to_numpy(self._description, _column_values(self))
+        self._row_index = len(self._rows)
+        _compact_rows(self)
+        return result
+
+    def fetch_arrow_table(self) -> Any:
+        """Fetch all remaining rows as a ``pyarrow.Table``.
+
+        Requires pyarrow (raises ``NotSupportedError`` if it is not
+        importable). Column types follow the wire ``ValueType`` of the
+        first row: INTEGER → ``int64``, FLOAT → ``float64``, TEXT →
+        ``string``, BLOB → ``binary``, BOOLEAN → ``bool``, UNIXTIME →
+        ``timestamp[us, UTC]``; ISO8601 and all-NULL columns are
+        inferred. NULLs become Arrow nulls. Consumes the rows like
+        :meth:`fetchall`; ``row_factory`` is not applied. Returns
+        ``None`` when no result set is active.
+        """
+        _clear_messages(self)
+        self._check_closed()
+        self._connection._check_thread()
+        if self._description is None:
+            return None
+        table = _columns_to_arrow_table(self._description, _column_values(self))
+        self._row_index = len(self._rows)
+        _compact_rows(self)
+        return table
+
     def close(self) -> None:
         """Close the cursor.
 
@@ -1642,11 +2505,13 @@ class Cursor:
         # executing the call" on every standard cursor method. Every
         # other method on this class clears it as the first statement;
         # close() must too.
-        del self.messages[:]
+        _clear_messages(self)
         if self._closed:
             return
         self._closed = True
         self._rows = []
+        self._raw_row_types = None
+        self._row_offset = 0
         self._description = None
         # Scrub the remaining state fields so every post-close reader
         # sees a consistent "no operation performed" surface. Prior
@@ -1666,7 +2531,7 @@ class Cursor:
         # — and its daemon event-loop thread, ``weakref.finalize``
         # registration, and asyncio primitives — past the user's
         # intended lifetime. The connection's ``_cursors`` is already
-        # a ``WeakSet`` (cursor falls out cleanly when dropped); the
+        # weak (cursor falls out cleanly when dropped); the
         # reverse direction needs the same decoupling on close.
         # ``weakref.proxy`` preserves the public ``cursor.connection``
         # API while the Connection is alive; once the Connection is
@@ -1698,7 +2563,7 @@ class Cursor:
         # fetchmany / fetchall / close) all clear before any guard for
         # the same reason; this method and its four secondary-method
         # siblings keep the same ordering.
-        del self.messages[:]
+        _clear_messages(self)
         # Validate input shape at the public boundary even though the
         # body is a no-op. PEP 249 §6.2 expressly permits this method
         # to do nothing, but the project's input-validation discipline
@@ -1740,7 +2605,7 @@ class Cursor:
 
     def setoutputsize(self, size: int, column: int | None = None) -> None:
         """Set output size (no-op for dqlite). See ``setinputsizes``."""
-        del self.messages[:]
+        _clear_messages(self)
         # Validate input shape — see ``setinputsizes`` rationale.
         # ``ProgrammingError`` keeps the failure inside the
         # ``dbapi.Error`` hierarchy per PEP 249 §7.
@@ -1774,7 +2639,7 @@ class Cursor:
         # that clear ``Connection.messages`` / ``Cursor.messages``.
         # Clear before any guard so the contract holds even on the
         # cross-thread-rejection path. Mirrors ``nextset`` below.
-        del self.messages[:]
+        _clear_messages(self)
         # PEP 249 §6.1.2 — closed-cursor ops raise. ``_check_closed``
         # BEFORE ``_check_thread``: see ``execute``'s prelude comment
         # for the GC'd-proxy ``ReferenceError`` rationale.
@@ -1791,7 +2656,7 @@ class Cursor:
         # that clear ``Connection.messages``; clear before any guard
         # so the contract holds even on the cross-thread-rejection
         # path.
-        del self.messages[:]
+        _clear_messages(self)
         # PEP 249 §6.1.2 — closed-cursor operations raise.
         # ``_check_closed`` first; see ``execute`` for rationale.
         self._check_closed()
@@ -1810,7 +2675,7 @@ class Cursor:
         # ``setoutputsize``. Cheap and removes a latent foot-gun for
         # future code that starts populating ``messages``. Order
         # matches the secondary-method family: clear before any guard.
-        del self.messages[:]
+        _clear_messages(self)
         # ``_check_closed`` first; see ``execute`` for rationale.
         self._check_closed()
         self._connection._check_thread()
@@ -1830,7 +2695,7 @@ class Cursor:
         ``NotSupportedError`` rather than escaping ``dbapi.Error``
         as ``AttributeError``. Same shape as the
         ``Connection.executescript`` stub."""
-        del self.messages[:]
+        _clear_messages(self)
         # ``_check_closed`` first; see ``execute`` for rationale.
         self._check_closed()
         self._connection._check_thread()
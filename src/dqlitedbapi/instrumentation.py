@@ -0,0 +1,472 @@
+"""Instrumentation hooks: one structured event per driver round-trip.
+
+Listeners are plain callables taking an :class:`Event`. Register one
+process-wide with :func:`add_listener`, or for a single connection (and
+through a pool's ``connect_kwargs``, for every pooled connection) with
+``listeners=`` on ``connect()`` / ``aconnect()``::
+
+    def log_slow(event):
+        if event.duration > 0.1:
+            print(event.kind, event.fingerprint, event.duration)
+
+
+    dqlitedbapi.instrumentation.add_listener(log_slow)
+
+Events are emitted after ``execute`` / ``executemany`` (including
+result-cache hits), ``commit`` / ``rollback`` round-trips, leader
+discovery and connection establishment, on success and on error.
+``AsyncConnection.transaction()`` hands ``BEGIN`` / ``COMMIT`` to the
+client layer and emits no commit / rollback events of its own.
+Listeners run synchronously on the calling thread (sync API) or the
+event loop (async API) — keep them cheap, or hand the event off to a
+queue. An exception raised by a listener is logged and swallowed; it
+never fails the database operation.
+
+Cost when no listener is registered: one tuple truth test per
+operation. No clock is read and no event is built.
+
+``slow_query_threshold=`` on ``connect()`` / ``aconnect()`` turns on
+the slow-query log independently of listeners: an operation taking at
+least that many seconds is logged as a warning on the
+``dqlitedbapi.instrumentation.slow_query`` logger. The record (also
+attached as ``record.dqlite_slow_query``, a dict, for structured
+handlers) carries the fingerprint, the *shape* of the bound
+parameters — ``(int, str[12], NULL)``, never their values — and the
+duration split into op-lock wait, connect (leader discovery plus
+handshake, when the call had to connect), wire (send, server time,
+receive) and driver (the remainder). Rows are converted lazily by the
+fetch methods, so conversion is not part of any ``execute`` time.
+"""
+
+import functools
+import logging
+import math
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Final, NamedTuple
+
+from dqlitedbapi.exceptions import ProgrammingError
+from dqlitedbapi.result_cache import _estimate_nbytes
+
+__all__ = ["Event", "Listener", "add_listener", "fingerprint", "remove_listener"]
+
+logger = logging.getLogger(__name__)
+# Slow-query records; a child logger so it can be routed on its own.
+slow_logger = logging.getLogger(f"{__name__}.slow_query")
+
+# Rows walked for ``Event.nbytes``. Larger results are estimated from
+# an evenly spaced sample, so an observed ``execute`` costs the same
+# however many rows it buffered.
+_NBYTES_SAMPLE_ROWS: Final[int] = 64
+
+
+class Event(NamedTuple):
+    """One completed (or failed) driver operation.
+
+    ``kind`` is one of ``"execute"``, ``"executemany"``, ``"commit"``,
+    ``"rollback"``, ``"leader_discovery"`` and ``"connect"``. Times
+    are ``time.monotonic()`` seconds. Fields that do not apply to an
+    event kind are ``None``.
+    """
+
+    kind: str
+    #: ``time.monotonic()`` when the call entered the driver.
+    start: float
+    #: Seconds from ``start`` to completion, lock wait included.
+    duration: float
+    #: The address the connection was configured with (the seed).
+    address: str | None
+    sql: str | None
+    #: :func:`fingerprint` of ``sql``.
+    fingerprint: str | None
+    #: ``cursor.rowcount`` afterwards (``-1`` when not applicable).
+    rowcount: int | None
+    #: Rows in the result set buffered by the call.
+    rows: int | None
+    #: Estimated size in bytes of that result set; extrapolated from a
+    #: sample of rows for large results.
+    nbytes: int | None
+    #: Seconds spent waiting for the connection's operation lock (and,
+    #: on the sync API, for the event-loop thread to pick the call up).
+    lock_wait: float | None
+    #: True when ``execute`` was answered from the ``result_cache``.
+    cached: bool
+    #: The exception the call raised, or ``None`` on success.
+    error: BaseException | None
+    #: ``error.code`` (the SQLite / dqlite result code), when present.
+    code: int | None
+    #: Leader address found by ``"leader_discovery"`` / connected to
+    #: by ``"connect"``.
+    leader: str | None
+    #: Of ``duration``: seconds spent establishing the connection
+    #: (leader discovery + handshake) when the call had to connect.
+    connect_time: float | None = None
+    #: Of ``duration``: seconds awaiting the server (request send,
+    #: server execution, response receive and wire decode).
+    wire_time: float | None = None
+
+
+Listener = Callable[[Event], object]
+
+# Copy-on-write so the hot-path check is a single global load and
+# truth test, and emission iterates a snapshot without locking. Only
+# the read-modify-write in add / remove takes ``_LISTENERS_LOCK``, so
+# concurrent registrations are never lost.
+_LISTENERS: tuple[Listener, ...] = ()
+_LISTENERS_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def add_listener(listener: Listener) -> None:
+    """Register ``listener`` for every connection in the process."""
+    global _LISTENERS
+    if not callable(listener):
+        raise ProgrammingError(f"listener must be callable, got {type(listener).__name__}")
+    with _LISTENERS_LOCK:
+        _LISTENERS = (*_LISTENERS, listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    """Unregister ``listener``; a no-op if it is not registered."""
+    global _LISTENERS
+    with _LISTENERS_LOCK:
+        _LISTENERS = tuple(x for x in _LISTENERS if x != listener)
+
+
+def _check_listeners(listeners: Iterable[Listener] | None) -> tuple[Listener, ...]:
+    """Validate the ``listeners`` connect argument."""
+    if listeners is None:
+        return ()
+    if isinstance(listeners, str | bytes) or not isinstance(listeners, Iterable):
+        raise ProgrammingError(
+            f"listeners must be an iterable of callables, got {type(listeners).__name__}"
+        )
+    checked = tuple(listeners)
+    for listener in checked:
+        if not callable(listener):
+            raise ProgrammingError(f"listener must be callable, got {type(listener).__name__}")
+    return checked
+
+
+def _active(connection: Any) -> tuple[Listener, ...]:
+    """Every listener that observes ``connection``; empty when none."""
+    local = getattr(connection, "_listeners", ())
+    if type(local) is not tuple:
+        # ``MagicMock`` connections in unit tests.
+        local = ()
+    if _LISTENERS:
+        return _LISTENERS + local if local else _LISTENERS
+    return local
+
+
+# ``(?, ?, ?)`` of any length → ``(?+)``, and repeated rows of those →
+# ``(?+), ...``, so IN-lists and multi-row VALUES of different sizes
+# share one fingerprint.
+_PLACEHOLDER_LIST_RE: Final[re.Pattern[str]] = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_PLACEHOLDER_ROWS_RE: Final[re.Pattern[str]] = re.compile(r"\(\?\+\)(?:\s*,\s*\(\?\+\))+")
+_SPACES_RE: Final[re.Pattern[str]] = re.compile(r"  +")
+
+
+@functools.cache
+def _fingerprint_re() -> re.Pattern[str]:
+    """The cursor's ``_SQL_NOISE_RE`` extended with numeric / blob literals.
+
+    Built on first use: ``dqlitedbapi.cursor`` imports this module, so
+    the import has to be deferred (same pattern as
+    ``connection._build_and_connect``'s classifier import). One shared
+    tokeniser means a fingerprint never disagrees with the statement
+    classifier about where a string literal or quoted identifier ends.
+    """
+    from dqlitedbapi.cursor import _SQL_NOISE_RE
+
+    return re.compile(
+        _SQL_NOISE_RE.pattern
+        + r"""
+        | [xX]'[0-9a-fA-F]*'    # blob literal
+        | \b(?:0[xX][0-9a-fA-F]+|\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)\b
+        | (?<![\w.])\.\d+\b     # numeric literal
+        | \s+
+        """,
+        _SQL_NOISE_RE.flags,
+    )
+
+
+def _fingerprint_token(match: re.Match[str]) -> str:
+    text = match.group()
+    head = text[0]
+    if head in '"[`':
+        # Quoted identifier: part of the statement's shape.
+        return text
+    if head in "-/" or head.isspace():
+        return " "
+    return "?"
+
+
+@functools.lru_cache(maxsize=1024)
+def fingerprint(sql: str) -> str:
+    """Normalise ``sql`` so statements differing only in literals match.
+
+    Literal values become ``?``, comments and whitespace runs collapse,
+    and placeholder lists of any length fold to ``(?+)``::
+
+        >>> fingerprint("SELECT * FROM t WHERE id IN (1, 2, 3) -- hot")
+        'SELECT * FROM t WHERE id IN (?+)'
+    """
+    out = _SPACES_RE.sub(" ", _fingerprint_re().sub(_fingerprint_token, sql)).strip()
+    out = _PLACEHOLDER_LIST_RE.sub("(?+)", out)
+    return _PLACEHOLDER_ROWS_RE.sub("(?+), ...", out)
+
+
+def _emit(listeners: tuple[Listener, ...], event: Event) -> None:
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception:
+            logger.warning(
+                "dqlitedbapi instrumentation listener %r raised", listener, exc_info=True
+            )
+
+
+def _param_shape(params: Any) -> str | None:
+    """Redacted shape of one parameter sequence: types and sizes only."""
+    if params is None:
+        return None
+    if isinstance(params, str | bytes) or not isinstance(params, Sequence):
+        return type(params).__name__
+    parts = []
+    for value in params:
+        if value is None:
+            parts.append("NULL")
+        elif isinstance(value, str | bytes | bytearray | memoryview):
+            parts.append(f"{type(value).__name__}[{len(value)}]")
+        else:
+            parts.append(type(value).__name__)
+    return f"({', '.join(parts)})"
+
+
+def _batch_shape(seq_of_parameters: Any) -> str | None:
+    """Redacted shape of an ``executemany`` batch: ``2 x (int, str[3])``.
+
+    The first parameter set stands for the batch. An iterator's length
+    is unknown and it has been consumed, so only its type is shown.
+    """
+    if seq_of_parameters is None:
+        return None
+    if isinstance(seq_of_parameters, str | bytes) or not isinstance(seq_of_parameters, Sequence):
+        return type(seq_of_parameters).__name__
+    if not seq_of_parameters:
+        return "0 x ()"
+    return f"{len(seq_of_parameters)} x {_param_shape(seq_of_parameters[0])}"
+
+
+def _log_slow(event: Event, params: Any, threshold: float) -> None:
+    connect = event.connect_time or 0.0
+    wire = event.wire_time or 0.0
+    lock_wait = event.lock_wait or 0.0
+    record = {
+        "kind": event.kind,
+        "fingerprint": event.fingerprint,
+        "params": _batch_shape(params) if event.kind == "executemany" else _param_shape(params),
+        "duration": event.duration,
+        "threshold": threshold,
+        "lock_wait": lock_wait,
+        "connect": connect,
+        "wire": wire,
+        "driver": max(event.duration - lock_wait - connect - wire, 0.0),
+        "rowcount": event.rowcount,
+        "rows": event.rows,
+        "code": event.code,
+        "address": event.address,
+    }
+    slow_logger.warning(
+        "slow %s (%.3fs >= %.3fs): %s params=%s lock_wait=%.3fs connect=%.3fs "
+        "wire=%.3fs driver=%.3fs",
+        event.kind,
+        event.duration,
+        threshold,
+        event.fingerprint,
+        record["params"],
+        lock_wait,
+        connect,
+        wire,
+        record["driver"],
+        extra={"dqlite_slow_query": record},
+    )
+
+
+class _Span:
+    """An operation being timed; ``finish`` emits its :class:`Event`.
+
+    Spans for connection operations are *bound* to the connection
+    (``connection._active_span``) while the operation holds its lock,
+    so the lock stamp in ``Connection._run_sync`` and the phase timers
+    in the cursor's wire paths find them without threading an extra
+    argument through.
+    """
+
+    __slots__ = (
+        "_connection",
+        "_listeners",
+        "_phase_start",
+        "_slow_threshold",
+        "address",
+        "connect_time",
+        "kind",
+        "lock_wait",
+        "params",
+        "sql",
+        "start",
+        "wire_time",
+    )
+
+    def __init__(
+        self,
+        listeners: tuple[Listener, ...],
+        kind: str,
+        connection: Any,
+        sql: str | None,
+        address: str | None = None,
+        *,
+        params: Any = None,
+        slow_threshold: float | None = None,
+    ) -> None:
+        self._listeners = listeners
+        self._connection = connection
+        self._slow_threshold = slow_threshold
+        if address is None:
+            address = getattr(connection, "_address", None)
+        self.address = address if isinstance(address, str) else None
+        self.kind = kind
+        self.sql = sql
+        self.params = params
+        self.lock_wait: float | None = None
+        self.connect_time: float | None = None
+        self.wire_time: float | None = None
+        self._phase_start = 0.0
+        self.start = time.monotonic()
+
+    def bind(self) -> None:
+        """Publish this span as the connection's in-flight operation."""
+        self._connection._active_span = self
+
+    def locked(self) -> None:
+        """Mark the moment the operation lock was acquired (and bind)."""
+        self.lock_wait = time.monotonic() - self.start
+        self._connection._active_span = self
+
+    def phase_begin(self) -> None:
+        self._phase_start = time.monotonic()
+
+    def phase_end(self, phase: str) -> None:
+        """Add the time since ``phase_begin`` to ``connect`` or ``wire``."""
+        elapsed = time.monotonic() - self._phase_start
+        if phase == "wire":
+            self.wire_time = (self.wire_time or 0.0) + elapsed
+        else:
+            self.connect_time = (self.connect_time or 0.0) + elapsed
+
+    def finish(
+        self,
+        cursor: Any = None,
+        *,
+        error: BaseException | None = None,
+        cached: bool = False,
+        leader: str | None = None,
+    ) -> None:
+        end = time.monotonic()
+        connection = self._connection
+        if getattr(connection, "_active_span", None) is self:
+            connection._active_span = None
+        rowcount = rows = nbytes = None
+        if cursor is not None:
+            rowcount = cursor._rowcount
+            if cursor._description is not None:
+                buffered = cursor._rows
+                rows = len(buffered)
+                nbytes = _sampled_nbytes(buffered)
+        sql = self.sql
+        code = getattr(error, "code", None) if error is not None else None
+        event = Event(
+            kind=self.kind,
+            start=self.start,
+            duration=end - self.start,
+            address=self.address,
+            sql=sql,
+            fingerprint=fingerprint(sql) if sql is not None else None,
+            rowcount=rowcount,
+            rows=rows,
+            nbytes=nbytes,
+            lock_wait=self.lock_wait,
+            cached=cached,
+            error=error,
+            code=code if isinstance(code, int) else None,
+            leader=leader,
+            connect_time=self.connect_time,
+            wire_time=self.wire_time,
+        )
+        if self._listeners:
+            _emit(self._listeners, event)
+        threshold = self._slow_threshold
+        if threshold is not None and event.duration >= threshold:
+            _log_slow(event, self.params, threshold)
+
+
+def _sampled_nbytes(rows: Sequence[Sequence[Any]]) -> int:
+    """``_estimate_nbytes`` in bounded time: past ``_NBYTES_SAMPLE_ROWS``
+    rows, an evenly spaced sample is walked and scaled up."""
+    count = len(rows)
+    if count <= _NBYTES_SAMPLE_ROWS:
+        return _estimate_nbytes(rows)
+    sample = rows[:: count // _NBYTES_SAMPLE_ROWS]
+    return _estimate_nbytes(sample) * count // len(sample)
+
+
+def _span(
+    connection: Any,
+    kind: str,
+    sql: str | None = None,
+    params: Any = None,
+    *,
+    bind: bool = False,
+) -> _Span | None:
+    """Start timing an operation on ``connection``; ``None`` if unobserved.
+
+    Observed means a listener is registered or the connection has a
+    ``slow_query_threshold``. ``bind`` publishes the span on the
+    connection straight away (sync API, where the caller's thread owns
+    the connection); the async API binds once ``op_lock`` is held.
+    """
+    listeners = _active(connection)
+    threshold = getattr(connection, "_slow_query_threshold", None)
+    if type(threshold) is not float:
+        threshold = None
+    if not listeners and threshold is None:
+        return None
+    span = _Span(listeners, kind, connection, sql, params=params, slow_threshold=threshold)
+    if bind:
+        span.bind()
+    return span
+
+
+def _bound_span(connection: Any) -> _Span | None:
+    """The span of the operation ``connection`` is running, if observed."""
+    span = getattr(connection, "_active_span", None)
+    return span if type(span) is _Span else None
+
+
+def _check_slow_query_threshold(threshold: object) -> float | None:
+    """Validate the ``slow_query_threshold`` connect argument."""
+    if threshold is None:
+        return None
+    if (
+        isinstance(threshold, bool)
+        or not isinstance(threshold, int | float)
+        or not math.isfinite(threshold)
+        or threshold < 0
+    ):
+        raise ProgrammingError(
+            f"slow_query_threshold must be a non-negative number of seconds or None, "
+            f"got {threshold!r}"
+        )
+    return float(threshold)
@@ -0,0 +1,253 @@
+"""Opt-in background leader watcher.
+
+Without it, leader discovery is lazy: every connection learns about a
+leader change on its own, by failing a statement (or a connect) and
+rediscovering through the process-wide leader-discovery cache. With
+it, one task on a shared event-loop thread keeps that cache current::
+
+    dqlitedbapi.leader_watch.enable(interval=5.0)
+
+Every ``interval`` seconds — and immediately after any connection in
+the process sees a leader-class error — the watcher resolves the
+leader of every cluster in the leader-discovery cache, one probe
+sweep per configuration, and writes the answer into the
+``ClusterClient`` leader hint of every cache entry for it (each event
+loop has its own entry). Connections opened afterwards go straight
+to the new leader instead of first probing the deposed one.
+
+When a cluster's leader changes, idle connections in every
+:class:`~dqlitedbapi.pool.ConnectionPool` /
+:class:`~dqlitedbapi.aio.pool.AsyncPool` seeded with (any of) that
+cluster's addresses that are still bound to another node are closed
+right away, and checked-out ones are discarded on release rather than
+returned to the pool; the next borrower connects to the new leader
+instead of failing on the old one.
+
+The watcher costs one ``LEADER`` round-trip per cluster per
+interval. Fork: a child process does not inherit a running watcher;
+call :func:`enable` again there.
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import logging
+import math
+import threading
+import weakref
+from typing import Any, Final
+
+from dqliteclient import get_current_pid
+from dqlitedbapi import cursor as _cursor
+from dqlitedbapi.connection import (
+    _RESOLVE_LEADER_CACHE,
+    _RESOLVE_LEADER_CACHE_LOCK,
+    _acquire_shared_loop,
+    _LoopRunner,
+    _release_shared_loop,
+    _resolve_leader,
+)
+from dqlitedbapi.exceptions import ProgrammingError
+
+__all__ = ["disable", "enable", "enabled", "leaders"]
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_INTERVAL: Final[float] = 5.0
+# Re-sweep delay while some cluster has no reachable leader (an
+# election in progress), so the new leader is picked up within a
+# fraction of a second rather than a full interval.
+_ELECTION_RECHECK: Final[float] = 0.25
+_STOP_TIMEOUT: Final[float] = 5.0
+
+# Pools seeded with a cluster address, for recycling on a leader
+# change. Pools register themselves at construction, from any thread,
+# so additions and snapshots go through ``_POOLS_LOCK`` (a ``WeakSet``
+# raises if it changes size while being iterated).
+_POOLS: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_POOLS_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+class _Watcher:
+    """The running watcher: its loop runner, task and last sightings."""
+
+    __slots__ = ("interval", "leaders", "pid", "runner", "task", "wake")
+
+    def __init__(self, runner: _LoopRunner, interval: float) -> None:
+        self.runner = runner
+        self.interval = interval
+        self.pid = get_current_pid()
+        # Seed address -> leader address, as of the last sweep.
+        self.leaders: dict[str, str] = {}
+        self.wake = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+
+    def signal(self) -> None:
+        """Request an immediate sweep; safe from any thread or loop."""
+        with contextlib.suppress(RuntimeError):
+            self.runner.loop.call_soon_threadsafe(self.wake.set)
+
+    async def start(self) -> None:
+        self.task = asyncio.create_task(self.run(), name="dqlitedbapi-leader-watch")
+
+    async def stop(self) -> None:
+        task = self.task
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def run(self) -> None:
+        while True:
+            self.wake.clear()
+            try:
+                settled = await self.sweep()
+            except Exception:
+                logger.warning("leader watch: sweep failed", exc_info=True)
+                settled = True
+            delay = self.interval if settled else min(self.interval, _ELECTION_RECHECK)
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(delay):
+                    await self.wake.wait()
+
+    async def sweep(self) -> bool:
+        """Refresh every cached cluster's leader hint; ``False`` if some
+        cluster had no reachable leader."""
+        own_loop = id(asyncio.get_running_loop())
+        with _RESOLVE_LEADER_CACHE_LOCK:
+            entries = list(_RESOLVE_LEADER_CACHE.items())
+        configs: dict[tuple[Any, ...], list[Any]] = {}
+        in_use: set[tuple[Any, ...]] = set()
+        for key, cluster in entries:
+            configs.setdefault(key[1:], []).append(cluster)
+            # A configuration only the watcher's own lookups keep in
+            # the cache has no users left; stop probing it.
+            if key[0] != own_loop:
+                in_use.add(key[1:])
+        results = await asyncio.gather(
+            *(self.refresh(config, configs[config]) for config in in_use)
+        )
+        return all(results)
+
+    async def refresh(self, config: tuple[Any, ...], clusters: list[Any]) -> bool:
+        address, timeout, max_total_rows, max_continuation_frames, trust = config
+        try:
+            leader = await _resolve_leader(
+                address,
+                timeout=timeout,
+                max_total_rows=max_total_rows,
+                max_continuation_frames=max_continuation_frames,
+                trust_server_heartbeat=trust,
+            )
+        except Exception as e:
+            logger.debug("leader watch: no leader for %s (%s)", address, e)
+            return False
+        for cluster in clusters:
+            cluster._set_last_known_leader(leader)
+        previous = self.leaders.get(address)
+        self.leaders[address] = leader
+        if previous is not None and previous != leader:
+            logger.info("leader watch: %s leader moved %s -> %s", address, previous, leader)
+            # Recycling takes pool locks a borrowing thread may hold and
+            # closes sockets; keep both off the loop every cluster's
+            # refresh shares.
+            await asyncio.to_thread(_recycle_pools, address, leader)
+        return True
+
+
+def _recycle_pools(address: str, leader: str) -> None:
+    """Recycle the pools seeded with ``address`` after its leader moved."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS)
+    for pool in pools:
+        if address in pool._address.split(","):
+            try:
+                pool._recycle_demoted(leader)
+            except Exception:
+                logger.debug("leader watch: recycling %r failed", pool, exc_info=True)
+
+
+_WATCHER: _Watcher | None = None
+_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def _current() -> _Watcher | None:
+    watcher = _WATCHER
+    if watcher is None or watcher.pid != get_current_pid():
+        return None
+    return watcher
+
+
+def enable(*, interval: float = _DEFAULT_INTERVAL) -> None:
+    """Start the process-wide watcher, or change its interval.
+
+    Args:
+        interval: Seconds between sweeps. A leader-class error seen by
+            any connection triggers a sweep early. Must be positive
+            and finite.
+    """
+    global _WATCHER
+    if (
+        isinstance(interval, bool)
+        or not isinstance(interval, int | float)
+        or not math.isfinite(interval)
+        or interval <= 0
+    ):
+        raise ProgrammingError(f"interval must be a positive finite number, got {interval!r}")
+    with _LOCK:
+        watcher = _current()
+        if watcher is not None:
+            watcher.interval = float(interval)
+            watcher.signal()
+            return
+        runner = _acquire_shared_loop()
+        watcher = _Watcher(runner, float(interval))
+        asyncio.run_coroutine_threadsafe(watcher.start(), runner.loop).result()
+        _WATCHER = watcher
+        _cursor._leader_error_hook = watcher.signal
+
+
+def disable() -> None:
+    """Stop the watcher and release its loop thread. Idempotent."""
+    global _WATCHER
+    with _LOCK:
+        watcher, _WATCHER = _WATCHER, None
+        _cursor._leader_error_hook = None
+    if watcher is None or watcher.pid != get_current_pid():
+        return
+    with contextlib.suppress(concurrent.futures.TimeoutError):
+        asyncio.run_coroutine_threadsafe(watcher.stop(), watcher.runner.loop).result(
+            timeout=_STOP_TIMEOUT
+        )
+    _release_shared_loop(watcher.runner, join_timeout=_STOP_TIMEOUT)
+
+
+def enabled() -> bool:
+    """Whether the watcher runs in this process."""
+    return _current() is not None
+
+
+def leaders() -> dict[str, str]:
+    """Seed address -> leader address, as of the watcher's last sweep."""
+    watcher = _current()
+    return dict(watcher.leaders) if watcher is not None else {}
+
+
+def _register_pool(pool: Any) -> None:
+    """Make ``pool`` eligible for recycling on a leader change. The
+    pool must have ``_address`` and a thread-safe
+    ``_recycle_demoted(leader)``."""
+    with _POOLS_LOCK:
+        _POOLS.add(pool)
+
+
+def _demoted(address: str, conn: Any) -> bool:
+    """``True`` if the watcher knows the leader of the cluster seeded
+    by ``address`` (one seed or a comma-separated list) and ``conn``
+    is bound to a different node."""
+    watcher = _current()
+    if watcher is None:
+        return False
+    leader = next((watcher.leaders[s] for s in address.split(",") if s in watcher.leaders), None)
+    client = conn._async_conn
+    return leader is not None and client is not None and client._address != leader
@@ -0,0 +1,472 @@
+"""Thread-aware connection pool for direct (non-SQLAlchemy) sync users.
+
+SQLAlchemy users already get a production pool (``QueuePool``) over
+dbapi ``Connection`` objects; this module is for everyone else, who
+would otherwise hand-roll one and pay leader discovery plus the
+handshake far more often than necessary.
+
+``threadsafety = 1``: a ``Connection`` may only be used from the
+thread that created it. The pool therefore keeps idle connections in
+per-thread buckets and only ever hands a thread a connection that
+thread created. ``max_size`` bounds the total across all threads; when
+the pool is full and the calling thread has nothing idle, an idle
+connection owned by another thread is force-closed to make room
+(``Connection.force_close_transport`` is the one teardown that is safe
+from a foreign thread).
+"""
+
+import contextlib
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from types import TracebackType
+from typing import Any, NoReturn, Self
+
+from dqliteclient import get_current_pid
+from dqlitedbapi import leader_watch as _leader_watch
+from dqlitedbapi.connection import Connection, _normalize_address, _validate_timeout
+from dqlitedbapi.exceptions import Error, InterfaceError, OperationalError, ProgrammingError
+
+__all__ = ["ConnectionPool"]
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledConnection:
+    """Pool bookkeeping for one ``Connection``."""
+
+    __slots__ = ("conn", "created_at", "last_used", "thread")
+
+    def __init__(self, conn: Connection, thread: threading.Thread) -> None:
+        self.conn = conn
+        self.thread = thread
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+def _validate_optional_seconds(value: float | None, name: str) -> None:
+    """``None`` disables; anything else must be a positive finite number."""
+    if value is None:
+        return
+    try:
+        _validate_timeout(value)
+    except ProgrammingError as e:
+        raise ProgrammingError(f"{name} must be a positive finite number or None") from e
+
+
+class ConnectionPool:
+    """Pool of sync :class:`~dqlitedbapi.Connection` objects.
+
+    Use :meth:`acquire` as a context manager::
+
+        pool = ConnectionPool("10.0.0.1:9001", max_size=8, pre_ping=True)
+        with pool.acquire() as conn:
+            conn.execute("INSERT INTO t VALUES (?)", (1,))
+
+    On release the pool rolls back an open transaction (it never
+    commits on the caller's behalf) and discards the connection if the
+    rollback fails. Connections past ``max_lifetime`` are recycled;
+    idle ones past ``max_idle`` — and idle ones whose creating thread
+    has exited — are evicted, never dropping the pool below
+    ``min_size``.
+
+    Fork: a pool inherited by a forked child discards the parent's
+    connections (their sockets belong to the parent) and starts over
+    with a fresh lock; unlike a bare ``Connection`` it stays usable.
+
+    With :mod:`dqlitedbapi.leader_watch` enabled, connections bound to
+    a node that has lost leadership are closed (idle) or discarded on
+    release (checked out) instead of being reused.
+    """
+
+    def __init__(
+        self,
+        address: str | Sequence[str],
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        acquire_timeout: float = 30.0,
+        max_idle: float | None = 600.0,
+        max_lifetime: float | None = 3600.0,
+        pre_ping: bool = False,
+        **connect_kwargs: Any,
+    ) -> None:
+        """Create the pool and open ``min_size`` connections.
+
+        Args:
+            address: Node address in "host:port" format, or a list /
+                comma-separated string of seeds, forwarded to
+                every :class:`Connection`.
+            min_size: Connections opened at construction; idle
+                eviction never shrinks the pool below this. They are
+                opened in, and bound to, the constructing thread: only
+                that thread can reuse them. Other threads open their
+                own and reclaim these slots only once ``max_size`` is
+                reached (or the constructing thread exits), so for a
+                pool built on one thread and used from workers, leave
+                this at 0.
+            max_size: Upper bound on open connections across all
+                threads.
+            acquire_timeout: Seconds :meth:`acquire` waits for a free
+                slot before raising ``OperationalError``.
+            max_idle: Seconds an idle connection may sit unused before
+                it is closed. ``None`` disables idle eviction.
+            max_lifetime: Seconds after which a connection is recycled
+                on its next checkout or release. ``None`` disables.
+            pre_ping: Run ``SELECT 1`` on every checkout of a reused
+                connection and transparently replace it if the
+                round-trip fails (e.g. after a leader flip or a server
+                restart).
+            **connect_kwargs: Forwarded to :class:`Connection`
+                (``database``, ``timeout``, ``shared_loop``, ...).
+        """
+        if isinstance(max_size, bool) or not isinstance(max_size, int) or max_size < 1:
+            raise ProgrammingError(f"max_size must be a positive int, got {max_size!r}")
+        if isinstance(min_size, bool) or not isinstance(min_size, int) or min_size < 0:
+            raise ProgrammingError(f"min_size must be a non-negative int, got {min_size!r}")
+        if min_size > max_size:
+            raise ProgrammingError(f"min_size ({min_size}) must not exceed max_size ({max_size})")
+        _validate_optional_seconds(acquire_timeout, "acquire_timeout")
+        _validate_optional_seconds(max_idle, "max_idle")
+        _validate_optional_seconds(max_lifetime, "max_lifetime")
+        # Surface a typoed Connection kwarg here, not at the first
+        # acquire from some worker thread.
+        try:
+            inspect.signature(Connection).bind(address, **connect_kwargs)
+        except TypeError as e:
+            raise ProgrammingError(f"invalid Connection argument: {e}") from e
+        self._address = _normalize_address(address)
+        self._connect_kwargs = connect_kwargs
+        self._min_size = min_size
+        self._max_size = max_size
+        self._acquire_timeout = acquire_timeout
+        self._max_idle = max_idle
+        self._max_lifetime = max_lifetime
+        self._pre_ping = pre_ping
+        self._closed = False
+        self._reset_state()
+        _leader_watch._register_pool(self)
+        opened: list[_PooledConnection] = []
+        try:
+            for _ in range(min_size):
+                with self._lock:
+                    self._size += 1
+                opened.append(self._open())
+        except BaseException:
+            # All-or-nothing warmup, like ``AsyncPool.start``: the
+            # failed open already released its slot; close the rest
+            # rather than leaving them to the GC-time ResourceWarning.
+            with self._lock:
+                self._size -= len(opened)
+            for rec in opened:
+                self._discard(rec)
+            raise
+        for rec in opened:
+            self._idle.setdefault(rec.thread.ident or 0, []).append(rec)
+
+    def _reset_state(self) -> None:
+        """(Re)initialise every piece of per-process pool state."""
+        self._creator_pid = get_current_pid()
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        # Idle connections keyed by creating-thread ident. Each bucket
+        # is LIFO so the hottest (most recently used) connection is
+        # reused first and the coldest ages out under ``max_idle``.
+        self._idle: dict[int, list[_PooledConnection]] = {}
+        self._checked_out: dict[int, _PooledConnection] = {}
+        # Open connections plus in-flight opens (reserved slots).
+        self._size = 0
+
+    def _check_fork(self) -> None:
+        if get_current_pid() == self._creator_pid:
+            return
+        # Every inherited ``Connection`` still carries the parent's
+        # ``_creator_pid``; its ``close()`` is the quiet fork-branch
+        # no-op, which is exactly what we want for sockets the parent
+        # still owns. The inherited lock may have been held by a
+        # parent thread at fork time, so it is replaced, not reused.
+        inherited = [rec for bucket in self._idle.values() for rec in bucket]
+        inherited.extend(self._checked_out.values())
+        self._reset_state()
+        for rec in inherited:
+            with contextlib.suppress(Exception):
+                rec.conn.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (idle and checked out)."""
+        return self._size
+
+    def _open(self) -> _PooledConnection:
+        """Open a connection for an already-reserved slot."""
+        try:
+            conn = Connection(self._address, **self._connect_kwargs)
+            try:
+                conn.connect()
+            except BaseException:
+                with contextlib.suppress(Exception):
+                    conn.close()
+                raise
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+                self._available.notify()
+            raise
+        return _PooledConnection(conn, threading.current_thread())
+
+    def _discard(self, rec: _PooledConnection) -> None:
+        """Close a connection the pool no longer tracks (slot already freed)."""
+        conn = rec.conn
+        try:
+            if rec.thread is threading.current_thread():
+                conn.close()
+            else:
+                conn.force_close_transport()
+        except Exception:
+            logger.debug("ConnectionPool: error closing %r", conn, exc_info=True)
+            with contextlib.suppress(Exception):
+                conn.force_close_transport()
+
+    def _expired(self, rec: _PooledConnection, now: float) -> bool:
+        return self._max_lifetime is not None and now - rec.created_at >= self._max_lifetime
+
+    def _sweep_locked(self, now: float) -> list[_PooledConnection]:
+        """Unlink idle connections that are stale or orphaned; caller
+        holds the lock and closes the returned records after
+        releasing it."""
+        victims: list[_PooledConnection] = []
+        for ident in list(self._idle):
+            bucket = self._idle[ident]
+            keep = []
+            for rec in bucket:
+                orphaned = not rec.thread.is_alive()
+                stale = self._max_idle is not None and now - rec.last_used >= self._max_idle
+                if (
+                    orphaned
+                    or self._expired(rec, now)
+                    or (stale and self._size - len(victims) > self._min_size)
+                ):
+                    victims.append(rec)
+                else:
+                    keep.append(rec)
+            if keep:
+                self._idle[ident] = keep
+            else:
+                del self._idle[ident]
+        self._size -= len(victims)
+        if victims:
+            self._available.notify(len(victims))
+        return victims
+
+    def _steal_foreign_idle_locked(self, ident: int) -> _PooledConnection | None:
+        """Unlink the least recently used idle connection owned by
+        another thread, freeing its slot for the caller."""
+        oldest: _PooledConnection | None = None
+        for owner, bucket in self._idle.items():
+            if (
+                owner != ident
+                and bucket
+                and (oldest is None or bucket[0].last_used < oldest.last_used)
+            ):
+                oldest = bucket[0]
+        if oldest is None:
+            return None
+        bucket = self._idle[oldest.thread.ident or 0]
+        bucket.remove(oldest)
+        if not bucket:
+            del self._idle[oldest.thread.ident or 0]
+        self._size -= 1
+        return oldest
+
+    def _checkout(self) -> Connection:
+        self._check_fork()
+        if self._closed:
+            raise InterfaceError(f"Pool is closed (id={id(self)})")
+        ident = threading.get_ident()
+        deadline = time.monotonic() + self._acquire_timeout
+        while True:
+            reused: _PooledConnection | None = None
+            victims: list[_PooledConnection] = []
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise InterfaceError(f"Pool is closed (id={id(self)})")
+                    now = time.monotonic()
+                    victims.extend(self._sweep_locked(now))
+                    bucket = self._idle.get(ident)
+                    if bucket:
+                        reused = bucket.pop()
+                        if not bucket:
+                            del self._idle[ident]
+                        break
+                    if self._size >= self._max_size:
+                        stolen = self._steal_foreign_idle_locked(ident)
+                        if stolen is not None:
+                            victims.append(stolen)
+                    if self._size < self._max_size:
+                        self._size += 1  # reserve; opened below
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise OperationalError(
+                            f"timed out after {self._acquire_timeout}s waiting for a "
+                            f"pooled connection (max_size={self._max_size})"
+                        )
+                    self._available.wait(remaining)
+            for victim in victims:
+                self._discard(victim)
+            if reused is None:
+                rec = self._open()
+                break
+            if self._healthy(reused):
+                rec = reused
+                break
+            with self._lock:
+                self._size -= 1
+                self._available.notify()
+            self._discard(reused)
+        with self._lock:
+            self._checked_out[id(rec.conn)] = rec
+        return rec.conn
+
+    def _healthy(self, rec: _PooledConnection) -> bool:
+        if rec.conn.closed or self._expired(rec, time.monotonic()):
+            return False
+        if _leader_watch._demoted(self._address, rec.conn):
+            return False
+        if not self._pre_ping:
+            return True
+        try:
+            cur = rec.conn.cursor()
+            try:
+                cur.execute("SELECT 1")
+            finally:
+                cur.close()
+        except Error:
+            logger.debug("ConnectionPool: pre-ping failed for %r", rec.conn, exc_info=True)
+            return False
+        return True
+
+    def _checkin(self, conn: Connection) -> None:
+        self._check_fork()
+        with self._lock:
+            rec = self._checked_out.pop(id(conn), None)
+        if rec is None or rec.conn is not conn:
+            raise ProgrammingError("connection was not checked out from this pool")
+        keep = (
+            not self._closed
+            and not conn.closed
+            and not self._expired(rec, time.monotonic())
+            and not _leader_watch._demoted(self._address, conn)
+        )
+        if keep and rec.thread is not threading.current_thread():
+            # Returned from a foreign thread: it cannot be reset (or
+            # ever used) here, and its owner may be gone.
+            keep = False
+        if keep:
+            try:
+                # Never hand the next borrower someone else's open
+                # transaction. ``in_transaction`` is a local flag; the
+                # rollback is a round-trip only when one is open.
+                if conn.in_transaction:
+                    conn.rollback()
+            except Error:
+                logger.debug("ConnectionPool: reset failed for %r", conn, exc_info=True)
+                keep = False
+        with self._lock:
+            if keep and not self._closed:
+                rec.last_used = time.monotonic()
+                self._idle.setdefault(threading.get_ident(), []).append(rec)
+                self._available.notify()
+                return
+            self._size -= 1
+            self._available.notify()
+        self._discard(rec)
+
+    def _recycle_demoted(self, leader: str) -> None:
+        """Close idle connections bound to a node other than ``leader``.
+
+        Called by the leader watcher from a worker thread (never its
+        loop thread); the victims are torn down with
+        ``force_close_transport``.
+        """
+        if get_current_pid() != self._creator_pid:
+            return
+        victims: list[_PooledConnection] = []
+        with self._lock:
+            for ident in list(self._idle):
+                bucket = self._idle[ident]
+                keep = []
+                for rec in bucket:
+                    client = rec.conn._async_conn
+                    if client is not None and client._address != leader:
+                        victims.append(rec)
+                    else:
+                        keep.append(rec)
+                if keep:
+                    self._idle[ident] = keep
+                else:
+                    del self._idle[ident]
+            self._size -= len(victims)
+            if victims:
+                self._available.notify(len(victims))
+        for rec in victims:
+            self._discard(rec)
+
+    @contextlib.contextmanager
+    def acquire(self) -> Iterator[Connection]:
+        """Check a connection out for the duration of the ``with`` block.
+
+        The block may ``commit()``; anything left uncommitted is rolled
+        back on release.
+        """
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._checkin(conn)
+
+    def close(self) -> None:
+        """Close idle connections and refuse further checkouts.
+
+        Connections still checked out are closed when released.
+        Idempotent.
+        """
+        self._check_fork()
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            idle = [rec for bucket in self._idle.values() for rec in bucket]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._available.notify_all()
+        for rec in idle:
+            self._discard(rec)
+
+    def __repr__(self) -> str:
+        state = "closed" if self._closed else f"size={self._size}/{self._max_size}"
+        return f"<ConnectionPool address={self._address!r} {state}>"
+
+    def __reduce__(self) -> NoReturn:
+        raise TypeError(
+            f"cannot pickle {type(self).__name__!r} object — it owns live "
+            "connections; build a new pool in the consumer process instead"
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,359 @@
+"""Opt-in client-side cache of read-only query results.
+
+Read-mostly reference tables tend to be queried with the same handful
+of ``SELECT`` statements thousands of times per second, and every one
+of them is a round-trip to the Raft leader. A :class:`ResultCache`
+passed as ``result_cache=`` to ``connect()`` / ``aconnect()`` (or to a
+pool, which forwards it to every connection) answers repeats from
+memory::
+
+    cache = ResultCache(ttl=2.0, max_bytes=16 * 1024 * 1024)
+    conn = dqlitedbapi.connect("127.0.0.1:9001", result_cache=cache)
+    conn.cursor().execute("SELECT * FROM countries")  # server
+    conn.cursor().execute("SELECT * FROM countries")  # cache
+
+What is cached: statements the cursor classifies as a pure read — a
+leading ``SELECT`` / ``VALUES``, possibly behind a ``WITH`` clause,
+and not DML with ``RETURNING`` — executed outside an explicit
+transaction, that calls no volatile SQL function (``random()``,
+``changes()``, ``last_insert_rowid()``, ``CURRENT_TIMESTAMP``,
+``date('now')`` and friends). Entries are keyed on the cluster address
+(seed list), the database name, the SQL text and
+the converted bind parameters (type-tagged, so ``1`` and ``1.0`` do
+not collide), hold the raw wire rows, and are converted afresh by the
+fetch verbs on every hit, so ``row_factory`` and the cursor's own
+state behave exactly as on a miss.
+
+Invalidation: every DML / DDL statement executed through *any*
+connection in the process invalidates the entries of every live cache
+that mention the tables it writes; writes inside an explicit
+transaction are invalidated again when it ends. A write whose target
+cannot be determined (DDL, ``VACUUM``, an unparseable statement)
+clears every cache. What the driver cannot see — writes from other
+processes or cluster clients, trigger side effects on other tables,
+views over a written table, user-defined volatile functions — is
+bounded only by ``ttl``; pass ``use_cache=False`` to ``execute`` for
+statements that must always reach the server.
+
+Budget: entries are LRU-evicted once their estimated size exceeds
+``max_bytes``. A single result larger than the budget is not cached.
+"""
+
+import math
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Any, Final, NamedTuple
+
+from dqlitedbapi.exceptions import ProgrammingError
+from dqlitedbapi.types import _Description
+
+__all__ = ["ResultCache"]
+
+_DEFAULT_TTL: Final[float] = 5.0
+_DEFAULT_MAX_BYTES: Final[int] = 32 * 1024 * 1024
+
+# Size-estimate constants: CPython list header plus pointer per row,
+# and a nominal per-cell object cost on top of str / bytes payloads.
+# The estimate only has to be proportionate, not exact.
+_ROW_OVERHEAD_BYTES: Final[int] = 64
+_CELL_OVERHEAD_BYTES: Final[int] = 24
+
+
+class _CachedResult(NamedTuple):
+    """One cached result set, in the shape ``execute`` buffers it."""
+
+    description: _Description
+    rows: list[list[Any]]
+    row_types: list[list[int]]
+    column_types: list[int]
+
+
+class _Entry:
+    __slots__ = ("expires", "nbytes", "result", "tables")
+
+    def __init__(
+        self, expires: float, nbytes: int, result: _CachedResult, tables: frozenset[str]
+    ) -> None:
+        self.expires = expires
+        self.nbytes = nbytes
+        self.result = result
+        self.tables = tables
+
+
+# Every live cache, so a write through a connection that has no cache
+# of its own (or a different one) still invalidates them all. Caches
+# are created and writes land on any thread, so additions and
+# snapshots go through ``_LIVE_CACHES_LOCK`` (a ``WeakSet`` raises if
+# it changes size while being iterated); the emptiness test on the
+# write path stays lock-free.
+_LIVE_CACHES: "weakref.WeakSet[ResultCache]" = weakref.WeakSet()
+_LIVE_CACHES_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+class ResultCache:
+    """TTL + byte-budget LRU cache of read-only query results.
+
+    Thread-safe: one instance may be shared by every connection of a
+    pool, across threads and event loops. ``hits`` / ``misses`` count
+    lookups for sizing the budget.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_entries",
+        "_generation",
+        "_lock",
+        "_max_bytes",
+        "_nbytes",
+        "_ttl",
+        "hits",
+        "misses",
+    )
+
+    def __init__(self, *, ttl: float = _DEFAULT_TTL, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        """Create an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays servable after it was stored.
+                Bounds staleness for writes the driver cannot observe.
+                Must be positive and finite.
+            max_bytes: Budget for the estimated size of all cached
+                results; least-recently-used entries are evicted past
+                it. Must be a positive int.
+        """
+        if isinstance(ttl, bool) or not isinstance(ttl, int | float):
+            raise ProgrammingError(f"ttl must be a positive finite number, got {ttl!r}")
+        if not math.isfinite(ttl) or ttl <= 0:
+            raise ProgrammingError(f"ttl must be a positive finite number, got {ttl!r}")
+        if isinstance(max_bytes, bool) or not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ProgrammingError(f"max_bytes must be a positive int, got {max_bytes!r}")
+        self._ttl = float(ttl)
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._nbytes = 0
+        # Bumped by every invalidation. A miss records it before going
+        # to the server and the store is dropped if it moved, so a
+        # result read before a concurrent write is never cached after
+        # that write's invalidation has already run.
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        with _LIVE_CACHES_LOCK:
+            _LIVE_CACHES.add(self)
+
+    @property
+    def ttl(self) -> float:
+        """Entry lifetime in seconds."""
+        return self._ttl
+
+    @property
+    def max_bytes(self) -> int:
+        """Budget for the estimated size of all entries."""
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated size of the entries currently held."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ResultCache entries={len(self._entries)} nbytes={self._nbytes} "
+            f"max_bytes={self._max_bytes} ttl={self._ttl}>"
+        )
+
+    def __reduce__(self) -> Any:
+        raise TypeError(
+            "ResultCache cannot be pickled; create one per process and pass it to connect()."
+        )
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._invalidate(None)
+
+    def invalidate(self, *tables: str) -> None:
+        """Drop the entries whose SQL mentions any of ``tables``.
+
+        For writes the driver cannot observe (another process, a
+        trigger). Names match case-insensitively and unquoted, as in
+        SQLite; schema qualifiers are ignored.
+        """
+        self._invalidate(frozenset(_normalize_identifier(t) for t in tables))
+
+    def _get(self, key: Hashable) -> _CachedResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires <= time.monotonic():
+                self._drop(key, entry)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.result
+
+    def _put(
+        self, key: Hashable, generation: int, tables: frozenset[str], result: _CachedResult
+    ) -> None:
+        nbytes = _estimate_nbytes(result.rows)
+        if nbytes > self._max_bytes:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old.nbytes
+            self._entries[key] = _Entry(time.monotonic() + self._ttl, nbytes, result, tables)
+            self._nbytes += nbytes
+            while self._nbytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def _drop(self, key: Hashable, entry: _Entry) -> None:
+        del self._entries[key]
+        self._nbytes -= entry.nbytes
+
+    def _invalidate(self, tables: frozenset[str] | None) -> None:
+        """Drop entries touching ``tables``; ``None`` drops everything."""
+        with self._lock:
+            self._generation += 1
+            if tables is None:
+                self._entries.clear()
+                self._nbytes = 0
+                return
+            stale = [k for k, e in self._entries.items() if not tables.isdisjoint(e.tables)]
+            for key in stale:
+                self._drop(key, self._entries[key])
+
+
+def _normalize_identifier(name: str) -> str:
+    """Unquote and case-fold one SQL identifier, dropping a schema."""
+    if name[:1] == '"' and name[-1:] == '"':
+        name = name[1:-1].replace('""', '"')
+    elif name[:1] == "[" and name[-1:] == "]":
+        name = name[1:-1]
+    elif name[:1] == "`" and name[-1:] == "`":
+        name = name[1:-1].replace("``", "`")
+    elif "." in name:
+        name = name.rsplit(".", 1)[1].strip()
+    return name.lower()
+
+
+def _estimate_nbytes(rows: Sequence[Sequence[Any]]) -> int:
+    total = _ROW_OVERHEAD_BYTES * len(rows)
+    for row in rows:
+        for value in row:
+            total += _CELL_OVERHEAD_BYTES
+            if isinstance(value, str | bytes):
+                total += len(value)
+    return total
+
+
+def _connection_cache(connection: Any) -> ResultCache | None:
+    # ``isinstance`` so ``MagicMock`` connections in unit tests never
+    # look like they carry a cache.
+    cache = getattr(connection, "_result_cache", None)
+    return cache if isinstance(cache, ResultCache) else None
+
+
+def _in_transaction(connection: Any) -> bool:
+    client = getattr(connection, "_async_conn", None)
+    return client is not None and getattr(client, "in_transaction", False) is True
+
+
+class _CacheSlot(NamedTuple):
+    """Where a cacheable read's result goes once fetched."""
+
+    cache: ResultCache
+    key: Hashable
+    generation: int
+    tables: frozenset[str]
+
+
+def _cache_slot(
+    connection: Any, operation: str, params: Sequence[Any] | None, tables: frozenset[str]
+) -> _CacheSlot | None:
+    """Cache slot for a pure read on ``connection``, or ``None``.
+
+    ``params`` are the converted (wire-primitive) bind parameters. No
+    slot when the connection has no cache, is inside an explicit
+    transaction (its reads may see its own uncommitted writes), or a
+    parameter is unhashable.
+    """
+    cache = _connection_cache(connection)
+    if cache is None or _in_transaction(connection):
+        return None
+    # A cache shared across connections to different clusters must not
+    # answer one cluster's read with another's rows; ``_address`` is
+    # the normalised seed list.
+    address = getattr(connection, "_address", None)
+    database = getattr(connection, "_database", None)
+    if params is None:
+        key: Hashable = (address, database, operation)
+    else:
+        key = (address, database, operation, tuple([(type(p), p) for p in params]))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+    return _CacheSlot(cache, key, cache._generation, tables)
+
+
+def _invalidate_everywhere(tables: frozenset[str] | None) -> None:
+    with _LIVE_CACHES_LOCK:
+        caches = list(_LIVE_CACHES)
+    for cache in caches:
+        cache._invalidate(tables)
+
+
+def _note_write(connection: Any, tables: frozenset[str] | None) -> None:
+    """Invalidate caches after a statement that may have written data.
+
+    ``tables`` is the statement's written-table set: empty for
+    statements that change no data (transaction control, ``PRAGMA``),
+    ``None`` when the targets are unknown. Writes inside an explicit
+    transaction are also remembered on the connection and invalidated
+    again once it ends, since other connections may have re-cached the
+    pre-commit values in between. Free when no cache exists.
+    """
+    if not _LIVE_CACHES:
+        return
+    if tables is None or tables:
+        _invalidate_everywhere(tables)
+    pending = getattr(connection, "_cache_pending_writes", None)
+    if not isinstance(pending, list):
+        return
+    if _in_transaction(connection):
+        if tables is None or tables:
+            pending.append(tables)
+    elif pending:
+        _flush_pending(pending)
+
+
+def _settle_pending_writes(connection: Any) -> None:
+    """Re-invalidate a finished transaction's writes (commit / rollback)."""
+    pending = getattr(connection, "_cache_pending_writes", None)
+    if isinstance(pending, list) and pending and not _in_transaction(connection):
+        _flush_pending(pending)
+
+
+def _flush_pending(pending: list[frozenset[str] | None]) -> None:
+    union: set[str] = set()
+    for written in pending:
+        if written is None:
+            pending.clear()
+            _invalidate_everywhere(None)
+            return
+        union |= written
+    pending.clear()
+    _invalidate_everywhere(frozenset(union))
@@ -0,0 +1,254 @@
+"""Opt-in transparent retry of idempotent reads across a leader change.
+
+A leader election fails every statement in flight on the deposed
+leader with a leader-class ``OperationalError`` (``code`` in
+``dqlitewire.LEADER_ERROR_CODES``), and the connection's client is
+dead afterwards. For a pure read that is pure retry noise: replaying
+it against the new leader is always safe. A :class:`ReadRetry` passed
+as ``read_retry=`` to ``connect()`` / ``aconnect()`` (or to a pool,
+which forwards it to every connection) does that replay inside
+``execute``::
+
+    policy = ReadRetry(deadline=5.0)
+    conn = dqlitedbapi.connect("127.0.0.1:9001", read_retry=policy)
+    conn.cursor().execute("SELECT * FROM orders WHERE id = ?", (7,))
+
+What is retried: statements the cursor classifies as a pure read — a
+leading ``SELECT`` / ``VALUES``, possibly behind a ``WITH`` clause,
+and not DML with ``RETURNING`` (the same predicate the result cache
+uses) — executed outside an explicit transaction. Writes, ``PRAGMA``,
+``EXPLAIN`` and anything inside ``BEGIN`` ... ``COMMIT`` surface the
+error as before: the driver cannot know whether a write was applied,
+and a transaction does not survive a leader change.
+
+What triggers a retry: a leader-class error, a lost connection
+(``OperationalError`` caused by a client ``DqliteConnectionError``)
+or a failed leader discovery while the cluster elects (caused by a
+``ClusterError``). Before each replay the dead client is dropped, the
+stale leader hint in the process-wide leader-discovery cache is
+cleared and the caller sleeps for an exponentially growing, jittered
+delay; the replay then reconnects through the cached ``ClusterClient``
+to whichever node now leads.
+
+Bounds: at most ``max_attempts`` executions, and no replay starts
+after ``deadline`` seconds from the first. The error of the last
+attempt is raised unchanged when either runs out. Sync connections
+additionally bound the whole call by their ``timeout``.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Final
+
+import dqliteclient.exceptions as _client_exc
+from dqlitedbapi.exceptions import OperationalError, ProgrammingError
+from dqlitedbapi.result_cache import _in_transaction
+from dqlitewire import LEADER_ERROR_CODES
+
+if TYPE_CHECKING:
+    from dqlitedbapi.cursor import _StatementInfo
+
+__all__ = ["ReadRetry"]
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_ATTEMPTS: Final[int] = 5
+_DEFAULT_BASE_DELAY: Final[float] = 0.05
+_DEFAULT_MAX_DELAY: Final[float] = 1.0
+_DEFAULT_DEADLINE: Final[float] = 5.0
+_DEFAULT_JITTER: Final[float] = 0.5
+
+
+def _check_seconds(value: object, name: str, *, allow_zero: bool = False) -> float:
+    if isinstance(value, bool) or not isinstance(value, int | float) or not math.isfinite(value):
+        raise ProgrammingError(f"{name} must be a finite number, got {value!r}")
+    if value < 0 or (value == 0 and not allow_zero):
+        bound = "non-negative" if allow_zero else "positive"
+        raise ProgrammingError(f"{name} must be {bound}, got {value!r}")
+    return float(value)
+
+
+class ReadRetry:
+    """Backoff policy for replaying pure reads after a leader change.
+
+    Thread-safe and stateless apart from its counters: one instance
+    may be shared by every connection of a pool. ``retries`` counts
+    replays, ``exhausted`` the reads that failed anyway.
+    """
+
+    __slots__ = (
+        "_base_delay",
+        "_deadline",
+        "_jitter",
+        "_lock",
+        "_max_attempts",
+        "_max_delay",
+        "exhausted",
+        "retries",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = _DEFAULT_BASE_DELAY,
+        max_delay: float = _DEFAULT_MAX_DELAY,
+        deadline: float = _DEFAULT_DEADLINE,
+        jitter: float = _DEFAULT_JITTER,
+    ) -> None:
+        """Create a policy.
+
+        Args:
+            max_attempts: Executions per read, the first included.
+                Must be an int >= 1 (1 disables replay).
+            base_delay: Delay in seconds before the first replay;
+                doubled for each further one. Non-negative.
+            max_delay: Cap on a single delay, in seconds. Must be at
+                least ``base_delay``.
+            deadline: Seconds after the first attempt past which no
+                replay is started. Positive.
+            jitter: Fraction of each delay drawn at random, so
+                connections failing together do not reconnect in
+                lockstep: the delay is scaled by a uniform factor in
+                ``[1 - jitter, 1]``. Between 0 and 1.
+        """
+        if isinstance(max_attempts, bool) or not isinstance(max_attempts, int) or max_attempts < 1:
+            raise ProgrammingError(f"max_attempts must be an int >= 1, got {max_attempts!r}")
+        base_delay = _check_seconds(base_delay, "base_delay", allow_zero=True)
+        max_delay = _check_seconds(max_delay, "max_delay", allow_zero=True)
+        if max_delay < base_delay:
+            raise ProgrammingError(
+                f"max_delay ({max_delay!r}) must be >= base_delay ({base_delay!r})"
+            )
+        deadline = _check_seconds(deadline, "deadline")
+        jitter = _check_seconds(jitter, "jitter", allow_zero=True)
+        if jitter > 1:
+            raise ProgrammingError(f"jitter must be between 0 and 1, got {jitter!r}")
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._deadline = deadline
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+
+    @property
+    def max_attempts(self) -> int:
+        """Executions per read, the first included."""
+        return self._max_attempts
+
+    @property
+    def deadline(self) -> float:
+        """Seconds after the first attempt past which no replay starts."""
+        return self._deadline
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReadRetry max_attempts={self._max_attempts} base_delay={self._base_delay} "
+            f"max_delay={self._max_delay} deadline={self._deadline} jitter={self._jitter}>"
+        )
+
+    def _delay(self, replay: int) -> float:
+        """Sleep before replay number ``replay`` (1-based)."""
+        delay = min(self._max_delay, self._base_delay * 2.0 ** (replay - 1))
+        return delay * (1.0 - self._jitter * random.random())
+
+    def _count(self, *, exhausted: bool) -> None:
+        with self._lock:
+            if exhausted:
+                self.exhausted += 1
+            else:
+                self.retries += 1
+
+
+def _check_read_retry(read_retry: object) -> ReadRetry | None:
+    """Validate the ``read_retry`` connect argument."""
+    if read_retry is not None and not isinstance(read_retry, ReadRetry):
+        raise ProgrammingError(
+            f"read_retry must be a ReadRetry or None, got {type(read_retry).__name__}"
+        )
+    return read_retry
+
+
+def _is_leader_change(exc: BaseException) -> bool:
+    """``True`` for the errors a replay against a new leader can cure."""
+    if not isinstance(exc, OperationalError):
+        return False
+    if exc.code in LEADER_ERROR_CODES:
+        return True
+    cause = exc.__cause__
+    return isinstance(cause, _client_exc.DqliteConnectionError | _client_exc.ClusterError) and (
+        not isinstance(cause, _client_exc.ClusterPolicyError)
+    )
+
+
+def _read_retry_for(connection: Any, info: "_StatementInfo") -> ReadRetry | None:
+    """The connection's policy if this ``execute`` may be replayed."""
+    # ``isinstance`` so ``MagicMock`` connections in unit tests never
+    # look like they carry a policy. Policy first: ``read_tables`` is
+    # computed on first access.
+    policy = getattr(connection, "_read_retry", None)
+    if not isinstance(policy, ReadRetry) or not info.row_returning or info.read_tables is None:
+        return None
+    if _in_transaction(connection):
+        return None
+    return policy
+
+
+def _drop_client(connection: Any, cause: BaseException) -> None:
+    """Discard the connection's dead client and its stale leader hint.
+
+    The next ``_get_async_connection`` / ``_ensure_connection`` then
+    re-resolves the leader through the cached ``ClusterClient``.
+    """
+    from dqlitedbapi.connection import _forget_leader
+
+    dying = connection._async_conn
+    connection._async_conn = None
+    box = getattr(connection, "_inner_box", None)
+    if box is not None:
+        box[0] = None
+    if dying is not None:
+        dying._invalidate(cause)
+        _forget_leader(dying._address)
+
+
+async def _retry_read(
+    connection: Any, policy: ReadRetry, attempt: Callable[[], Awaitable[None]]
+) -> None:
+    """Run ``attempt`` and replay it per ``policy`` on a leader change.
+
+    ``attempt`` builds a fresh coroutine per call. Anything other
+    than a leader-change error, and the last error once attempts or
+    the deadline are used up, propagates unchanged.
+    """
+    give_up_at = time.monotonic() + policy._deadline
+    replay = 0
+    while True:
+        try:
+            await attempt()
+            return
+        except OperationalError as e:
+            if not _is_leader_change(e) or getattr(connection, "_closed", False):
+                raise
+            replay += 1
+            delay = policy._delay(replay)
+            if replay >= policy._max_attempts or time.monotonic() + delay > give_up_at:
+                policy._count(exhausted=True)
+                raise
+            policy._count(exhausted=False)
+            logger.debug(
+                "read replay %d/%d after leader change (%s); sleeping %.3fs",
+                replay,
+                policy._max_attempts - 1,
+                e,
+                delay,
+            )
+            _drop_client(connection, e)
+        await asyncio.sleep(delay)
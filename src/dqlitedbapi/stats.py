@@ -0,0 +1,243 @@
+"""In-process per-statement statistics, ``pg_stat_statements``-style.
+
+Built on :mod:`dqlitedbapi.instrumentation`: a :class:`StatsCollector`
+is an ordinary listener that aggregates events by SQL
+:func:`~dqlitedbapi.instrumentation.fingerprint`, so statements that
+differ only in literal values share one row. The module-level
+collector covers the common case::
+
+    dqlitedbapi.stats.enable()
+    ...
+    for s in dqlitedbapi.stats.snapshot()[:10]:  # most total time first
+        print(s.fingerprint, s.calls, s.p99)
+
+Each entry tracks calls, errors, result-cache hits, rows returned,
+rows affected, total / min / max time, op-lock wait and a
+log-bucketed latency histogram from which p50 / p95 / p99 are
+estimated (four buckets per power of two, so a percentile is within
+~19% of the true value). Events that carry no SQL (``connect``,
+``leader_discovery``) are aggregated under ``"<connect>"`` /
+``"<leader_discovery>"``.
+
+Memory is bounded by ``max_statements``: when a new fingerprint
+arrives at the cap, the least recently seen entry is evicted (counted
+in :attr:`StatsCollector.evicted`). Recency rather than call count, so
+eviction is O(1) and a burst of new fingerprints evicts the stale
+tail instead of each other.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Final, NamedTuple
+
+from dqlitedbapi import instrumentation
+from dqlitedbapi.exceptions import ProgrammingError
+from dqlitedbapi.instrumentation import Event
+
+__all__ = ["StatementStats", "StatsCollector", "disable", "enable", "reset", "snapshot"]
+
+_DEFAULT_MAX_STATEMENTS: Final[int] = 1000
+
+# Histogram geometry: bucket ``i`` holds durations in
+# ``[_BUCKET_FLOOR * 2**(i/4), _BUCKET_FLOOR * 2**((i+1)/4))``.
+# Bucket 0 also absorbs everything faster than 1 µs; the last bucket
+# (~2**27 µs ≈ 2 minutes) absorbs everything slower.
+_BUCKET_FLOOR: Final[float] = 1e-6
+_BUCKETS_PER_OCTAVE: Final[int] = 4
+_MAX_BUCKET: Final[int] = 27 * _BUCKETS_PER_OCTAVE
+
+
+def _bucket(seconds: float) -> int:
+    if seconds <= _BUCKET_FLOOR:
+        return 0
+    return min(int(math.log2(seconds / _BUCKET_FLOOR) * _BUCKETS_PER_OCTAVE), _MAX_BUCKET)
+
+
+def _bucket_upper(index: int) -> float:
+    return _BUCKET_FLOOR * math.pow(2.0, (index + 1) / _BUCKETS_PER_OCTAVE)
+
+
+class StatementStats(NamedTuple):
+    """Aggregated statistics for one statement fingerprint.
+
+    Times are seconds. ``rows`` counts result rows buffered by
+    row-returning calls; ``rows_affected`` sums ``rowcount`` of the
+    others (DML) that succeeded.
+    """
+
+    fingerprint: str
+    calls: int
+    errors: int
+    cached: int
+    rows: int
+    rows_affected: int
+    total_time: float
+    min_time: float
+    max_time: float
+    mean_time: float
+    p50: float
+    p95: float
+    p99: float
+    lock_wait: float
+
+
+class _Entry:
+    __slots__ = (
+        "cached",
+        "calls",
+        "errors",
+        "histogram",
+        "lock_wait",
+        "max_time",
+        "min_time",
+        "rows",
+        "rows_affected",
+        "total_time",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.cached = 0
+        self.rows = 0
+        self.rows_affected = 0
+        self.total_time = 0.0
+        self.min_time = math.inf
+        self.max_time = 0.0
+        self.lock_wait = 0.0
+        # Sparse: most statements land in a handful of buckets.
+        self.histogram: dict[int, int] = {}
+
+    def percentile(self, q: float) -> float:
+        target = q * self.calls
+        seen = 0
+        for index in sorted(self.histogram):
+            seen += self.histogram[index]
+            if seen >= target:
+                return min(max(_bucket_upper(index), self.min_time), self.max_time)
+        return self.max_time
+
+    def freeze(self, key: str) -> StatementStats:
+        return StatementStats(
+            fingerprint=key,
+            calls=self.calls,
+            errors=self.errors,
+            cached=self.cached,
+            rows=self.rows,
+            rows_affected=self.rows_affected,
+            total_time=self.total_time,
+            min_time=self.min_time,
+            max_time=self.max_time,
+            mean_time=self.total_time / self.calls,
+            p50=self.percentile(0.50),
+            p95=self.percentile(0.95),
+            p99=self.percentile(0.99),
+            lock_wait=self.lock_wait,
+        )
+
+
+class StatsCollector:
+    """Instrumentation listener aggregating events per fingerprint.
+
+    Pass one to ``instrumentation.add_listener`` (every connection) or
+    to ``listeners=`` (selected connections / a pool). Thread-safe.
+    """
+
+    __slots__ = ("_entries", "_lock", "_max_statements", "evicted")
+
+    def __init__(self, *, max_statements: int = _DEFAULT_MAX_STATEMENTS) -> None:
+        if (
+            isinstance(max_statements, bool)
+            or not isinstance(max_statements, int)
+            or max_statements <= 0
+        ):
+            raise ProgrammingError(f"max_statements must be a positive int, got {max_statements!r}")
+        self._max_statements = max_statements
+        # LRU order: most recently seen last.
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    @property
+    def max_statements(self) -> int:
+        """Cap on distinct fingerprints held."""
+        return self._max_statements
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"<StatsCollector statements={len(self._entries)} evicted={self.evicted}>"
+
+    def __call__(self, event: Event) -> None:
+        key = event.fingerprint if event.fingerprint is not None else f"<{event.kind}>"
+        duration = event.duration
+        with self._lock:
+            entries = self._entries
+            entry = entries.get(key)
+            if entry is None:
+                if len(entries) >= self._max_statements:
+                    entries.popitem(last=False)
+                    self.evicted += 1
+                entry = entries[key] = _Entry()
+            else:
+                entries.move_to_end(key)
+            entry.calls += 1
+            if event.cached:
+                entry.cached += 1
+            if event.rows is not None:
+                entry.rows += event.rows
+            if event.error is not None:
+                # A failed statement's ``rowcount`` is whatever the
+                # cursor held before (or a partial executemany); it
+                # changed nothing the caller can rely on.
+                entry.errors += 1
+            elif event.rows is None and event.rowcount is not None and event.rowcount > 0:
+                entry.rows_affected += event.rowcount
+            entry.total_time += duration
+            if duration < entry.min_time:
+                entry.min_time = duration
+            if duration > entry.max_time:
+                entry.max_time = duration
+            if event.lock_wait is not None:
+                entry.lock_wait += event.lock_wait
+            bucket = _bucket(duration)
+            entry.histogram[bucket] = entry.histogram.get(bucket, 0) + 1
+
+    def snapshot(self) -> list[StatementStats]:
+        """Current statistics, highest ``total_time`` first."""
+        with self._lock:
+            frozen = [entry.freeze(key) for key, entry in self._entries.items()]
+        frozen.sort(key=lambda s: s.total_time, reverse=True)
+        return frozen
+
+    def reset(self) -> None:
+        """Drop every entry and the eviction count."""
+        with self._lock:
+            self._entries.clear()
+            self.evicted = 0
+
+
+_COLLECTOR: Final[StatsCollector] = StatsCollector()
+
+
+def enable() -> None:
+    """Start collecting statistics for every connection in the process."""
+    disable()
+    instrumentation.add_listener(_COLLECTOR)
+
+
+def disable() -> None:
+    """Stop collecting; gathered statistics are kept until :func:`reset`."""
+    instrumentation.remove_listener(_COLLECTOR)
+
+
+def snapshot() -> list[StatementStats]:
+    """Statistics gathered since :func:`enable` / the last :func:`reset`."""
+    return _COLLECTOR.snapshot()
+
+
+def reset() -> None:
+    """Clear the module-level statistics."""
+    _COLLECTOR.reset()
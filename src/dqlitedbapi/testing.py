@@ -0,0 +1,464 @@
+"""In-process dqlite stand-in cluster for tests and benchmarks.
+
+A :class:`LoopbackCluster` listens on ``127.0.0.1`` with one port per
+simulated node and speaks the dqlite wire protocol (encoded and
+decoded with :mod:`dqlitewire`) in front of a real :mod:`sqlite3`
+database, so the driver's full stack — leader discovery, socket,
+framing, continuation frames, error mapping, transactions — runs
+without Docker, a network or a Raft cluster::
+
+    from dqlitedbapi.testing import LoopbackCluster
+
+    async with LoopbackCluster(nodes=3) as cluster:
+        conn = await dqlitedbapi.aio.aconnect(cluster.address)
+        ...
+        cluster.flip_leader()  # next statement fails with a leader error
+
+    # Sync code: the cluster runs on its own loop thread.
+    with LoopbackCluster().serve_in_thread() as cluster:
+        conn = dqlitedbapi.connect(cluster.address)
+
+Served requests: handshake, ``CLIENT``, ``LEADER``, ``CLUSTER``,
+``OPEN``, ``PREPARE`` / ``EXEC`` / ``QUERY`` / ``FINALIZE``,
+``EXEC_SQL`` / ``QUERY_SQL`` and ``INTERRUPT``. Every node serves the
+same databases (one sqlite file per database name in a private
+temporary directory, one sqlite connection per client session), but
+only the current leader executes statements: on a follower, or on a
+node that lost leadership since the session's last statement,
+statements fail with ``SQLITE_IOERR_NOT_LEADER`` and any open
+transaction is rolled back, as on a real cluster.
+
+Simulation knobs (plain attributes, adjustable while serving):
+``latency`` delays every reply, ``bandwidth`` caps reply throughput in
+bytes per second, ``rows_per_frame`` splits results into continuation
+frames and ``chunk_size`` dribbles each reply onto the socket in
+pieces, forcing the client to reassemble split frames. Node outages
+are simulated with :meth:`LoopbackCluster.stop_node` /
+:meth:`LoopbackCluster.start_node`.
+
+Not simulated: replication, persistence across :meth:`close`, the
+dqlite-specific ``UNIXTIME`` / ``ISO8601`` / ``BOOLEAN`` column types
+(values are typed from their Python class, as ``sqlite3`` returns
+them) and concurrent writers beyond what sqlite's own locking gives
+(a blocked writer fails with ``SQLITE_BUSY`` immediately rather than
+waiting). Statements run synchronously on the serving loop.
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import shutil
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Coroutine, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Final, Self
+
+from dqlitedbapi.cursor import _strip_sql_noise
+from dqlitedbapi.exceptions import ProgrammingError
+from dqlitewire import MessageDecoder, MessageEncoder
+from dqlitewire.constants import SQLITE_IOERR_NOT_LEADER, NodeRole
+from dqlitewire.exceptions import ProtocolError
+from dqlitewire.messages.base import Message
+from dqlitewire.messages.requests import (
+    ClientRequest,
+    ClusterRequest,
+    ExecRequest,
+    ExecSqlRequest,
+    FinalizeRequest,
+    InterruptRequest,
+    LeaderRequest,
+    OpenRequest,
+    PrepareRequest,
+    QueryRequest,
+    QuerySqlRequest,
+)
+from dqlitewire.messages.responses import (
+    DbResponse,
+    EmptyResponse,
+    FailureResponse,
+    LeaderResponse,
+    NodeInfo,
+    ResultResponse,
+    RowsResponse,
+    ServersResponse,
+    StmtResponse,
+    WelcomeResponse,
+)
+
+__all__ = ["LoopbackCluster"]
+
+# Generic SQLite error, for failures ``sqlite3`` does not attach a
+# result code to (e.g. a bind-count mismatch).
+_SQLITE_ERROR: Final[int] = 1
+_HEARTBEAT_TIMEOUT_MS: Final[int] = 15000
+
+
+def _split_statements(sql: str) -> list[str]:
+    """Split ``sql`` into complete statements, as ``EXEC_SQL`` runs
+    every statement in the string. ``sqlite3.complete_statement`` knows
+    about literals, identifiers and comments, so a ``;`` inside one
+    does not split."""
+    statements = []
+    pending = ""
+    for piece in sql.split(";"):
+        pending += piece + ";"
+        if sqlite3.complete_statement(pending):
+            if _strip_sql_noise(pending).strip(" \t\r\n;"):
+                statements.append(pending)
+            pending = ""
+    if _strip_sql_noise(pending).strip(" \t\r\n;"):
+        statements.append(pending[:-1])
+    return statements
+
+
+class _NotLeaderError(Exception):
+    pass
+
+
+class _Session:
+    """One client connection to one node."""
+
+    def __init__(self, node: "_Node", writer: asyncio.StreamWriter) -> None:
+        self.node = node
+        self.writer = writer
+        self.db: sqlite3.Connection | None = None
+        self.statements: dict[int, str] = {}
+        self.next_stmt_id = 0
+        # Leadership epoch this session last executed under; a flip
+        # since then is a "leadership lost" for its transaction.
+        self.epoch = node.cluster._epoch
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+        self.writer.close()
+
+
+class _Node:
+    def __init__(self, cluster: "LoopbackCluster", node_id: int) -> None:
+        self.cluster = cluster
+        self.node_id = node_id
+        self.port = 0
+        self.server: asyncio.Server | None = None
+        self.sessions: set[_Session] = set()
+
+    @property
+    def address(self) -> str:
+        return f"127.0.0.1:{self.port}"
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        server, self.server = self.server, None
+        if server is not None:
+            server.close()
+        self.drop_sessions()
+        if server is not None:
+            await server.wait_closed()
+
+    def drop_sessions(self) -> None:
+        for session in list(self.sessions):
+            session.close()
+        self.sessions.clear()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session = _Session(self, writer)
+        self.sessions.add(session)
+        decoder = MessageDecoder(is_request=True)
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    return
+                decoder.feed(data)
+                if decoder.version is None and decoder.decode_handshake() is None:
+                    continue
+                while (request := decoder.decode()) is not None:
+                    self.cluster.requests += 1
+                    replies = self.cluster._reply(session, request)
+                    await self.cluster._send(writer, replies)
+        except (ConnectionError, ProtocolError, asyncio.CancelledError):
+            pass
+        finally:
+            self.sessions.discard(session)
+            session.close()
+
+
+class LoopbackCluster:
+    """A simulated dqlite cluster of ``nodes`` nodes on loopback.
+
+    Use as an async context manager (serving on the running loop) or
+    through :meth:`serve_in_thread` (serving on a private loop thread,
+    for sync clients). Node ids are ``1..nodes``; node 1 starts as the
+    leader.
+    """
+
+    def __init__(
+        self,
+        nodes: int = 1,
+        *,
+        latency: float = 0.0,
+        bandwidth: float | None = None,
+        rows_per_frame: int = 256,
+        chunk_size: int | None = None,
+    ) -> None:
+        if isinstance(nodes, bool) or not isinstance(nodes, int) or nodes < 1:
+            raise ProgrammingError(f"nodes must be a positive int, got {nodes!r}")
+        if rows_per_frame < 1:
+            raise ProgrammingError(f"rows_per_frame must be >= 1, got {rows_per_frame!r}")
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.rows_per_frame = rows_per_frame
+        self.chunk_size = chunk_size
+        #: Requests served so far, across every node.
+        self.requests = 0
+        self._nodes = {i: _Node(self, i) for i in range(1, nodes + 1)}
+        self._leader_id: int | None = 1
+        self._epoch = 0
+        self._encoder = MessageEncoder()
+        self._directory: Path | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    # --- lifecycle ------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start listening on every node."""
+        self._loop = asyncio.get_running_loop()
+        self._directory = Path(tempfile.mkdtemp(prefix="dqlite-loopback-"))
+        for node in self._nodes.values():
+            await node.start()
+
+    async def close(self) -> None:
+        """Stop every node and delete the databases."""
+        for node in self._nodes.values():
+            await node.stop()
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @contextlib.contextmanager
+    def serve_in_thread(self) -> Iterator[Self]:
+        """Serve from a private loop thread for the duration of the
+        ``with`` block. Use :meth:`call` to run the async node
+        controls from the calling thread."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self.start(), loop).result(timeout=10)
+            yield self
+        finally:
+            with contextlib.suppress(concurrent.futures.TimeoutError):
+                asyncio.run_coroutine_threadsafe(self.close(), loop).result(timeout=10)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=10)
+            loop.close()
+
+    def call[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the serving loop from another thread."""
+        if self._loop is None:
+            coro.close()
+            raise ProgrammingError("cluster is not serving")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout=10)
+
+    # --- topology ---------------------------------------------------------
+
+    @property
+    def addresses(self) -> list[str]:
+        """Every node's ``host:port``, in node-id order."""
+        return [node.address for node in self._nodes.values()]
+
+    @property
+    def leader_id(self) -> int | None:
+        return self._leader_id
+
+    @property
+    def address(self) -> str:
+        """The current leader's address (node 1's if there is none)."""
+        node = self._nodes.get(self._leader_id or 1, self._nodes[1])
+        return node.address
+
+    def flip_leader(self, node_id: int | None = None, *, drop_connections: bool = False) -> int:
+        """Move leadership to ``node_id`` (default: the next node id,
+        wrapping) and return the new leader's id.
+
+        Sessions on the old leader see ``SQLITE_IOERR_NOT_LEADER`` on
+        their next statement; with ``drop_connections=True`` their
+        sockets are closed instead, as when the node crashes. Safe to
+        call from any thread.
+        """
+        ids = sorted(self._nodes)
+        if node_id is None:
+            current = self._leader_id or ids[-1]
+            node_id = ids[(ids.index(current) + 1) % len(ids)]
+        if node_id not in self._nodes:
+            raise ProgrammingError(f"no node {node_id!r}; nodes are {ids}")
+        old = self._nodes.get(self._leader_id) if self._leader_id is not None else None
+        self._leader_id = node_id
+        self._epoch += 1
+        if drop_connections and old is not None and old is not self._nodes[node_id]:
+            self._in_loop(old.drop_sessions)
+        return node_id
+
+    def clear_leader(self) -> None:
+        """No node is leader (an election in progress): ``LEADER``
+        answers with an empty address and every statement fails."""
+        self._leader_id = None
+        self._epoch += 1
+
+    async def stop_node(self, node_id: int) -> None:
+        """Take a node down: close its listener and its sessions. The
+        leader does not move; pair with :meth:`flip_leader`."""
+        await self._nodes[node_id].stop()
+
+    async def start_node(self, node_id: int) -> None:
+        """Bring a stopped node back on its previous port."""
+        node = self._nodes[node_id]
+        if node.server is None:
+            await node.start()
+
+    def _in_loop(self, fn: Any) -> None:
+        if self._loop is None:
+            fn()
+        else:
+            self._loop.call_soon_threadsafe(fn)
+
+    # --- request handling ---------------------------------------------------
+
+    def _reply(self, session: _Session, request: Message) -> list[Message]:
+        try:
+            return self._dispatch(session, request)
+        except _NotLeaderError:
+            return [FailureResponse(code=SQLITE_IOERR_NOT_LEADER, message="not leader")]
+        except sqlite3.Error as e:
+            code = getattr(e, "sqlite_errorcode", None) or _SQLITE_ERROR
+            return [FailureResponse(code=code, message=str(e))]
+
+    def _dispatch(self, session: _Session, request: Message) -> list[Message]:
+        if isinstance(request, ClientRequest):
+            return [WelcomeResponse(heartbeat_timeout=_HEARTBEAT_TIMEOUT_MS)]
+        if isinstance(request, LeaderRequest):
+            if self._leader_id is None:
+                return [LeaderResponse(node_id=0, address="")]
+            return [LeaderResponse(node_id=self._leader_id, address=self.address)]
+        if isinstance(request, ClusterRequest):
+            nodes = [
+                NodeInfo(node_id=n.node_id, address=n.address, role=NodeRole.VOTER)
+                for n in self._nodes.values()
+            ]
+            return [ServersResponse(nodes=nodes)]
+        if isinstance(request, OpenRequest):
+            return [DbResponse(db_id=self._open(session, request.name))]
+        if isinstance(request, InterruptRequest):
+            return [EmptyResponse()]
+        if isinstance(request, FinalizeRequest):
+            session.statements.pop(request.stmt_id, None)
+            return [EmptyResponse()]
+        if isinstance(request, PrepareRequest):
+            db = self._database(session)
+            num_params = _strip_sql_noise(request.sql).count("?")
+            # Reject syntax errors at prepare time like the real node.
+            # ``EXPLAIN`` compiles without running; a bind-count
+            # mismatch (named parameters) is not a prepare failure.
+            with contextlib.suppress(sqlite3.ProgrammingError):
+                db.execute(f"EXPLAIN {request.sql}", [None] * num_params)
+            session.next_stmt_id += 1
+            session.statements[session.next_stmt_id] = request.sql
+            return [StmtResponse(db_id=0, stmt_id=session.next_stmt_id, num_params=num_params)]
+        if isinstance(request, ExecSqlRequest):
+            return [self._exec(session, _split_statements(request.sql), request.params)]
+        if isinstance(request, ExecRequest):
+            return [self._exec(session, [self._statement(session, request)], request.params)]
+        if isinstance(request, QuerySqlRequest):
+            return self._query(session, request.sql, request.params)
+        if isinstance(request, QueryRequest):
+            return self._query(session, self._statement(session, request), request.params)
+        return [FailureResponse(code=_SQLITE_ERROR, message=f"unsupported request {request!r}")]
+
+    def _open(self, session: _Session, name: str) -> int:
+        assert self._directory is not None
+        if session.db is None:
+            # Autocommit mode: the client's own BEGIN / COMMIT drive
+            # transactions. ``timeout=0``: a blocked writer must fail
+            # fast rather than stall the whole serving loop.
+            session.db = sqlite3.connect(
+                self._directory / (name or "db"),
+                isolation_level=None,
+                timeout=0,
+                check_same_thread=False,
+            )
+            session.db.execute("PRAGMA journal_mode=WAL")
+            # Durability is not simulated; don't pay for fsync.
+            session.db.execute("PRAGMA synchronous=OFF")
+        return 0
+
+    def _database(self, session: _Session) -> sqlite3.Connection:
+        if session.db is None:
+            raise sqlite3.OperationalError("no database opened")
+        if session.node.node_id != self._leader_id or session.epoch != self._epoch:
+            # Leadership moved away from (or back to) this node since
+            # the session's last statement: any transaction it had
+            # open did not survive.
+            if session.db.in_transaction:
+                session.db.rollback()
+            session.epoch = self._epoch
+            if session.node.node_id != self._leader_id:
+                raise _NotLeaderError
+        return session.db
+
+    @staticmethod
+    def _statement(session: _Session, request: ExecRequest | QueryRequest) -> str:
+        try:
+            return session.statements[request.stmt_id]
+        except KeyError:
+            raise sqlite3.OperationalError(f"no statement with id {request.stmt_id}") from None
+
+    def _exec(self, session: _Session, statements: list[str], params: Sequence[Any]) -> Message:
+        db = self._database(session)
+        changes_before = db.total_changes
+        cursor = db.cursor()
+        for i, sql in enumerate(statements):
+            cursor.execute(sql, list(params) if i == 0 else ())
+        last_insert_id = cursor.lastrowid or 0
+        return ResultResponse(
+            last_insert_id=last_insert_id,
+            rows_affected=db.total_changes - changes_before,
+        )
+
+    def _query(self, session: _Session, sql: str, params: Sequence[Any]) -> list[Message]:
+        cursor = self._database(session).execute(sql, list(params))
+        columns = [d[0] for d in cursor.description or ()]
+        rows = [list(row) for row in cursor.fetchall()]
+        step = self.rows_per_frame
+        chunks = [rows[i : i + step] for i in range(0, len(rows), step)] or [[]]
+        return [
+            RowsResponse(column_names=columns, rows=chunk, has_more=i < len(chunks) - 1)
+            for i, chunk in enumerate(chunks)
+        ]
+
+    async def _send(self, writer: asyncio.StreamWriter, replies: list[Message]) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        payload = b"".join(self._encoder.encode(m) for m in replies)
+        step = self.chunk_size or max(len(payload), 1)
+        for i in range(0, len(payload), step):
+            piece = payload[i : i + step]
+            writer.write(piece)
+            await writer.drain()
+            if self.bandwidth:
+                await asyncio.sleep(len(piece) / self.bandwidth)
+            elif self.chunk_size:
+                # Yield so each piece goes out as its own segment.
+                await asyncio.sleep(0)
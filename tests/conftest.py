@@ -13,13 +13,15 @@ def _clear_resolve_leader_cache() -> Iterator[None]:
     between tests. The cache is keyed by (address, governors) so two
     tests that mock ``ClusterClient`` against the same seed address
     would otherwise share a stale cached instance from the first
-    test's patch context.
+    test's patch context. The multi-seed preference map goes with it.
     """
     from dqlitedbapi import connection as _conn_mod
 
     _conn_mod._RESOLVE_LEADER_CACHE.clear()
+    _conn_mod._SEED_PREFERENCE.clear()
     yield
     _conn_mod._RESOLVE_LEADER_CACHE.clear()
+    _conn_mod._SEED_PREFERENCE.clear()
 
 
 # Add python-dqlite-dev's testlib to sys.path so tests (in particular
@@ -0,0 +1,244 @@
+"""``dqlitedbapi.aio.create_pool`` / ``AsyncPool``.
+
+``AsyncConnection.connect`` is patched to a no-op so no cluster is
+needed; pinned here are reuse, concurrent warmup, the size bound and
+acquire timeout, release-time rollback, the health pass, loop
+binding, close semantics, and cancellation never leaking a connection
+or a slot.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import dqlitedbapi.aio
+from dqlitedbapi.aio import AsyncConnection, AsyncCursor, AsyncPool, create_pool
+from dqlitedbapi.exceptions import InterfaceError, OperationalError, ProgrammingError
+
+
+@pytest.fixture(autouse=True)
+def _no_network() -> Iterator[None]:
+    async def _connect(self: AsyncConnection) -> None:
+        await asyncio.sleep(0.01)
+
+    with patch.object(AsyncConnection, "connect", _connect):
+        yield
+
+
+def _kwargs(**overrides: object) -> dict[str, object]:
+    base: dict[str, object] = {"timeout": 2.0, "health_check_interval": None}
+    base.update(overrides)
+    return base
+
+
+def test_exported() -> None:
+    assert "create_pool" in dqlitedbapi.aio.__all__
+    assert "AsyncPool" in dqlitedbapi.aio.__all__
+
+
+@pytest.mark.asyncio
+async def test_warmup_is_concurrent_and_connections_are_reused() -> None:
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    pool = await create_pool("localhost:19001", **_kwargs(min_size=5, max_size=5))
+    # Five sequential 10 ms connects would take >= 50 ms.
+    assert loop.time() - started < 0.045
+    assert pool.size == 5
+    async with pool.acquire() as first:
+        pass
+    async with pool.acquire() as second:
+        assert second is first
+    assert pool.size == 5
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_warmup_leaves_nothing_open() -> None:
+    calls = 0
+
+    async def _flaky(self: AsyncConnection) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise OperationalError("no leader")
+
+    with (
+        patch.object(AsyncConnection, "connect", _flaky),
+        pytest.raises(OperationalError, match="no leader"),
+    ):
+        await create_pool("localhost:19001", **_kwargs(min_size=3))
+
+
+@pytest.mark.asyncio
+async def test_acquire_times_out_when_exhausted() -> None:
+    async with AsyncPool("localhost:19001", **_kwargs(max_size=1, acquire_timeout=0.05)) as pool:
+        with pytest.raises(OperationalError, match="timed out"):
+            async with pool.acquire(), pool.acquire():
+                pass
+
+
+@pytest.mark.asyncio
+async def test_waiter_is_woken_by_release() -> None:
+    async with AsyncPool("localhost:19001", **_kwargs(max_size=1)) as pool:
+        order: list[str] = []
+
+        async def borrower(tag: str) -> None:
+            async with pool.acquire():
+                order.append(tag)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(borrower("a"), borrower("b"))
+        assert sorted(order) == ["a", "b"]
+        assert pool.size == 1
+
+
+@pytest.mark.asyncio
+async def test_release_rolls_back_open_transaction() -> None:
+    async with AsyncPool("localhost:19001", **_kwargs()) as pool:
+        with (
+            patch.object(AsyncConnection, "in_transaction", True),
+            patch.object(AsyncConnection, "rollback", new_callable=AsyncMock) as rollback,
+        ):
+            async with pool.acquire():
+                pass
+        rollback.assert_awaited_once()
+        assert pool.size == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_reset_discards_connection() -> None:
+    async with AsyncPool("localhost:19001", **_kwargs()) as pool:
+        with (
+            patch.object(AsyncConnection, "in_transaction", True),
+            patch.object(
+                AsyncConnection, "rollback", AsyncMock(side_effect=OperationalError("gone"))
+            ),
+        ):
+            async with pool.acquire() as conn:
+                pass
+        assert conn.closed
+        assert pool.size == 0
+
+
+@pytest.mark.asyncio
+async def test_health_check_replaces_dead_and_refills() -> None:
+    async with AsyncPool("localhost:19001", **_kwargs(min_size=2, max_size=4)) as pool:
+        async with pool.acquire() as a, pool.acquire() as b:
+            pass
+        with patch.object(
+            AsyncCursor, "execute", AsyncMock(side_effect=OperationalError("not leader"))
+        ):
+            await pool._health_check()
+        assert a.closed and b.closed
+        assert pool.size == 2
+        async with pool.acquire() as fresh:
+            assert fresh is not a and fresh is not b
+
+
+@pytest.mark.asyncio
+async def test_health_check_evicts_idle_above_min_size() -> None:
+    async with AsyncPool("localhost:19001", **_kwargs(min_size=1, max_idle=0.01)) as pool:
+        async with pool.acquire(), pool.acquire(), pool.acquire():
+            pass
+        assert pool.size == 3
+        # Age the records rather than patching ``time.monotonic`` —
+        # the event loop's own clock reads it too.
+        for rec in pool._idle:
+            rec.last_used -= 1e6
+        with patch.object(AsyncCursor, "execute", AsyncMock()):
+            await pool._health_check()
+        assert pool.size == 1
+
+
+@pytest.mark.asyncio
+async def test_background_health_task_runs_and_stops_on_close() -> None:
+    pool = await create_pool("localhost:19001", timeout=2.0, min_size=1, health_check_interval=0.01)
+    with patch.object(AsyncPool, "_health_check", AsyncMock()) as check:
+        await asyncio.sleep(0.05)
+        task = pool._health_task
+        await pool.close()
+    assert check.await_count >= 1
+    assert task is not None and task.done()
+
+
+@pytest.mark.asyncio
+async def test_cancel_mid_ping_closes_survivors() -> None:
+    async with AsyncPool("localhost:19001", **_kwargs(min_size=2, max_size=2)) as pool:
+        conns = [rec.conn for rec in pool._idle]
+        pinging = asyncio.Event()
+
+        async def _hang(*args: object, **kwargs: object) -> None:
+            pinging.set()
+            await asyncio.sleep(10)
+
+        with patch.object(AsyncCursor, "execute", _hang):
+            task = asyncio.create_task(pool._health_check())
+            await pinging.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert pool.size == 0
+        assert all(c.closed for c in conns)
+
+
+@pytest.mark.asyncio
+async def test_checkout_closes_victims_in_background() -> None:
+    async with AsyncPool("localhost:19001", **_kwargs(max_size=1)) as pool:
+        async with pool.acquire() as stale:
+            pass
+        pool._max_lifetime = 0.0
+        closing = asyncio.Event()
+
+        async def _slow_close(self: AsyncConnection) -> None:
+            closing.set()
+            await asyncio.sleep(10)
+
+        with patch.object(AsyncConnection, "close", _slow_close):
+            fresh = await asyncio.wait_for(pool._checkout(), 1.0)
+            await closing.wait()
+            # The expired connection closes in the background; the
+            # checkout does not wait for it.
+            assert fresh is not stale
+            assert pool.size == 1
+            (close_task,) = pool._discard_tasks
+            close_task.cancel()
+            await asyncio.gather(close_task, return_exceptions=True)
+        assert stale.closed
+        await pool._checkin(fresh)
+
+
+def test_pool_is_loop_bound() -> None:
+    pool = AsyncPool("localhost:19001", **_kwargs())
+    asyncio.run(pool.start())
+    with pytest.raises(ProgrammingError, match="different event loop"):
+        asyncio.run(pool.start())
+    asyncio.run(pool.close())
+
+
+@pytest.mark.asyncio
+async def test_closed_pool_rejects_acquire_and_close_is_idempotent() -> None:
+    pool = await create_pool("localhost:19001", **_kwargs())
+    async with pool.acquire() as conn:
+        pass
+    await pool.close()
+    await pool.close()
+    assert pool.closed and conn.closed
+    with pytest.raises(InterfaceError, match="Pool is closed"):
+        async with pool.acquire():
+            pass
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_size": 0}, "max_size"),
+        ({"min_size": 3, "max_size": 2}, "must not exceed"),
+        ({"health_check_interval": -1}, "health_check_interval"),
+        ({"bogus": 1}, "invalid AsyncConnection argument"),
+    ],
+)
+def test_invalid_configuration_rejected(kwargs: dict[str, object], match: str) -> None:
+    with pytest.raises(ProgrammingError, match=match):
+        AsyncPool("localhost:19001", **kwargs)  # type: ignore[arg-type]
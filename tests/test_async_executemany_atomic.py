@@ -34,6 +34,8 @@ async def test_executemany_blocks_concurrent_execute_until_loop_ends() -> None:
         self: AsyncCursor,
         operation: str,
         parameters: object = None,
+        cache_slot: object = None,
+        info: object = None,
     ) -> None:
         tag = "exec-many" if "INSERT" in operation else "concurrent"
         order.append(f"{tag}:start")
@@ -141,3 +141,22 @@ def test_resource_warning_silenced_by_force_close_through_module_scope() -> None
         if issubclass(w.category, ResourceWarning) and "AsyncConnection" in str(w.message)
     ]
     assert not rw, f"force_close should silence warning; got: {[str(w.message) for w in rw]}"
+
+
+def test_gc_warning_names_the_normalised_seed_list() -> None:
+    """A seed-list ``address`` is reported in its canonical
+    comma-joined form, not as the raw list the caller passed."""
+    from dqlitedbapi.aio.connection import AsyncConnection
+
+    conn = AsyncConnection(["a:1", "b:2", "a:1"], database="x")
+    conn._connected_flag[0] = True
+
+    with warnings.catch_warnings(record=True) as captured:
+        warnings.simplefilter("always")
+        del conn
+        gc.collect()
+
+    rw = [w for w in captured if issubclass(w.category, ResourceWarning)]
+    assert len(rw) == 1
+    assert "a:1,b:2" in str(rw[0].message)
+    assert "[" not in str(rw[0].message)
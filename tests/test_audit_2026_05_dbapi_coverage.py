@@ -391,7 +391,7 @@ def test_run_sync_ki_cleanup_exception_debug_logged(
     with (
         patch.object(conn, "_ensure_loop", return_value=fake_loop),
         patch(
-            "dqlitedbapi.connection.asyncio.run_coroutine_threadsafe",
+            "dqlitedbapi.connection._submit_threadsafe",
             return_value=fake_future,
         ),
         caplog.at_level(logging.DEBUG, logger="dqlitedbapi.connection"),
@@ -0,0 +1,121 @@
+"""``fetch_numpy`` / ``fetch_arrow_table`` on the sync and async cursors.
+
+NumPy and pyarrow are optional. The missing-dependency contract
+(``NotSupportedError``, rows left unconsumed) is pinned with an
+import stub; the conversion tests run only where the library is
+installed.
+"""
+
+import datetime
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from dqlitedbapi import _columnar
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.aio.cursor import AsyncCursor
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.exceptions import NotSupportedError
+from dqlitewire.constants import ValueType
+
+
+def _desc(*cols: tuple[str, Any]) -> tuple[tuple[Any, ...], ...]:
+    return tuple((n, t, None, None, None, None, None) for n, t in cols)
+
+
+_DESC = _desc(
+    ("i", ValueType.INTEGER),
+    ("f", ValueType.FLOAT),
+    ("s", ValueType.TEXT),
+    ("b", ValueType.BLOB),
+    ("n", ValueType.INTEGER),
+    ("t", ValueType.UNIXTIME),
+)
+_UTC = datetime.UTC
+_ROWS = [
+    (1, 0.5, "a", b"\x00", None, datetime.datetime(2024, 1, 1, tzinfo=_UTC)),
+    (2, 1.5, "b", b"\x01", 7, datetime.datetime(2024, 1, 2, tzinfo=_UTC)),
+]
+
+
+@pytest.fixture
+def conn() -> Iterator[Connection]:
+    conn = Connection("localhost:19001", timeout=2.0)
+    yield conn
+    conn.close()
+
+
+def _fetch(
+    conn: Connection,
+    method: str,
+    description: tuple[tuple[Any, ...], ...] = _DESC,
+    rows: list[tuple[Any, ...]] = _ROWS,
+) -> Any:
+    cur = conn.cursor()
+    cur._description = description
+    cur._rows = list(rows)
+    return getattr(cur, method)()
+
+
+def _no_module(name: str) -> Any:
+    raise ImportError(f"No module named {name!r}")
+
+
+@pytest.mark.parametrize("method", ["fetch_numpy", "fetch_arrow_table"])
+def test_missing_dependency_raises_and_keeps_rows(method: str) -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    try:
+        cur = conn.cursor()
+        cur._description = _DESC
+        cur._rows = list(_ROWS)
+        with (
+            patch.object(_columnar.importlib, "import_module", _no_module),
+            pytest.raises(NotSupportedError, match="not installed"),
+        ):
+            getattr(cur, method)()
+        assert cur.fetchall() == _ROWS
+    finally:
+        conn.close()
+
+
+@pytest.mark.asyncio
+async def test_async_missing_dependency_raises() -> None:
+    cur = AsyncCursor(AsyncConnection("localhost:19001", timeout=2.0))
+    cur._description = _DESC
+    cur._rows = list(_ROWS)
+    with (
+        patch.object(_columnar.importlib, "import_module", _no_module),
+        pytest.raises(NotSupportedError),
+    ):
+        await cur.fetch_arrow_table()
+
+
+def test_numpy_export(conn: Connection) -> None:
+    np = pytest.importorskip("numpy")
+    arrays = _fetch(conn, "fetch_numpy")
+    assert arrays["i"].dtype == np.int64 and arrays["i"].tolist() == [1, 2]
+    assert arrays["f"].dtype == np.float64
+    assert arrays["s"].dtype == object and arrays["s"].tolist() == ["a", "b"]
+    assert arrays["b"].tolist() == [b"\x00", b"\x01"]
+    assert arrays["n"].tolist() == [None, 7]
+
+
+def test_arrow_export(conn: Connection) -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = _fetch(conn, "fetch_arrow_table")
+    assert table.schema.field("i").type == pa.int64()
+    assert table.schema.field("f").type == pa.float64()
+    assert table.schema.field("s").type == pa.string()
+    assert table.schema.field("b").type == pa.binary()
+    assert table.schema.field("n").type == pa.int64()
+    assert table.column("n").to_pylist() == [None, 7]
+    assert table.schema.field("t").type == pa.timestamp("us", tz="UTC")
+    assert table.column("i").to_pylist() == [1, 2]
+
+
+def test_arrow_falls_back_to_inference_for_mixed_rows(conn: Connection) -> None:
+    pytest.importorskip("pyarrow")
+    table = _fetch(conn, "fetch_arrow_table", _desc(("x", ValueType.INTEGER)), [(1,), (2.5,)])
+    assert table.column("x").to_pylist() == [1.0, 2.5]
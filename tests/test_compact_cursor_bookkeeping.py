@@ -0,0 +1,88 @@
+"""Per-statement allocation trims on cursors and their connection.
+
+``Cursor.messages`` / ``AsyncCursor.messages`` are allocated on first
+read and never by the clearing step, and ``Connection._cursors`` is a
+``_CursorRegistry`` (callback-free weak refs, bulk-pruned) instead of
+a ``WeakSet``.
+"""
+
+import gc
+
+import pytest
+
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.connection import _CURSOR_REGISTRY_MIN_PRUNE, Connection, _CursorRegistry
+
+
+class _Item:
+    __slots__ = ("__weakref__",)
+
+
+def test_cursor_has_no_instance_dict() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    try:
+        cur = conn.cursor()
+        assert not hasattr(cur, "__dict__")
+    finally:
+        conn.close()
+
+
+def test_messages_allocated_on_first_read_only() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    try:
+        cur = conn.cursor()
+        cur.fetchall()
+        cur.close()
+        assert cur._messages is None
+        assert cur.messages == []
+        assert cur.messages is cur._messages
+        cur.messages.append((Warning, "x"))
+        del cur.messages[:]
+        assert cur.messages == []
+    finally:
+        conn.close()
+
+
+def test_registry_tracks_live_cursors_only() -> None:
+    reg: _CursorRegistry[_Item] = _CursorRegistry()
+    keep = _Item()
+    drop = _Item()
+    reg.add(keep)
+    reg.add(drop)
+    del drop
+    gc.collect()
+    assert list(reg) == [keep]
+    assert len(reg) == 1
+    assert keep in reg
+    reg.clear()
+    assert len(reg) == 0
+
+
+def test_registry_prunes_dead_refs_in_bulk() -> None:
+    reg: _CursorRegistry[_Item] = _CursorRegistry()
+    keep = _Item()
+    reg.add(keep)
+    for _ in range(_CURSOR_REGISTRY_MIN_PRUNE * 10):
+        reg.add(_Item())
+    assert len(reg._refs) <= _CURSOR_REGISTRY_MIN_PRUNE + 1
+    assert list(reg) == [keep]
+
+
+def test_close_cascades_through_registry() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    cur = conn.cursor()
+    assert isinstance(conn._cursors, _CursorRegistry)
+    conn.close()
+    assert cur.closed
+    assert len(conn._cursors) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_cursor_messages_lazy_and_cascade() -> None:
+    aconn = AsyncConnection("localhost:19001", timeout=2.0)
+    cur = aconn.cursor()
+    assert cur._messages is None
+    assert cur in aconn._cursors
+    await aconn.close()
+    assert cur._closed
+    assert cur._messages is None
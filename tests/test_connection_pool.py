@@ -0,0 +1,232 @@
+"""``dqlitedbapi.pool.ConnectionPool``: thread-aware pooling of sync
+dbapi connections.
+
+``Connection.connect`` is patched to a no-op so no cluster is needed;
+the pool's own bookkeeping (reuse, per-thread affinity, the size
+bound, release-time reset, health checks, fork handling) is what is
+pinned here.
+"""
+
+import threading
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from dqlitedbapi import pool as _pool_mod
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.cursor import Cursor
+from dqlitedbapi.exceptions import InterfaceError, OperationalError, ProgrammingError
+from dqlitedbapi.pool import ConnectionPool
+
+
+@pytest.fixture(autouse=True)
+def _no_network() -> Iterator[None]:
+    with patch.object(Connection, "connect", lambda self: None):
+        yield
+
+
+def _make(**kwargs: object) -> ConnectionPool:
+    return ConnectionPool("localhost:19001", timeout=2.0, **kwargs)  # type: ignore[arg-type]
+
+
+def test_same_thread_reuses_connection() -> None:
+    with _make(max_size=2) as pool:
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            assert second is first
+        assert pool.size == 1
+
+
+def test_min_size_warms_pool() -> None:
+    with _make(min_size=2, max_size=3) as pool:
+        assert pool.size == 2
+
+
+def test_failed_warmup_closes_opened_connections() -> None:
+    opened: list[Connection] = []
+
+    def connect(self: Connection) -> None:
+        if len(opened) == 2:
+            raise OperationalError("node down")
+        opened.append(self)
+
+    with patch.object(Connection, "connect", connect), pytest.raises(OperationalError):
+        _make(min_size=3, max_size=3)
+    assert len(opened) == 2
+    assert all(conn.closed for conn in opened)
+
+
+def test_other_thread_never_gets_foreign_connection() -> None:
+    with _make(max_size=4) as pool:
+        with pool.acquire() as mine:
+            pass
+        seen: list[Connection] = []
+
+        def worker() -> None:
+            with pool.acquire() as conn:
+                seen.append(conn)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        assert seen[0] is not mine
+        assert pool.size == 2
+
+
+def test_full_pool_evicts_foreign_idle_connection() -> None:
+    with _make(max_size=1) as pool:
+        with pool.acquire() as mine:
+            pass
+        seen: list[Connection] = []
+
+        def worker() -> None:
+            with pool.acquire() as conn:
+                seen.append(conn)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        assert mine.closed
+        assert pool.size == 1
+
+
+def test_acquire_times_out_when_exhausted() -> None:
+    with (
+        _make(max_size=1, acquire_timeout=0.05) as pool,
+        pool.acquire(),
+        pytest.raises(OperationalError, match="timed out"),
+        pool.acquire(),
+    ):
+        pass
+
+
+def test_waiter_is_woken_by_release() -> None:
+    with _make(max_size=1, acquire_timeout=5.0) as pool:
+        held = threading.Event()
+        release = threading.Event()
+
+        def holder() -> None:
+            with pool.acquire():
+                held.set()
+                release.wait()
+
+        t = threading.Thread(target=holder)
+        t.start()
+        held.wait()
+        threading.Timer(0.05, release.set).start()
+        with pool.acquire() as conn:
+            assert not conn.closed
+        t.join()
+
+
+def test_release_rolls_back_open_transaction() -> None:
+    with _make() as pool:
+        with (
+            patch.object(Connection, "in_transaction", True),
+            patch.object(Connection, "rollback") as rollback,
+            pool.acquire(),
+        ):
+            pass
+        rollback.assert_called_once()
+        assert pool.size == 1
+
+
+def test_failed_reset_discards_connection() -> None:
+    with _make() as pool:
+        with (
+            patch.object(Connection, "in_transaction", True),
+            patch.object(Connection, "rollback", side_effect=OperationalError("gone")),
+            pool.acquire() as conn,
+        ):
+            pass
+        assert conn.closed
+        assert pool.size == 0
+
+
+def test_pre_ping_replaces_dead_connection() -> None:
+    with _make(pre_ping=True) as pool:
+        with pool.acquire() as first:
+            pass
+        with (
+            patch.object(Cursor, "execute", side_effect=OperationalError("not leader")),
+            pool.acquire() as second,
+        ):
+            pass
+        assert first.closed
+        assert second is not first
+
+
+def test_max_lifetime_recycles() -> None:
+    with _make(max_lifetime=0.01) as pool:
+        with pool.acquire() as first:
+            pass
+        with (
+            patch.object(_pool_mod.time, "monotonic", return_value=1e12),
+            pool.acquire() as second,
+        ):
+            pass
+        assert first.closed
+        assert second is not first
+
+
+def test_max_idle_respects_min_size() -> None:
+    with _make(min_size=1, max_size=3, max_idle=0.01) as pool:
+        with pool.acquire(), pool.acquire():
+            pass
+        assert pool.size >= 1
+        with (
+            patch.object(_pool_mod.time, "monotonic", return_value=1e12),
+            pool.acquire(),
+        ):
+            assert pool.size == 1
+
+
+def test_foreign_connection_release_rejected() -> None:
+    with _make() as pool, pytest.raises(ProgrammingError, match="not checked out"):
+        pool._checkin(Connection("localhost:19001"))
+
+
+def test_closed_pool_rejects_acquire_and_close_is_idempotent() -> None:
+    pool = _make()
+    with pool.acquire() as conn:
+        pass
+    pool.close()
+    pool.close()
+    assert pool.closed
+    assert conn.closed
+    with pytest.raises(InterfaceError, match="Pool is closed"), pool.acquire():
+        pass
+
+
+def test_fork_discards_inherited_connections() -> None:
+    with _make() as pool:
+        with pool.acquire() as inherited:
+            pass
+        with patch.object(_pool_mod, "get_current_pid", return_value=-1):
+            with pool.acquire() as fresh:
+                assert fresh is not inherited
+            assert pool.size == 1
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_size": 0}, "max_size"),
+        ({"min_size": -1}, "min_size"),
+        ({"min_size": 3, "max_size": 2}, "must not exceed"),
+        ({"max_idle": 0}, "max_idle"),
+        ({"bogus": 1}, "invalid Connection argument"),
+    ],
+)
+def test_invalid_configuration_rejected(kwargs: dict[str, object], match: str) -> None:
+    with pytest.raises(ProgrammingError, match=match):
+        _make(**kwargs)
+
+
+def test_not_picklable() -> None:
+    import pickle
+
+    with _make() as pool, pytest.raises(TypeError, match="cannot pickle"):
+        pickle.dumps(pool)
@@ -0,0 +1,80 @@
+"""Consumed rows are released from the cursor buffer during fetch.
+
+``_compact_rows`` drops the fetched prefix of ``_rows`` once it is
+both past ``_COMPACT_MIN_ROWS`` and at least half the buffer, folding
+the count into ``_row_offset``. Pinned here: memory is released,
+``rownumber`` stays absolute, ``fetchall`` after compaction returns
+exactly the tail, and a partially converted lazy buffer keeps its
+conversion watermark aligned.
+"""
+
+import datetime
+from typing import Any
+
+import pytest
+
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.aio.cursor import AsyncCursor
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.cursor import _COMPACT_MIN_ROWS, _buffer_wire_rows
+from dqlitewire.constants import ValueType
+
+_N = _COMPACT_MIN_ROWS * 3
+_DESC = (("n", None, None, None, None, None, None),)
+
+
+@pytest.fixture
+def sync_cursor() -> Any:
+    conn = Connection("localhost:19001", timeout=2.0)
+    cur = conn.cursor()
+    cur._description = _DESC
+    cur._rows = [(i,) for i in range(_N)]
+    yield cur
+    conn.close()
+
+
+def test_fetchone_releases_consumed_rows(sync_cursor: Any) -> None:
+    for i in range(_COMPACT_MIN_ROWS * 2):
+        assert sync_cursor.fetchone() == (i,)
+    assert len(sync_cursor._rows) < _N
+    assert sync_cursor.rownumber == _COMPACT_MIN_ROWS * 2
+    assert sync_cursor.fetchone() == (_COMPACT_MIN_ROWS * 2,)
+
+
+def test_fetchmany_then_fetchall_after_compaction(sync_cursor: Any) -> None:
+    head = sync_cursor.fetchmany(_COMPACT_MIN_ROWS * 2)
+    assert head[-1] == (_COMPACT_MIN_ROWS * 2 - 1,)
+    assert sync_cursor._row_index == 0
+    assert len(sync_cursor._rows) == _COMPACT_MIN_ROWS
+    assert sync_cursor.fetchall() == [(i,) for i in range(_COMPACT_MIN_ROWS * 2, _N)]
+    assert sync_cursor.rownumber == _N
+    assert sync_cursor._rows == []
+
+
+def test_no_compaction_below_threshold(sync_cursor: Any) -> None:
+    sync_cursor.fetchmany(_COMPACT_MIN_ROWS - 1)
+    assert len(sync_cursor._rows) == _N
+    assert sync_cursor.rownumber == _COMPACT_MIN_ROWS - 1
+
+
+def test_partially_converted_buffer_stays_aligned(sync_cursor: Any) -> None:
+    iso = int(ValueType.ISO8601)
+    rows = [[f"2024-01-01 00:00:{i % 60:02d}"] for i in range(_N)]
+    _buffer_wire_rows(sync_cursor, rows, [[iso]] * _N, [iso])
+    sync_cursor.fetchmany(_COMPACT_MIN_ROWS * 2)
+    assert len(sync_cursor._raw_row_types) == len(sync_cursor._rows)
+    assert sync_cursor._converted == 0
+    expected = datetime.datetime(2024, 1, 1, 0, 0, (_COMPACT_MIN_ROWS * 2) % 60)
+    assert sync_cursor.fetchone() == (expected,)
+    assert sync_cursor.rownumber == _COMPACT_MIN_ROWS * 2 + 1
+
+
+@pytest.mark.asyncio
+async def test_async_cursor_compacts() -> None:
+    cur = AsyncCursor(AsyncConnection("localhost:19001", timeout=2.0))
+    cur._description = _DESC
+    cur._rows = [(i,) for i in range(_N)]
+    await cur.fetchmany(_COMPACT_MIN_ROWS * 2)
+    assert len(cur._rows) == _COMPACT_MIN_ROWS
+    assert cur.rownumber == _COMPACT_MIN_ROWS * 2
+    assert await cur.fetchall() == [(i,) for i in range(_COMPACT_MIN_ROWS * 2, _N)]
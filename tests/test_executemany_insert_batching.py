@@ -0,0 +1,178 @@
+"""Opt-in ``executemany_batch_size``: plain ``INSERT ... VALUES (?, ...)``
+batches are folded into multi-row ``VALUES`` statements.
+
+Pins the statement shapes admitted to the rewrite, chunking, the
+``rowcount`` / ``completed_iterations`` contract on success and on a
+mid-batch failure, the per-row-length guard, and sync/async parity.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+import dqlitedbapi
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.aio.cursor import AsyncCursor
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.cursor import Cursor, _split_values_insert
+from dqlitedbapi.exceptions import OperationalError, ProgrammingError
+from dqlitedbapi.testing import LoopbackCluster
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        ("INSERT INTO t VALUES (?)", ("INSERT INTO t VALUES ", 1)),
+        ("insert into t (a, b) values ( ?, ? );", ("insert into t (a, b) VALUES ", 2)),
+        ("INSERT OR IGNORE INTO t VALUES (?,?)", ("INSERT OR IGNORE INTO t VALUES ", 2)),
+        ("REPLACE INTO t VALUES (?)", ("REPLACE INTO t VALUES ", 1)),
+    ],
+)
+def test_split_admits_plain_values_insert(sql: str, expected: tuple[str, int]) -> None:
+    assert _split_values_insert(sql) == expected
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "INSERT INTO t VALUES (?) RETURNING id",
+        "INSERT INTO t VALUES (?) ON CONFLICT DO NOTHING",
+        "INSERT INTO t SELECT a FROM s UNION VALUES (?)",
+        "INSERT INTO t VALUES (1) UNION VALUES (?)",
+        "INSERT INTO t VALUES (?1, ?2)",
+        "INSERT INTO t VALUES (?, 1)",
+        "INSERT INTO t SELECT ? -- VALUES (?)",
+        "WITH c AS (SELECT 1) INSERT INTO t VALUES (?)",
+        "UPDATE t SET a = ? WHERE b = ?",
+        "INSERT INTO t DEFAULT VALUES",
+    ],
+)
+def test_split_rejects_shapes_a_rewrite_could_change(sql: str) -> None:
+    assert _split_values_insert(sql) is None
+
+
+def _recording_execute(calls: list[tuple[str, Any]], fail_on: int | None = None) -> Any:
+    async def _execute(
+        self: Any, operation: str, parameters: Sequence[Any] | None = None, info: Any = None
+    ) -> None:
+        calls.append((operation, parameters))
+        if fail_on is not None and len(calls) == fail_on:
+            raise OperationalError("UNIQUE constraint failed", 2067)
+        self._description = None
+        self._rows = []
+        self._row_index = 0
+        self._rowcount = operation.count("(?")
+
+    return _execute
+
+
+def test_sync_executemany_folds_rows_into_chunks() -> None:
+    conn = Connection("localhost:19001", timeout=2.0, executemany_batch_size=2)
+    calls: list[tuple[str, Any]] = []
+    try:
+        cur = conn.cursor()
+        with patch.object(Cursor, "_execute_async", _recording_execute(calls)):
+            cur.executemany("INSERT INTO t (a, b) VALUES (?, ?)", [(i, -i) for i in range(5)])
+        assert calls == [
+            ("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)", [0, 0, 1, -1]),
+            ("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)", [2, -2, 3, -3]),
+            ("INSERT INTO t (a, b) VALUES (?, ?)", [4, -4]),
+        ]
+        assert cur.rowcount == 5
+        assert cur.completed_iterations == 5
+        assert cur.lastrowid is None
+    finally:
+        conn.close()
+
+
+def test_sync_failed_chunk_counts_only_committed_chunks() -> None:
+    conn = Connection("localhost:19001", timeout=2.0, executemany_batch_size=2)
+    calls: list[tuple[str, Any]] = []
+    try:
+        cur = conn.cursor()
+        with (
+            patch.object(Cursor, "_execute_async", _recording_execute(calls, fail_on=2)),
+            pytest.raises(OperationalError),
+        ):
+            cur.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(5)])
+        assert len(calls) == 2
+        assert cur.completed_iterations == 2
+        assert cur.rowcount == -1
+    finally:
+        conn.close()
+
+
+def test_sync_wrong_row_width_raises_before_sending_chunk() -> None:
+    conn = Connection("localhost:19001", timeout=2.0, executemany_batch_size=10)
+    calls: list[tuple[str, Any]] = []
+    try:
+        cur = conn.cursor()
+        with (
+            patch.object(Cursor, "_execute_async", _recording_execute(calls)),
+            pytest.raises(ProgrammingError, match="uses 2, and there are 1 supplied"),
+        ):
+            cur.executemany("INSERT INTO t VALUES (?, ?)", [(1, 2), (3,)])
+        assert calls == []
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "sql"),
+    [
+        (None, "INSERT INTO t VALUES (?)"),
+        (100, "UPDATE t SET a = ?"),
+    ],
+)
+def test_sync_per_row_when_not_batchable(batch_size: int | None, sql: str) -> None:
+    conn = Connection("localhost:19001", timeout=2.0, executemany_batch_size=batch_size)
+    calls: list[tuple[str, Any]] = []
+    try:
+        cur = conn.cursor()
+        with patch.object(Cursor, "_execute_async", _recording_execute(calls)):
+            cur.executemany(sql, [(1,), (2,), (3,)])
+        assert calls == [(sql, (1,)), (sql, (2,)), (sql, (3,))]
+        assert cur.completed_iterations == 3
+    finally:
+        conn.close()
+
+
+@pytest.mark.asyncio
+async def test_async_executemany_folds_rows_into_chunks() -> None:
+    conn = AsyncConnection("localhost:19001", timeout=2.0, executemany_batch_size=3)
+    calls: list[tuple[str, Any]] = []
+    cur = AsyncCursor(conn)
+    with patch.object(AsyncCursor, "_execute_unlocked", _recording_execute(calls)):
+        await cur.executemany("INSERT INTO t VALUES (?)", ((i,) for i in range(4)))
+    assert calls == [
+        ("INSERT INTO t VALUES (?), (?), (?)", [0, 1, 2]),
+        ("INSERT INTO t VALUES (?)", [3]),
+    ]
+    assert cur.rowcount == 4
+    assert cur.completed_iterations == 4
+
+
+def test_chunk_sql_bypasses_statement_cache() -> None:
+    cluster = LoopbackCluster()
+    with cluster.serve_in_thread():
+        conn = dqlitedbapi.connect(cluster.address, timeout=5.0, executemany_batch_size=2)
+        try:
+            cur = conn.cursor()
+            cur.execute("CREATE TABLE t (a)")
+            cur.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(5)])
+            assert cur.execute("SELECT count(*) FROM t").fetchone() == (5,)
+            assert list(conn._statement_cache._entries) == [
+                "CREATE TABLE t (a)",
+                "INSERT INTO t VALUES (?)",
+                "SELECT count(*) FROM t",
+            ]
+        finally:
+            conn.close()
+
+
+@pytest.mark.parametrize("bad", [0, -1, True, 1.5])
+def test_invalid_batch_size_rejected(bad: object) -> None:
+    with pytest.raises(ProgrammingError, match="executemany_batch_size"):
+        Connection("localhost:19001", executemany_batch_size=bad)  # type: ignore[arg-type]
@@ -0,0 +1,150 @@
+"""``Cursor.fetch_columns`` / ``AsyncCursor.fetch_columns``: column-wise
+fetch with compact ``array.array`` packing for NULL-free INTEGER /
+FLOAT columns.
+
+Buffered state is seeded directly, as in the other fetch-verb tests,
+so no cluster is needed.
+"""
+
+import array
+import datetime
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from dqlitedbapi import cursor as _cursor_mod
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.aio.cursor import AsyncCursor
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.cursor import _buffer_wire_rows
+from dqlitedbapi.exceptions import DataError, ProgrammingError
+from dqlitewire.constants import ValueType
+
+_INT = int(ValueType.INTEGER)
+_ISO = int(ValueType.ISO8601)
+
+
+def _desc(*names: str) -> tuple[tuple[Any, ...], ...]:
+    return tuple((n, None, None, None, None, None, None) for n in names)
+
+
+@pytest.fixture
+def conn() -> Iterator[Connection]:
+    conn = Connection("localhost:19001", timeout=2.0)
+    yield conn
+    conn.close()
+
+
+def _fetch_columns(
+    conn: Connection, description: tuple[tuple[Any, ...], ...], rows: list[tuple[Any, ...]]
+) -> dict[str, Any]:
+    cur = conn.cursor()
+    cur._description = description
+    cur._rows = list(rows)
+    cur._rowcount = len(rows)
+    return cur.fetch_columns()
+
+
+def test_homogeneous_numeric_columns_are_packed(conn: Connection) -> None:
+    cols = _fetch_columns(conn, _desc("i", "f", "s"), [(1, 1.5, "a"), (2, 2.5, "b")])
+    assert isinstance(cols["i"], array.array) and cols["i"].typecode == "q"
+    assert isinstance(cols["f"], array.array) and cols["f"].typecode == "d"
+    assert list(cols["i"]) == [1, 2]
+    assert list(cols["f"]) == [1.5, 2.5]
+    assert cols["s"] == ["a", "b"]
+    assert list(cols) == ["i", "f", "s"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, None],  # NULL
+        [1, 2.0],  # mixed storage classes
+        [True, False],  # BOOLEAN decodes to bool, not int
+        [datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2)],
+    ],
+)
+def test_other_columns_stay_lists(conn: Connection, values: list[Any]) -> None:
+    cols = _fetch_columns(conn, _desc("c"), [(v,) for v in values])
+    assert cols["c"] == values
+    assert type(cols["c"]) is list
+
+
+def test_empty_result_yields_empty_columns(conn: Connection) -> None:
+    assert _fetch_columns(conn, _desc("a", "b"), []) == {"a": [], "b": []}
+
+
+def test_duplicate_names_rejected(conn: Connection) -> None:
+    with pytest.raises(ProgrammingError, match="unique column names"):
+        _fetch_columns(conn, _desc("a", "a"), [(1, 2)])
+
+
+def test_sync_fetch_columns_consumes_remaining_rows() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    try:
+        cur = conn.cursor()
+        cur._description = _desc("x")
+        cur._rows = [(1,), (2,), (3,)]
+        cur._rowcount = 3
+        assert cur.fetchone() == (1,)
+        cols = cur.fetch_columns()
+        assert list(cols["x"]) == [2, 3]
+        assert cur.fetchall() == []
+        assert cur.rownumber == 3
+    finally:
+        conn.close()
+
+
+def test_sync_fetch_columns_without_result_set() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    try:
+        assert conn.cursor().fetch_columns() == {}
+    finally:
+        conn.close()
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_columns() -> None:
+    cur = AsyncCursor(AsyncConnection("localhost:19001", timeout=2.0))
+    cur._description = _desc("x", "y")
+    cur._rows = [(1, "a"), (2, None)]
+    cols = await cur.fetch_columns()
+    assert cols["x"] == array.array("q", [1, 2])
+    assert cols["y"] == ["a", None]
+    assert await cur.fetchall() == []
+
+
+def test_fetch_columns_transposes_raw_wire_rows() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    try:
+        cur = conn.cursor()
+        cur._description = _desc("n", "t")
+        rows = [[1, "2024-01-01 00:00:00"], [2, "2024-01-02 00:00:00"], [3, None]]
+        types = [[_INT, _ISO], [_INT, _ISO], [_INT, int(ValueType.NULL)]]
+        _buffer_wire_rows(cur, rows, types, types[0])
+        assert cur.fetchone() == (1, datetime.datetime(2024, 1, 1))
+        with patch.object(_cursor_mod, "_convert_row") as convert_row:
+            cols = cur.fetch_columns()
+        # No per-row tuple is built for the remaining raw rows.
+        convert_row.assert_not_called()
+        assert cols["n"] == array.array("q", [2, 3])
+        assert cols["t"] == [datetime.datetime(2024, 1, 2), None]
+        assert cur.fetchall() == []
+    finally:
+        conn.close()
+
+
+def test_fetch_columns_bad_cell_leaves_rows_unfetched() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    try:
+        cur = conn.cursor()
+        cur._description = _desc("t")
+        _buffer_wire_rows(cur, [["2024-01-01"], ["garbage"]], [[_ISO], [_ISO]], [_ISO])
+        with pytest.raises(DataError):
+            cur.fetch_columns()
+        assert cur.rownumber == 0
+        assert cur.fetchone() == (datetime.datetime(2024, 1, 1),)
+    finally:
+        conn.close()
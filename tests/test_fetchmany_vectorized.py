@@ -0,0 +1,94 @@
+"""``fetchmany`` validates once and slices the buffer instead of
+calling ``fetchone`` ``size`` times; ``row_factory.batch`` is a
+batch-level factory hook honoured by ``fetchmany`` and ``fetchall``.
+"""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dqlitedbapi.aio.cursor import AsyncCursor
+from dqlitedbapi.cursor import Cursor
+
+
+def _make_sync_cursor(n: int) -> Cursor:
+    cur = Cursor.__new__(Cursor)
+    cur._closed = False
+    cur._description = (("col", None, None, None, None, None, None),)
+    cur._rowcount = n
+    cur._lastrowid = None
+    cur._row_factory = None
+    cur._rows = [(i,) for i in range(n)]
+    cur._row_index = 0
+    cur._row_offset = 0
+    cur._arraysize = 1
+    cur.messages = []
+    cur._connection = MagicMock()
+    return cur
+
+
+class _BatchFactory:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def __call__(self, _cur: object, row: tuple[Any, ...]) -> Any:
+        raise AssertionError("per-row path must not run when batch is defined")
+
+    def batch(self, _cur: object, rows: list[tuple[Any, ...]]) -> list[Any]:
+        self.batches.append(len(rows))
+        return [r[0] for r in rows]
+
+
+def test_fetchmany_validates_once_and_never_calls_fetchone() -> None:
+    cur = _make_sync_cursor(10)
+    with patch.object(Cursor, "fetchone", side_effect=AssertionError) as one:
+        assert cur.fetchmany(4) == [(0,), (1,), (2,), (3,)]
+    one.assert_not_called()
+    cur._connection._check_thread.assert_called_once()
+    assert cur.fetchmany(100) == [(i,) for i in range(4, 10)]
+    assert cur.fetchmany(5) == []
+    assert cur.rownumber == 10
+
+
+def test_per_row_factory_applied_across_slice() -> None:
+    cur = _make_sync_cursor(5)
+    cur._row_factory = lambda _c, r: r[0] * 10
+    assert cur.fetchmany(3) == [0, 10, 20]
+    assert cur.fetchone() == 30
+
+
+def test_batch_hook_used_by_fetchmany_and_fetchall() -> None:
+    cur = _make_sync_cursor(5)
+    factory = _BatchFactory()
+    cur._row_factory = factory
+    assert cur.fetchmany(2) == [0, 1]
+    assert cur.fetchall() == [2, 3, 4]
+    assert factory.batches == [2, 3]
+
+
+def test_batch_hook_raise_consumes_nothing() -> None:
+    cur = _make_sync_cursor(3)
+    factory = _BatchFactory()
+    factory.batch = MagicMock(side_effect=RuntimeError("boom"))  # type: ignore[method-assign]
+    cur._row_factory = factory
+    with pytest.raises(RuntimeError):
+        cur.fetchmany(2)
+    assert cur._row_index == 0
+
+
+@pytest.mark.asyncio
+async def test_async_fetchmany_slices() -> None:
+    cur = AsyncCursor.__new__(AsyncCursor)
+    cur._closed = False
+    cur._description = (("col", None, None, None, None, None, None),)
+    cur._row_factory = _BatchFactory()
+    cur._rows = [(i,) for i in range(5)]
+    cur._row_index = 0
+    cur._row_offset = 0
+    cur._arraysize = 2
+    cur.messages = []
+    cur._connection = MagicMock()
+    assert await cur.fetchmany() == [0, 1]
+    assert await cur.fetchmany(10) == [2, 3, 4]
+    assert cur._row_factory.batches == [2, 3]
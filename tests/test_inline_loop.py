@@ -0,0 +1,143 @@
+"""``Connection(inline_loop=True)`` runs the event loop on the calling
+thread instead of a background thread.
+
+Pins: no thread is ever started, results and errors round-trip as on
+the threaded path, the timeout still invalidates the connection, use
+from inside a running loop is refused, and close / GC close the
+private loop.
+"""
+
+import asyncio
+import gc
+import threading
+import warnings
+from typing import Any
+
+import pytest
+
+import dqlitedbapi
+from dqliteclient import exceptions as _client_exc
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.exceptions import IntegrityError, OperationalError, ProgrammingError
+from dqlitewire.constants import ValueType
+
+_INT = int(ValueType.INTEGER)
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.in_transaction = False
+        self.delay = 0.0
+        self.fail_with: Exception | None = None
+        self.invalidated: BaseException | None = None
+        self.loops: set[int] = set()
+
+    async def query_raw_typed(self, sql: str, params: Any) -> tuple[Any, Any, Any, Any]:
+        self.loops.add(id(asyncio.get_running_loop()))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return ["n"], [_INT], [[_INT], [_INT]], [[1], [2]]
+
+    async def execute(self, sql: str, params: Any = None) -> tuple[int, int]:
+        if self.fail_with is not None:
+            raise self.fail_with
+        verb = sql.split()[0].upper()
+        if verb == "BEGIN":
+            self.in_transaction = True
+        elif verb in ("COMMIT", "ROLLBACK"):
+            self.in_transaction = False
+        return 3, 1
+
+    async def close(self) -> None:
+        pass
+
+    def _invalidate(self, cause: BaseException | None = None) -> None:
+        self.invalidated = cause
+
+
+def _inline_conn(timeout: float = 2.0) -> tuple[Connection, _FakeClient]:
+    conn = Connection("localhost:19001", timeout=timeout, inline_loop=True)
+    client = _FakeClient()
+
+    async def get_client() -> _FakeClient:
+        conn._async_conn = client  # type: ignore[assignment]
+        return client
+
+    conn._get_async_connection = get_client  # type: ignore[method-assign]
+    return conn, client
+
+
+def test_runs_on_calling_thread() -> None:
+    baseline = threading.active_count()
+    conn, client = _inline_conn()
+    try:
+        cur = conn.cursor()
+        assert cur.execute("SELECT n FROM t").fetchall() == [(1,), (2,)]
+        cur.execute("SELECT n FROM t")
+        assert threading.active_count() == baseline
+        assert conn._thread is None
+        assert client.loops == {id(conn._loop)}
+    finally:
+        conn.close()
+    assert conn._loop is None
+
+
+def test_errors_and_transactions_map_as_usual() -> None:
+    conn, client = _inline_conn()
+    try:
+        cur = conn.cursor()
+        cur.execute("BEGIN")
+        cur.execute("INSERT INTO t VALUES (1)")
+        assert (cur.rowcount, cur.lastrowid) == (1, 3)
+        conn.commit()
+        assert not client.in_transaction
+        client.fail_with = _client_exc.OperationalError("UNIQUE constraint failed", 2067)
+        with pytest.raises(IntegrityError):
+            cur.execute("INSERT INTO t VALUES (1)")
+    finally:
+        conn.close()
+
+
+def test_timeout_invalidates_connection() -> None:
+    conn, client = _inline_conn(timeout=0.05)
+    try:
+        client.delay = 5.0
+        with pytest.raises(OperationalError, match="timed out"):
+            conn.cursor().execute("SELECT n FROM t")
+        assert conn._async_conn is None
+        assert isinstance(client.invalidated, OperationalError)
+        # The lock was released and the loop is reusable.
+        client.delay = 0.0
+        assert conn.cursor().execute("SELECT n FROM t").fetchone() == (1,)
+    finally:
+        conn.close()
+
+
+@pytest.mark.asyncio
+async def test_refused_inside_running_loop() -> None:
+    conn, _ = _inline_conn()
+    try:
+        with pytest.raises(ProgrammingError, match="running an event loop"):
+            conn.cursor().execute("SELECT n FROM t")
+        assert not conn._op_lock.locked()
+    finally:
+        conn.close()  # no loop was created: nothing to run
+
+
+def test_exclusive_with_shared_loop() -> None:
+    with pytest.raises(ProgrammingError, match="mutually exclusive"):
+        dqlitedbapi.connect("localhost:19001", inline_loop=True, shared_loop=True)
+
+
+def test_gc_closes_private_loop() -> None:
+    conn, _ = _inline_conn()
+    conn.cursor().execute("SELECT n FROM t")
+    loop = conn._loop
+    assert loop is not None
+    conn._async_conn = None
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        del conn
+        gc.collect()
+    assert loop.is_closed()
+    assert any(issubclass(w.category, ResourceWarning) for w in caught)
@@ -0,0 +1,318 @@
+"""Instrumentation listeners: one structured ``Event`` per operation,
+emitted from the sync and async execute / executemany / commit /
+rollback paths and from leader discovery + connect, and nothing at all
+(no clock read, no lock stamp) when no listener is registered.
+"""
+
+import logging
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import dqliteclient.exceptions as _client_exc
+import dqlitedbapi
+from dqlitedbapi import instrumentation
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.connection import Connection, _build_and_connect
+from dqlitedbapi.exceptions import IntegrityError, OperationalError, ProgrammingError
+from dqlitedbapi.instrumentation import Event, fingerprint
+from dqlitedbapi.result_cache import ResultCache
+from dqlitewire.constants import ValueType
+
+_INT = int(ValueType.INTEGER)
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.in_transaction = False
+        self.fail_with: Exception | None = None
+
+    async def query_raw_typed(self, sql: str, params: Any) -> tuple[Any, Any, Any, Any]:
+        return ["n"], [_INT], [[_INT], [_INT]], [[1], [2]]
+
+    async def execute(self, sql: str, params: Any = None) -> tuple[int, int]:
+        if self.fail_with is not None:
+            raise self.fail_with
+        verb = sql.split()[0].upper()
+        if verb == "BEGIN":
+            self.in_transaction = True
+        elif verb in ("COMMIT", "ROLLBACK"):
+            self.in_transaction = False
+        return 7, 1
+
+
+def _sync_conn(**kwargs: Any) -> tuple[Connection, _FakeClient]:
+    conn = Connection("localhost:19001", timeout=2.0, **kwargs)
+    client = _FakeClient()
+
+    async def get_client() -> _FakeClient:
+        return client
+
+    conn._get_async_connection = get_client  # type: ignore[method-assign]
+    conn._async_conn = client  # type: ignore[assignment]
+    return conn, client
+
+
+@pytest.fixture
+def events() -> Iterator[list[Event]]:
+    seen: list[Event] = []
+    instrumentation.add_listener(seen.append)
+    yield seen
+    instrumentation.remove_listener(seen.append)
+    assert instrumentation._LISTENERS == ()
+
+
+@pytest.fixture
+def sync(events: list[Event]) -> Iterator[tuple[Connection, _FakeClient]]:
+    conn, client = _sync_conn()
+    yield conn, client
+    conn._async_conn = None
+    conn.close()
+
+
+def test_unobserved_path_builds_nothing() -> None:
+    conn, _ = _sync_conn()
+    try:
+        assert instrumentation._span(conn, "execute", "SELECT 1") is None
+        with patch.object(instrumentation, "_Span", side_effect=AssertionError):
+            conn.cursor().execute("SELECT n FROM t").fetchall()
+        assert conn._active_span is None
+    finally:
+        conn._async_conn = None
+        conn.close()
+
+
+def test_execute_event(sync: Any, events: list[Event]) -> None:
+    conn, _ = sync
+    conn.cursor().execute("SELECT n FROM t WHERE n > 10")
+    (ev,) = events
+    assert ev.kind == "execute"
+    assert ev.address == "localhost:19001"
+    assert ev.fingerprint == "SELECT n FROM t WHERE n > ?"
+    assert (ev.rowcount, ev.rows, ev.cached, ev.error) == (2, 2, False, None)
+    assert ev.nbytes is not None and ev.nbytes > 0
+    assert ev.lock_wait is not None and 0 <= ev.lock_wait <= ev.duration
+
+
+@pytest.mark.parametrize("count", [1, 64, 65, 10_000])
+def test_nbytes_estimate_is_bounded(count: int) -> None:
+    rows = [[i, "x" * 10] for i in range(count)]
+    walked: list[int] = []
+    real = instrumentation._estimate_nbytes
+
+    def estimate(sample: Any) -> int:
+        walked.append(len(sample))
+        return real(sample)
+
+    with patch.object(instrumentation, "_estimate_nbytes", estimate):
+        nbytes = instrumentation._sampled_nbytes(rows)
+    assert walked[0] <= 2 * instrumentation._NBYTES_SAMPLE_ROWS
+    # Uniform rows: the extrapolation is exact.
+    assert nbytes == real(rows)
+
+
+def test_executemany_is_one_event(sync: Any, events: list[Event]) -> None:
+    conn, _ = sync
+    conn.cursor().executemany("INSERT INTO t VALUES (?)", [(1,), (2,), (3,)])
+    (ev,) = events
+    assert (ev.kind, ev.rowcount, ev.rows) == ("executemany", 3, None)
+
+
+def test_error_event_carries_code(sync: Any, events: list[Event]) -> None:
+    conn, client = sync
+    client.fail_with = _client_exc.OperationalError("UNIQUE constraint failed", 2067)
+    with pytest.raises(IntegrityError):
+        conn.cursor().execute("INSERT INTO t VALUES (1)")
+    (ev,) = events
+    assert isinstance(ev.error, IntegrityError)
+    assert ev.code == 2067
+
+
+def test_preflight_errors_emit_nothing(sync: Any, events: list[Event]) -> None:
+    conn, _ = sync
+    with pytest.raises(ProgrammingError):
+        conn.cursor().execute("SELECT ?", ())
+    assert events == []
+
+
+def test_commit_and_rollback_events(sync: Any, events: list[Event]) -> None:
+    conn, _ = sync
+    conn.cursor().execute("BEGIN")
+    conn.commit()
+    conn.rollback()  # no transaction: no round-trip, no event
+    conn.cursor().execute("BEGIN")
+    conn.rollback()
+    assert [e.kind for e in events] == ["execute", "commit", "execute", "rollback"]
+    assert events[1].sql == "COMMIT"
+
+
+def test_cache_hit_event(events: list[Event]) -> None:
+    conn, _ = _sync_conn(result_cache=ResultCache())
+    try:
+        conn.cursor().execute("SELECT n FROM t")
+        conn.cursor().execute("SELECT n FROM t")
+    finally:
+        conn._async_conn = None
+        conn.close()
+    assert [(e.cached, e.rows) for e in events] == [(False, 2), (True, 2)]
+    assert events[1].lock_wait is None
+
+
+def test_per_connection_listeners() -> None:
+    mine: list[Event] = []
+    conn, _ = _sync_conn(listeners=[mine.append])
+    other, _ = _sync_conn()
+    try:
+        conn.cursor().execute("SELECT n FROM t")
+        other.cursor().execute("SELECT n FROM t")
+    finally:
+        for c in (conn, other):
+            c._async_conn = None
+            c.close()
+    assert len(mine) == 1
+
+
+def test_listener_errors_are_logged_not_raised(
+    sync: Any, events: list[Event], caplog: pytest.LogCaptureFixture
+) -> None:
+    def boom(_event: Event) -> None:
+        raise RuntimeError("listener bug")
+
+    conn, _ = sync
+    instrumentation.add_listener(boom)
+    try:
+        with caplog.at_level(logging.WARNING, logger="dqlitedbapi.instrumentation"):
+            conn.cursor().execute("SELECT n FROM t")
+    finally:
+        instrumentation.remove_listener(boom)
+    assert len(events) == 1
+    assert "listener" in caplog.text
+
+
+def test_concurrent_registration_loses_nothing() -> None:
+    # Half the threads unregister a pre-registered set while the other
+    # half register a new one; every update must survive.
+    old = [(lambda _e, i=i: i) for i in range(400)]
+    new = [(lambda _e, i=i: -i) for i in range(400)]
+    for listener in old:
+        instrumentation.add_listener(listener)
+    jobs = [(instrumentation.remove_listener, old[i::4]) for i in range(4)]
+    jobs += [(instrumentation.add_listener, new[i::4]) for i in range(4)]
+    barrier = threading.Barrier(len(jobs))
+
+    def run(op: Callable[[Any], None], chunk: list[Any]) -> None:
+        barrier.wait()
+        for listener in chunk:
+            op(listener)
+
+    threads = [threading.Thread(target=run, args=job) for job in jobs]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+        registered = set(instrumentation._LISTENERS)
+        for listener in old + new:
+            instrumentation.remove_listener(listener)
+    assert registered == set(new)
+
+
+@pytest.mark.parametrize("bad", ["not-a-list", [1], 5])
+def test_listeners_validation(bad: Any) -> None:
+    with pytest.raises(ProgrammingError):
+        dqlitedbapi.connect("localhost:19001", listeners=bad)
+    with pytest.raises(ProgrammingError):
+        instrumentation.add_listener(bad)
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        ("SELECT * FROM t WHERE id IN (1, 2, 3) -- hot", "SELECT * FROM t WHERE id IN (?+)"),
+        ("select  'it''s',\n x'00ff', 1.5e3 from \"t 2\"", 'select ?, ?, ? from "t 2"'),
+        ("INSERT INTO t1 VALUES (?, ?), (?, ?), (?, ?)", "INSERT INTO t1 VALUES (?+), ..."),
+        ("UPDATE t SET a = /* c */ -4 WHERE b = ?", "UPDATE t SET a = -? WHERE b = ?"),
+    ],
+)
+def test_fingerprint(sql: str, expected: str) -> None:
+    assert fingerprint(sql) == expected
+
+
+@pytest.mark.asyncio
+async def test_connect_and_discovery_events() -> None:
+    seen: list[Event] = []
+    with (
+        patch("dqlitedbapi.connection._resolve_leader", AsyncMock(return_value="leader:9")),
+        patch("dqlitedbapi.connection.DqliteConnection") as MockConn,
+    ):
+        MockConn.return_value.connect = AsyncMock()
+        MockConn.return_value.address = "leader:9"
+        await _build_and_connect(
+            "seed:1",
+            database="default",
+            timeout=5.0,
+            max_total_rows=None,
+            max_continuation_frames=None,
+            trust_server_heartbeat=False,
+            close_timeout=0.5,
+            listeners=(seen.append,),
+        )
+    assert [(e.kind, e.address, e.leader) for e in seen] == [
+        ("leader_discovery", "seed:1", "leader:9"),
+        ("connect", "seed:1", "leader:9"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_discovery_events() -> None:
+    seen: list[Event] = []
+    failing = AsyncMock(side_effect=_client_exc.ClusterError("no leader"))
+    with (
+        patch("dqlitedbapi.connection._resolve_leader", failing),
+        pytest.raises(OperationalError),
+    ):
+        await _build_and_connect(
+            "seed:1",
+            database="default",
+            timeout=5.0,
+            max_total_rows=None,
+            max_continuation_frames=None,
+            trust_server_heartbeat=False,
+            close_timeout=0.5,
+            listeners=(seen.append,),
+        )
+    assert [e.kind for e in seen] == ["leader_discovery", "connect"]
+    assert all(isinstance(e.error, OperationalError) for e in seen)
+
+
+@pytest.mark.asyncio
+async def test_async_events() -> None:
+    seen: list[Event] = []
+    aconn = AsyncConnection("localhost:19001", timeout=2.0, listeners=[seen.append])
+    client = _FakeClient()
+
+    async def ensure() -> _FakeClient:
+        return client
+
+    aconn._ensure_connection = ensure  # type: ignore[method-assign]
+    aconn._async_conn = client  # type: ignore[assignment]
+    try:
+        cur = aconn.cursor()
+        await cur.execute("BEGIN")
+        await cur.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+        await cur.execute("SELECT n FROM t")
+        await aconn.commit()
+    finally:
+        aconn._async_conn = None
+        await aconn.close()
+    assert [e.kind for e in seen] == ["execute", "executemany", "execute", "commit"]
+    assert all(e.lock_wait is not None for e in seen)
+    assert seen[2].rows == 2
@@ -0,0 +1,115 @@
+"""Result rows are converted lazily, at fetch time.
+
+``execute`` buffers the wire rows untouched; the fetch verbs
+materialise only the rows they return, skipping ``_convert_row`` for
+rows with no converter-bearing wire type. Pinned here: nothing is
+converted up front, per-row skipping, each row converted exactly once,
+the ``DataError`` retry contract, and the executemany accumulator.
+"""
+
+import datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from dqlitedbapi import cursor as _cursor_mod
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.aio.cursor import AsyncCursor
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.cursor import _buffer_wire_rows, _ExecuteManyAccumulator
+from dqlitedbapi.exceptions import DataError
+from dqlitewire.constants import ValueType
+
+_INT = int(ValueType.INTEGER)
+_ISO = int(ValueType.ISO8601)
+_DESC = (("n", None, None, None, None, None, None), ("t", None, None, None, None, None, None))
+
+
+def _wire() -> tuple[list[list[Any]], list[list[int]]]:
+    rows = [[1, "2024-01-01 00:00:00"], [2, "2024-01-02 00:00:00"], [3, None]]
+    types = [[_INT, _ISO], [_INT, _ISO], [_INT, int(ValueType.NULL)]]
+    return rows, types
+
+
+@pytest.fixture
+def sync_cursor() -> Any:
+    conn = Connection("localhost:19001", timeout=2.0)
+    cur = conn.cursor()
+    cur._description = _DESC
+    yield cur
+    conn.close()
+
+
+def test_buffering_converts_nothing(sync_cursor: Any) -> None:
+    rows, types = _wire()
+    with patch.object(_cursor_mod, "_convert_row", wraps=_cursor_mod._convert_row) as conv:
+        _buffer_wire_rows(sync_cursor, rows, types, types[0])
+    conv.assert_not_called()
+    assert sync_cursor._rows[0] == [1, "2024-01-01 00:00:00"]
+
+
+def test_fetchone_converts_only_the_fetched_row(sync_cursor: Any) -> None:
+    rows, types = _wire()
+    _buffer_wire_rows(sync_cursor, rows, types, types[0])
+    assert sync_cursor.fetchone() == (1, datetime.datetime(2024, 1, 1))
+    assert sync_cursor._converted == 1
+    assert sync_cursor._rows[1] == [2, "2024-01-02 00:00:00"]
+    assert sync_cursor.fetchall() == [(2, datetime.datetime(2024, 1, 2)), (3, None)]
+    assert sync_cursor._raw_row_types is None
+
+
+def test_rows_without_converters_skip_convert_row(sync_cursor: Any) -> None:
+    rows = [[1, "a"], [2, "b"]]
+    types = [[_INT, int(ValueType.TEXT)]] * 2
+    _buffer_wire_rows(sync_cursor, rows, types, types[0])
+    with patch.object(_cursor_mod, "_convert_row") as conv:
+        assert sync_cursor.fetchall() == [(1, "a"), (2, "b")]
+    conv.assert_not_called()
+
+
+def test_rows_are_converted_once(sync_cursor: Any) -> None:
+    rows, types = _wire()
+    _buffer_wire_rows(sync_cursor, rows, types, types[0])
+    sync_cursor.fetchone()
+    with patch.object(_cursor_mod, "_convert_row", wraps=_cursor_mod._convert_row) as conv:
+        sync_cursor.fetchall()
+    # Row 0 already converted; row 2 carries no converter type.
+    assert conv.call_count == 1
+
+
+def test_malformed_cell_raises_at_fetch_and_again_on_retry(sync_cursor: Any) -> None:
+    rows = [[1, "2024-01-01"], [2, "not a date"]]
+    types = [[_INT, _ISO], [_INT, _ISO]]
+    _buffer_wire_rows(sync_cursor, rows, types, types[0])
+    assert sync_cursor.fetchone() == (1, datetime.datetime(2024, 1, 1))
+    for _ in range(2):
+        with pytest.raises(DataError, match="ISO 8601"):
+            sync_cursor.fetchone()
+    assert sync_cursor._converted == 1
+
+
+def test_short_row_types_fall_back_to_column_types(sync_cursor: Any) -> None:
+    rows = [[1, "2024-01-01"], [2, "2024-01-02"]]
+    _buffer_wire_rows(sync_cursor, rows, [[_INT, _ISO]], [_INT, _ISO])
+    assert sync_cursor.fetchall()[1] == (2, datetime.datetime(2024, 1, 2))
+
+
+def test_accumulator_materialises_each_iteration(sync_cursor: Any) -> None:
+    rows, types = _wire()
+    _buffer_wire_rows(sync_cursor, rows, types, types[0])
+    acc = _ExecuteManyAccumulator()
+    acc.push(sync_cursor)
+    assert acc.rows[0] == (1, datetime.datetime(2024, 1, 1))
+    assert all(type(r) is tuple for r in acc.rows)
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_paths_materialise() -> None:
+    cur = AsyncCursor(AsyncConnection("localhost:19001", timeout=2.0))
+    cur._description = _DESC
+    rows, types = _wire()
+    _buffer_wire_rows(cur, rows, types, types[0])
+    assert await cur.fetchone() == (1, datetime.datetime(2024, 1, 1))
+    assert cur._rows[1] == [2, "2024-01-02 00:00:00"]
+    assert cur.drain_rows()[1] == (2, datetime.datetime(2024, 1, 2))
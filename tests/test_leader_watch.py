@@ -0,0 +1,169 @@
+"""``dqlitedbapi.leader_watch`` — the opt-in background leader watcher.
+
+Pins: it refreshes the leader hint of every cached ``ClusterClient``
+on its interval and straight after a leader-class error, it recycles
+pooled connections bound to a deposed leader (sync pool: idle closed,
+checked-out discarded on release; async pool: idle closed and
+refilled against the new leader), and enable / disable are idempotent.
+Driven against :class:`dqlitedbapi.testing.LoopbackCluster`.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+
+import dqlitedbapi
+from dqlitedbapi import connection as _conn_mod
+from dqlitedbapi import cursor as _cursor_mod
+from dqlitedbapi import leader_watch
+from dqlitedbapi.aio.pool import create_pool
+from dqlitedbapi.exceptions import OperationalError, ProgrammingError
+from dqlitedbapi.pool import ConnectionPool
+from dqlitedbapi.testing import LoopbackCluster
+
+
+@pytest.fixture(autouse=True)
+def _disable_watcher() -> Iterator[None]:
+    yield
+    leader_watch.disable()
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.01)
+
+
+async def _await_for(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+def test_refreshes_every_cached_hint() -> None:
+    cluster = LoopbackCluster(nodes=3)
+    with cluster.serve_in_thread():
+        seed = cluster.addresses[2]
+        conn = dqlitedbapi.connect(seed, timeout=5.0)
+        try:
+            conn.connect()
+            leader_watch.enable(interval=0.05)
+            _wait_for(lambda: leader_watch.leaders().get(seed) == cluster.addresses[0])
+            cluster.flip_leader()
+            _wait_for(lambda: leader_watch.leaders().get(seed) == cluster.addresses[1])
+            hints = {
+                c._get_last_known_leader()
+                for key, c in _conn_mod._RESOLVE_LEADER_CACHE.items()
+                if key[1] == seed
+            }
+            assert hints == {cluster.addresses[1]}
+        finally:
+            conn.close()
+
+
+def test_leader_error_triggers_a_sweep() -> None:
+    cluster = LoopbackCluster(nodes=2)
+    with cluster.serve_in_thread():
+        seed = cluster.addresses[0]
+        conn = dqlitedbapi.connect(seed, timeout=5.0)
+        try:
+            conn.connect()
+            leader_watch.enable(interval=60.0)
+            _wait_for(lambda: seed in leader_watch.leaders())
+            cluster.flip_leader()
+            with pytest.raises(OperationalError):
+                conn.execute("SELECT 1")
+            # Far sooner than the 60 s interval.
+            _wait_for(lambda: leader_watch.leaders()[seed] == cluster.addresses[1])
+        finally:
+            conn.close()
+
+
+def test_sync_pool_recycles_demoted_connections() -> None:
+    cluster = LoopbackCluster(nodes=3)
+    with cluster.serve_in_thread():
+        seed = cluster.addresses[0]
+        pool = ConnectionPool(seed, min_size=2, timeout=5.0)
+        try:
+            leader_watch.enable(interval=0.05)
+            _wait_for(lambda: seed in leader_watch.leaders())
+            with pool.acquire() as held:
+                cluster.flip_leader()
+                # The idle connection goes at once ...
+                _wait_for(lambda: pool.size == 1)
+            # ... the checked-out one on release.
+            assert pool.size == 0
+            with pool.acquire() as conn:
+                assert conn is not held
+                assert conn.execute("SELECT 1").fetchone() == (1,)
+                assert conn._async_conn._address == cluster.addresses[1]
+        finally:
+            pool.close()
+
+
+def test_recycling_runs_off_the_watcher_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    cluster = LoopbackCluster(nodes=2)
+    with cluster.serve_in_thread():
+        seed = cluster.addresses[0]
+        pool = ConnectionPool(seed, min_size=1, timeout=5.0)
+        on_loop: list[bool] = []
+
+        def recycle(leader: str) -> None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                on_loop.append(False)
+            else:
+                on_loop.append(True)
+
+        monkeypatch.setattr(pool, "_recycle_demoted", recycle)
+        try:
+            leader_watch.enable(interval=0.05)
+            _wait_for(lambda: seed in leader_watch.leaders())
+            cluster.flip_leader()
+            _wait_for(lambda: bool(on_loop))
+            assert on_loop[0] is False
+        finally:
+            pool.close()
+
+
+async def test_async_pool_recycles_and_refills() -> None:
+    async with LoopbackCluster(nodes=3) as cluster:
+        seed = cluster.addresses[0]
+        pool = await create_pool(seed, min_size=2, health_check_interval=None, timeout=5.0)
+        try:
+            leader_watch.enable(interval=0.05)
+            await _await_for(lambda: seed in leader_watch.leaders())
+            cluster.flip_leader()
+
+            def refilled() -> bool:
+                clients = [rec.conn._async_conn for rec in pool._idle]
+                return len(clients) == 2 and all(
+                    c is not None and c._address == cluster.addresses[1] for c in clients
+                )
+
+            await _await_for(refilled)
+            async with pool.acquire() as conn:
+                cur = conn.cursor()
+                await cur.execute("SELECT 2")
+                assert await cur.fetchone() == (2,)
+        finally:
+            await pool.close()
+
+
+def test_enable_disable() -> None:
+    with pytest.raises(ProgrammingError):
+        leader_watch.enable(interval=0)
+    assert not leader_watch.enabled()
+    leader_watch.enable(interval=10.0)
+    leader_watch.enable(interval=1.0)
+    assert leader_watch.enabled()
+    assert _cursor_mod._leader_error_hook is not None
+    leader_watch.disable()
+    leader_watch.disable()
+    assert not leader_watch.enabled()
+    assert _cursor_mod._leader_error_hook is None
+    assert leader_watch.leaders() == {}
@@ -0,0 +1,135 @@
+"""``dqlitedbapi.testing.LoopbackCluster`` — the in-process dqlite
+stand-in — drives the real driver stack end to end.
+
+Pins: statements round-trip through sqlite, errors carry sqlite's
+result codes, results split into continuation frames reassemble,
+leader discovery follows the simulated leader, a leader flip surfaces
+as a leader-class error and rolls back the open transaction, stopped
+nodes refuse connections, and the prepare / finalize requests work.
+"""
+
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+import dqlitedbapi
+from dqliteclient.protocol import DqliteProtocol
+from dqlitedbapi.aio import aconnect
+from dqlitedbapi.exceptions import IntegrityError, OperationalError, ProgrammingError
+from dqlitedbapi.testing import LoopbackCluster, _split_statements
+from dqlitewire import LEADER_ERROR_CODES
+
+
+def test_round_trip_and_continuation_frames() -> None:
+    cluster = LoopbackCluster(rows_per_frame=3, chunk_size=64)
+    with cluster.serve_in_thread():
+        conn = dqlitedbapi.connect(cluster.address, timeout=5.0)
+        try:
+            cur = conn.cursor()
+            cur.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT UNIQUE, b BLOB)")
+            cur.executemany(
+                "INSERT INTO t (name, b) VALUES (?, ?)", [(f"n{i}", b"\x00") for i in range(20)]
+            )
+            assert cur.rowcount == 20
+            cur.execute("SELECT id, name, b FROM t ORDER BY id")
+            rows = cur.fetchall()
+            assert len(rows) == 20
+            assert rows[0] == (1, "n0", b"\x00")
+            assert [d[0] for d in cur.description] == ["id", "name", "b"]
+            cur.execute("UPDATE t SET b = NULL WHERE id <= ?", (5,))
+            assert cur.rowcount == 5
+            with pytest.raises(IntegrityError, match="UNIQUE"):
+                cur.execute("INSERT INTO t (name) VALUES ('n1')")
+        finally:
+            conn.close()
+    assert cluster.requests > 0
+
+
+def test_leader_flip_fails_statement_and_rolls_back() -> None:
+    cluster = LoopbackCluster(nodes=3)
+    with cluster.serve_in_thread():
+        # Seeding a follower still lands on the leader.
+        conn = dqlitedbapi.connect(cluster.addresses[2], timeout=5.0)
+        try:
+            cur = conn.cursor()
+            cur.execute("CREATE TABLE t (x)")
+            cur.execute("BEGIN")
+            cur.execute("INSERT INTO t VALUES (1)")
+            assert cluster.flip_leader() == 2
+            with pytest.raises(OperationalError) as info:
+                cur.execute("SELECT 1")
+            assert info.value.code in LEADER_ERROR_CODES
+        finally:
+            conn.close()
+        conn = dqlitedbapi.connect(cluster.addresses[0], timeout=5.0)
+        try:
+            assert conn.execute("SELECT count(*) FROM t").fetchone() == (0,)
+        finally:
+            conn.close()
+
+
+def test_latency_is_applied() -> None:
+    cluster = LoopbackCluster(latency=0.05)
+    with cluster.serve_in_thread():
+        conn = dqlitedbapi.connect(cluster.address, timeout=5.0)
+        try:
+            conn.connect()
+            start = time.monotonic()
+            conn.execute("SELECT 1")
+            assert time.monotonic() - start >= 0.05
+        finally:
+            conn.close()
+
+
+async def test_async_client_and_stopped_node() -> None:
+    async with LoopbackCluster(nodes=2) as cluster:
+        conn = await aconnect(cluster.address, timeout=5.0)
+        try:
+            cur = conn.cursor()
+            await cur.execute("SELECT ? + 1", (41,))
+            assert await cur.fetchone() == (42,)
+        finally:
+            await conn.close()
+        await cluster.stop_node(2)
+        with pytest.raises(OSError):
+            await asyncio.open_connection("127.0.0.1", int(cluster.addresses[1].split(":")[1]))
+        await cluster.start_node(2)
+        _, writer = await asyncio.open_connection(
+            "127.0.0.1", int(cluster.addresses[1].split(":")[1])
+        )
+        writer.close()
+
+
+async def test_prepare_and_finalize() -> None:
+    async with LoopbackCluster() as cluster:
+        host, port = cluster.address.split(":")
+        reader, writer = await asyncio.open_connection(host, int(port))
+        protocol = DqliteProtocol(reader, writer, timeout=5.0)
+        try:
+            await protocol.handshake()
+            db_id = await protocol.open_database("main")
+            stmt_id, num_params = await protocol.prepare(db_id, "SELECT ? WHERE 'a?' = ?")
+            assert num_params == 2
+            await protocol.finalize(db_id, stmt_id)
+            nodes = await protocol.cluster()
+            assert [n.address for n in nodes] == cluster.addresses
+        finally:
+            writer.close()
+
+
+def test_split_statements() -> None:
+    sql = "CREATE TABLE t (x); INSERT INTO t VALUES ('a;b'); -- c; d\n"
+    assert [s.strip() for s in _split_statements(sql)] == [
+        "CREATE TABLE t (x);",
+        "INSERT INTO t VALUES ('a;b');",
+    ]
+    assert sqlite3.complete_statement(_split_statements("SELECT 1")[0])
+
+
+def test_validation() -> None:
+    with pytest.raises(ProgrammingError):
+        LoopbackCluster(nodes=0)
+    with pytest.raises(ProgrammingError):
+        LoopbackCluster(nodes=2).flip_leader(5)
@@ -0,0 +1,164 @@
+"""Opt-in ``read_retry``: pure reads outside a transaction are replayed
+against the new leader after a leader change; everything else still
+surfaces the error.
+
+Driven end to end against :class:`dqlitedbapi.testing.LoopbackCluster`,
+whose ``flip_leader`` / ``clear_leader`` fail in-flight statements the
+way a real election does.
+"""
+
+import threading
+from typing import Any
+
+import pytest
+
+import dqlitedbapi
+from dqlitedbapi.aio import aconnect
+from dqlitedbapi.connection import _forget_leader, _get_resolve_leader_cluster
+from dqlitedbapi.exceptions import OperationalError, ProgrammingError
+from dqlitedbapi.retry import ReadRetry, _is_leader_change
+from dqlitedbapi.testing import LoopbackCluster
+from dqlitewire import LEADER_ERROR_CODES
+
+
+def _fast(**kwargs: Any) -> ReadRetry:
+    return ReadRetry(base_delay=0.01, max_delay=0.05, **kwargs)
+
+
+def test_read_is_replayed_on_new_leader() -> None:
+    policy = _fast()
+    cluster = LoopbackCluster(nodes=3)
+    with cluster.serve_in_thread():
+        conn = dqlitedbapi.connect(cluster.address, timeout=5.0, read_retry=policy)
+        try:
+            cur = conn.cursor()
+            cur.execute("CREATE TABLE t (x)")
+            cur.execute("INSERT INTO t VALUES (1)")
+            cluster.flip_leader()
+            assert cur.execute("SELECT x FROM t").fetchall() == [(1,)]
+            assert policy.retries == 1 and policy.exhausted == 0
+            # The replacement client is live for the next statement too.
+            cur.execute("INSERT INTO t VALUES (2)")
+        finally:
+            conn.close()
+
+
+def test_write_and_transaction_are_not_replayed() -> None:
+    policy = _fast()
+    cluster = LoopbackCluster(nodes=3)
+    with cluster.serve_in_thread():
+        conn = dqlitedbapi.connect(cluster.address, timeout=5.0, read_retry=policy)
+        try:
+            cur = conn.cursor()
+            cur.execute("CREATE TABLE t (x)")
+            cluster.flip_leader()
+            with pytest.raises(OperationalError) as info:
+                cur.execute("INSERT INTO t VALUES (1)")
+            assert info.value.code in LEADER_ERROR_CODES
+        finally:
+            conn.close()
+        conn = dqlitedbapi.connect(cluster.address, timeout=5.0, read_retry=policy)
+        try:
+            cur = conn.cursor()
+            cur.execute("BEGIN")
+            cluster.flip_leader()
+            with pytest.raises(OperationalError):
+                cur.execute("SELECT x FROM t")
+        finally:
+            conn.close()
+    assert policy.retries == 0
+
+
+def test_gives_up_after_max_attempts() -> None:
+    policy = ReadRetry(max_attempts=3, base_delay=0.0, max_delay=0.0)
+    cluster = LoopbackCluster(nodes=2)
+    with cluster.serve_in_thread():
+        conn = dqlitedbapi.connect(cluster.address, timeout=5.0, read_retry=policy)
+        try:
+            conn.connect()
+            cluster.clear_leader()
+            with pytest.raises(OperationalError) as info:
+                conn.execute("SELECT 1")
+            assert _is_leader_change(info.value)
+            assert policy.retries == 2 and policy.exhausted == 1
+        finally:
+            conn.close()
+
+
+def test_waits_out_an_election() -> None:
+    policy = _fast(deadline=5.0, max_attempts=50)
+    cluster = LoopbackCluster(nodes=3)
+    with cluster.serve_in_thread():
+        conn = dqlitedbapi.connect(cluster.address, timeout=5.0, read_retry=policy)
+        try:
+            conn.connect()
+            cluster.clear_leader()
+            timer = threading.Timer(0.2, cluster.flip_leader, (3,))
+            timer.start()
+            try:
+                assert conn.execute("SELECT 7").fetchone() == (7,)
+            finally:
+                timer.join()
+            assert policy.retries >= 1
+            assert cluster.leader_id == 3
+        finally:
+            conn.close()
+
+
+async def test_async_read_is_replayed() -> None:
+    policy = _fast()
+    async with LoopbackCluster(nodes=3) as cluster:
+        conn = await aconnect(cluster.address, timeout=5.0, read_retry=policy)
+        try:
+            cur = conn.cursor()
+            await cur.execute("SELECT 1")
+            cluster.flip_leader()
+            await cur.execute("SELECT 2")
+            assert await cur.fetchall() == [(2,)]
+            assert policy.retries == 1
+        finally:
+            await conn.close()
+
+
+async def test_forget_leader_clears_matching_hints() -> None:
+    cluster = _get_resolve_leader_cluster(
+        address="127.0.0.1:1",
+        timeout=1.0,
+        max_total_rows=None,
+        max_continuation_frames=None,
+        trust_server_heartbeat=False,
+    )
+    cluster._set_last_known_leader("127.0.0.1:2")
+    _forget_leader("127.0.0.1:3")
+    assert cluster._get_last_known_leader() == "127.0.0.1:2"
+    _forget_leader("127.0.0.1:2")
+    assert cluster._get_last_known_leader() is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_attempts": 0},
+        {"max_attempts": True},
+        {"base_delay": -1},
+        {"base_delay": 2.0, "max_delay": 1.0},
+        {"deadline": 0},
+        {"deadline": float("inf")},
+        {"jitter": 1.5},
+    ],
+)
+def test_invalid_settings(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ProgrammingError):
+        ReadRetry(**kwargs)
+
+
+def test_connect_validates_and_forwards() -> None:
+    policy = ReadRetry()
+    with pytest.raises(ProgrammingError, match="read_retry"):
+        dqlitedbapi.connect("localhost:19001", read_retry=3)
+    conn = dqlitedbapi.connect("localhost:19001", read_retry=policy)
+    try:
+        assert conn._read_retry is policy
+    finally:
+        conn.close()
+    assert dqlitedbapi.aio.connect("localhost:19001", read_retry=policy)._read_retry is policy
@@ -0,0 +1,338 @@
+"""Opt-in ``result_cache``: read-through caching of pure reads with
+table-level invalidation by writes anywhere in the process.
+
+The wire client is a small in-memory fake so hits / misses are
+observable as the presence or absence of a server round-trip.
+"""
+
+import asyncio
+import datetime
+import sys
+import threading
+import weakref
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+import dqlitedbapi
+from dqlitedbapi import cursor as _cursor_mod
+from dqlitedbapi import result_cache as _result_cache_mod
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.cursor import _result_cache_tables
+from dqlitedbapi.exceptions import ProgrammingError
+from dqlitedbapi.result_cache import ResultCache
+from dqlitewire.constants import ValueType
+
+_INT = int(ValueType.INTEGER)
+_ISO = int(ValueType.ISO8601)
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.in_transaction = False
+        self.value = 1
+
+    async def query_raw_typed(self, sql: str, params: Any) -> tuple[Any, Any, Any, Any]:
+        self.queries.append(sql)
+        return ["n", "t"], [_INT, _ISO], [[_INT, _ISO]], [[self.value, "2024-01-01 00:00:00"]]
+
+    async def execute(self, sql: str, params: Any = None) -> tuple[int, int]:
+        verb = sql.split()[0].upper()
+        if verb == "BEGIN":
+            self.in_transaction = True
+        elif verb in ("COMMIT", "ROLLBACK"):
+            self.in_transaction = False
+        return 0, 1
+
+
+def _sync_conn(
+    cache: ResultCache | None, address: str = "localhost:19001"
+) -> tuple[Connection, _FakeClient]:
+    conn = Connection(address, timeout=2.0, result_cache=cache)
+    client = _FakeClient()
+
+    async def get_client() -> _FakeClient:
+        return client
+
+    conn._get_async_connection = get_client  # type: ignore[method-assign]
+    conn._run_sync = asyncio.run  # type: ignore[method-assign,assignment]
+    conn._async_conn = client  # type: ignore[assignment]
+    return conn, client
+
+
+@pytest.fixture
+def cache() -> ResultCache:
+    return ResultCache(ttl=60.0)
+
+
+@pytest.fixture
+def sync(cache: ResultCache) -> Iterator[tuple[Connection, _FakeClient]]:
+    conn, client = _sync_conn(cache)
+    yield conn, client
+    conn._async_conn = None
+    conn.close()
+
+
+_ROW = (1, datetime.datetime(2024, 1, 1))
+
+
+def test_repeat_read_is_served_from_cache(sync: Any, cache: ResultCache) -> None:
+    conn, client = sync
+    for _ in range(3):
+        assert conn.cursor().execute("SELECT n, t FROM ref WHERE n = ?", (1,)).fetchall() == [_ROW]
+    assert client.queries == ["SELECT n, t FROM ref WHERE n = ?"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_hit_honours_row_factory_and_rownumber(sync: Any) -> None:
+    conn, _ = sync
+    conn.cursor().execute("SELECT n, t FROM ref")
+    cur = conn.cursor()
+    cur.row_factory = lambda _c, r: r[0]
+    cur.execute("SELECT n, t FROM ref")
+    assert cur.rowcount == 1
+    assert cur.description[0][0] == "n"
+    assert cur.fetchone() == 1
+    assert cur.rownumber == 1
+
+
+def test_params_are_part_of_the_key(sync: Any) -> None:
+    conn, client = sync
+    conn.cursor().execute("SELECT n, t FROM ref WHERE n = ?", (1,))
+    conn.cursor().execute("SELECT n, t FROM ref WHERE n = ?", (1.0,))
+    conn.cursor().execute("SELECT n, t FROM ref WHERE n = ?", (2,))
+    assert len(client.queries) == 3
+
+
+def test_cluster_address_is_part_of_the_key(sync: Any, cache: ResultCache) -> None:
+    conn, _ = sync
+    conn.cursor().execute("SELECT n, t FROM ref")
+    other, other_client = _sync_conn(cache, "localhost:19002")
+    try:
+        other_client.value = 2
+        assert other.cursor().execute("SELECT n, t FROM ref").fetchone()[0] == 2
+        assert other_client.queries == ["SELECT n, t FROM ref"]
+    finally:
+        other._async_conn = None
+        other.close()
+
+
+def test_uncached_connection_never_extracts_tables() -> None:
+    # Table extraction dominates a statement-cache miss; without a
+    # cache or a read-retry policy it must not run at all.
+    conn, client = _sync_conn(None)
+    try:
+        with (
+            patch.object(_cursor_mod, "_LIVE_CACHES", weakref.WeakSet()),
+            patch.object(_cursor_mod, "_result_cache_tables", side_effect=AssertionError),
+        ):
+            conn.cursor().execute("SELECT n, t FROM ref WHERE n = ?", (1,))
+            conn.cursor().execute("INSERT INTO ref (n) VALUES (?)", (2,))
+        assert len(client.queries) == 1
+    finally:
+        conn._async_conn = None
+        conn.close()
+
+
+def test_volatile_reads_are_not_cached(sync: Any, cache: ResultCache) -> None:
+    conn, client = sync
+    for _ in range(2):
+        conn.cursor().execute("SELECT n, t FROM ref WHERE t < datetime('now')")
+    assert len(client.queries) == 2
+    assert len(cache) == 0
+
+
+def test_write_invalidates_only_touched_tables(sync: Any, cache: ResultCache) -> None:
+    conn, client = sync
+    conn.cursor().execute("SELECT n, t FROM ref")
+    conn.cursor().execute('SELECT n, t FROM "Other"')
+    conn.cursor().execute("INSERT INTO other (n) VALUES (?)", (5,))
+    assert len(cache) == 1
+    conn.cursor().execute("SELECT n, t FROM ref")
+    assert len(client.queries) == 2
+
+
+def test_write_through_an_uncached_connection_invalidates(sync: Any, cache: ResultCache) -> None:
+    conn, _ = sync
+    conn.cursor().execute("SELECT n, t FROM ref")
+    other, _ = _sync_conn(None)
+    try:
+        other.cursor().execute("UPDATE main.ref SET n = 2")
+    finally:
+        other._async_conn = None
+        other.close()
+    assert len(cache) == 0
+
+
+def test_ddl_clears_everything(sync: Any, cache: ResultCache) -> None:
+    conn, _ = sync
+    conn.cursor().execute("SELECT n, t FROM ref")
+    conn.cursor().execute("CREATE INDEX i ON unrelated (x)")
+    assert len(cache) == 0
+
+
+def test_use_cache_false_bypasses(sync: Any, cache: ResultCache) -> None:
+    conn, client = sync
+    conn.cursor().execute("SELECT n, t FROM ref", use_cache=False)
+    assert len(cache) == 0
+    conn.cursor().execute("SELECT n, t FROM ref")
+    conn.cursor().execute("SELECT n, t FROM ref", use_cache=False)
+    assert len(client.queries) == 3
+
+
+def test_ttl_expiry(sync: Any, cache: ResultCache) -> None:
+    conn, client = sync
+    conn.cursor().execute("SELECT n, t FROM ref")
+    for entry in cache._entries.values():
+        entry.expires = 0.0
+    conn.cursor().execute("SELECT n, t FROM ref")
+    assert len(client.queries) == 2
+
+
+def test_byte_budget_evicts_lru() -> None:
+    cache = ResultCache(max_bytes=400)
+    conn, client = _sync_conn(cache)
+    try:
+        for i in range(10):
+            conn.cursor().execute(f"SELECT n, t FROM ref WHERE k = {i}")
+        assert 0 < len(cache) < 10
+        assert cache.nbytes <= cache.max_bytes
+        conn.cursor().execute("SELECT n, t FROM ref WHERE k = 9")
+        assert len(client.queries) == 10
+    finally:
+        conn._async_conn = None
+        conn.close()
+
+
+def test_transaction_reads_bypass_and_commit_reinvalidates(sync: Any, cache: ResultCache) -> None:
+    conn, client = sync
+    conn.cursor().execute("BEGIN")
+    conn.cursor().execute("SELECT n, t FROM ref")
+    assert len(cache) == 0
+    conn.cursor().execute("DELETE FROM ref")
+    # Another connection re-caches the pre-commit value meanwhile.
+    other, _ = _sync_conn(cache)
+    try:
+        other.cursor().execute("SELECT n, t FROM ref")
+    finally:
+        other._async_conn = None
+        other.close()
+    assert len(cache) == 1
+    conn.commit()
+    assert len(cache) == 0
+    assert conn._cache_pending_writes == []
+    assert client.in_transaction is False
+
+
+@pytest.mark.parametrize(
+    ("sql", "read", "written"),
+    [
+        ("SELECT a FROM t JOIN [u] ON 1", {"select", "a", "from", "t", "join", "u", "on"}, set()),
+        ("WITH c AS (SELECT 1) SELECT * FROM c", {"with", "c", "as", "select", "from"}, set()),
+        ("INSERT OR REPLACE INTO \"T\" VALUES ('x')", None, {"t"}),
+        ("INSERT INTO t VALUES (1) ON CONFLICT DO UPDATE SET n = 2", None, {"t"}),
+        ("UPDATE OR IGNORE main.u SET x = 1", None, {"u"}),
+        ("DELETE FROM `w` WHERE 'INTO x' = ''", None, {"w"}),
+        ("WITH c AS (SELECT 1) INSERT INTO t SELECT * FROM c", None, {"t"}),
+        ("BEGIN", None, set()),
+        ("PRAGMA foreign_keys = ON", None, set()),
+        ("DROP TABLE t", None, None),
+        ("VACUUM", None, None),
+        ("SELECT last_insert_rowid()", None, set()),
+        ("SELECT changes(), total_changes()", None, set()),
+        ("SELECT * FROM t ORDER BY RANDOM()", None, set()),
+        ("SELECT randomblob(16)", None, set()),
+        ("SELECT CURRENT_TIMESTAMP", None, set()),
+        ("VALUES (current_date)", None, set()),
+        ("SELECT * FROM t WHERE d > date('now', '-1 day')", None, set()),
+        ("SELECT strftime('%s', 'NOW')", None, set()),
+        ("SELECT julianday()", None, set()),
+        ("SELECT date(d) FROM t", {"select", "date", "d", "from", "t"}, set()),
+    ],
+)
+def test_table_extraction(sql: str, read: set[str] | None, written: set[str] | None) -> None:
+    got_read, got_written = _result_cache_tables(sql)
+    assert (None if got_read is None else set(got_read)) == read
+    assert (None if got_written is None else set(got_written)) == written
+
+
+def test_manual_invalidate_and_clear(sync: Any, cache: ResultCache) -> None:
+    conn, _ = sync
+    conn.cursor().execute("SELECT n, t FROM ref")
+    cache.invalidate("other")
+    assert len(cache) == 1
+    cache.invalidate('"REF"')
+    assert len(cache) == 0
+    conn.cursor().execute("SELECT n, t FROM ref")
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"ttl": 0}, {"ttl": float("inf")}, {"max_bytes": 0}])
+def test_invalid_settings(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ProgrammingError):
+        ResultCache(**kwargs)
+
+
+def test_connect_validates_and_forwards(cache: ResultCache) -> None:
+    with pytest.raises(ProgrammingError, match="result_cache"):
+        dqlitedbapi.connect("localhost:19001", result_cache={})
+    conn = dqlitedbapi.connect("localhost:19001", result_cache=cache)
+    try:
+        assert conn._result_cache is cache
+    finally:
+        conn.close()
+    assert dqlitedbapi.aio.connect("localhost:19001", result_cache=cache)._result_cache is cache
+
+
+@pytest.mark.asyncio
+async def test_async_hit_skips_wire(cache: ResultCache) -> None:
+    aconn = AsyncConnection("localhost:19001", timeout=2.0, result_cache=cache)
+    client = _FakeClient()
+
+    async def ensure() -> _FakeClient:
+        return client
+
+    aconn._ensure_connection = ensure  # type: ignore[method-assign]
+    aconn._async_conn = client  # type: ignore[assignment]
+    try:
+        for _ in range(2):
+            cur = await aconn.cursor().execute("SELECT n, t FROM ref")
+            assert await cur.fetchall() == [_ROW]
+        assert len(client.queries) == 1
+        await aconn.cursor().execute("UPDATE ref SET n = 3")
+        assert len(cache) == 0
+    finally:
+        aconn._async_conn = None
+        await aconn.close()
+
+
+def test_invalidation_races_cache_construction() -> None:
+    # A cache built on another thread while a write snapshots the live
+    # set must not fail the write with "Set changed size".
+    keep = [ResultCache() for _ in range(200)]
+    stop = threading.Event()
+
+    def build() -> None:
+        while not stop.is_set():
+            keep.append(ResultCache())
+            if len(keep) > 400:
+                del keep[200:]
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for t in threads:
+            t.start()
+        for _ in range(500):
+            _result_cache_mod._invalidate_everywhere(frozenset({"t"}))
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+        sys.setswitchinterval(interval)
@@ -0,0 +1,96 @@
+"""``_submit_threadsafe`` — the ``_run_sync`` submit primitive — keeps
+``asyncio.run_coroutine_threadsafe``'s contract while finishing
+non-suspending work in the scheduling callback itself.
+
+Pins: results and exceptions round-trip, eager completion runs inside
+a task on the loop thread, ``cancel()`` from the caller reaches a
+suspended task, a closed loop raises ``RuntimeError``, and
+``connect()`` on a connected Connection skips the loop entirely.
+"""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from dqlitedbapi.connection import Connection, _submit_threadsafe
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+def test_eager_result_runs_in_task_on_loop_thread(loop: asyncio.AbstractEventLoop) -> None:
+    seen: list[object] = []
+
+    async def probe() -> int:
+        seen.append(threading.get_ident())
+        seen.append(asyncio.current_task())
+        return 7
+
+    assert _submit_threadsafe(probe(), loop).result(timeout=5) == 7
+    assert seen[0] != threading.get_ident()
+    assert seen[1] is not None
+
+
+def test_suspending_result_and_exception(loop: asyncio.AbstractEventLoop) -> None:
+    async def slow() -> str:
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def boom() -> None:
+        await asyncio.sleep(0)
+        raise ValueError("x")
+
+    assert _submit_threadsafe(slow(), loop).result(timeout=5) == "done"
+    with pytest.raises(ValueError, match="x"):
+        _submit_threadsafe(boom(), loop).result(timeout=5)
+
+
+def test_cancel_reaches_suspended_task(loop: asyncio.AbstractEventLoop) -> None:
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    async def parked() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    future = _submit_threadsafe(parked(), loop)
+    assert started.wait(5)
+    assert future.cancel()
+    assert cancelled.wait(5)
+
+
+def test_closed_loop_raises_runtime_error() -> None:
+    loop = asyncio.new_event_loop()
+    loop.close()
+    coro = asyncio.sleep(0)
+    with pytest.raises(RuntimeError, match="Event loop is closed"):
+        _submit_threadsafe(coro, loop)
+    coro.close()
+
+
+def test_connect_when_connected_skips_loop() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    conn._async_conn = object()  # type: ignore[assignment]
+    try:
+        with patch.object(conn, "_run_sync") as run_sync:
+            conn.connect()
+        run_sync.assert_not_called()
+        assert conn._loop is None
+    finally:
+        conn._async_conn = None
+        conn.close()
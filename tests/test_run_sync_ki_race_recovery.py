@@ -62,7 +62,7 @@ def test_ki_arm_skips_invalidate_when_future_already_done() -> None:
         with (
             patch.object(conn, "_ensure_loop", return_value=fake_loop),
             patch(
-                "dqlitedbapi.connection.asyncio.run_coroutine_threadsafe",
+                "dqlitedbapi.connection._submit_threadsafe",
                 return_value=fake_future,
             ),
             pytest.raises(KeyboardInterrupt),
@@ -110,7 +110,7 @@ def test_ki_arm_invalidates_when_future_still_pending() -> None:
         with (
             patch.object(conn, "_ensure_loop", return_value=fake_loop),
             patch(
-                "dqlitedbapi.connection.asyncio.run_coroutine_threadsafe",
+                "dqlitedbapi.connection._submit_threadsafe",
                 return_value=fake_future,
             ),
             pytest.raises(KeyboardInterrupt),
@@ -74,8 +74,8 @@ class TestRunSyncTimeout:
             return stub
 
         monkeypatch.setattr(
-            conn_module.asyncio,  # type: ignore[attr-defined]
-            "run_coroutine_threadsafe",
+            conn_module,
+            "_submit_threadsafe",
             _fake_run_coroutine_threadsafe,
         )
 
@@ -123,8 +123,8 @@ class TestRunSyncTimeout:
             return _ReadyFuture()
 
         monkeypatch.setattr(
-            conn_module.asyncio,  # type: ignore[attr-defined]
-            "run_coroutine_threadsafe",
+            conn_module,
+            "_submit_threadsafe",
             _fake_run_coroutine_threadsafe,
         )
 
@@ -186,8 +186,8 @@ class TestRunSyncCancelSuccessRace:
             return stub
 
         monkeypatch.setattr(
-            conn_module.asyncio,  # type: ignore[attr-defined]
-            "run_coroutine_threadsafe",
+            conn_module,
+            "_submit_threadsafe",
             _fake_run_coroutine_threadsafe,
         )
 
@@ -258,8 +258,8 @@ class TestRunSyncTimeoutRecoveredExceptionPreservesClass:
             return stub
 
         monkeypatch.setattr(
-            conn_module.asyncio,  # type: ignore[attr-defined]
-            "run_coroutine_threadsafe",
+            conn_module,
+            "_submit_threadsafe",
             _fake_run_coroutine_threadsafe,
         )
 
@@ -307,8 +307,8 @@ class TestRunSyncTimeoutRecoveredExceptionPreservesClass:
 
         stub = _Stub()
         monkeypatch.setattr(
-            conn_module.asyncio,  # type: ignore[attr-defined]
-            "run_coroutine_threadsafe",
+            conn_module,
+            "_submit_threadsafe",
             lambda coro, loop: (coro.close(), stub)[1],
         )
 
@@ -386,8 +386,8 @@ class TestRunSyncTimeoutSynchronousNullOutOfAsyncConn:
             return stub
 
         monkeypatch.setattr(
-            conn_module.asyncio,  # type: ignore[attr-defined]
-            "run_coroutine_threadsafe",
+            conn_module,
+            "_submit_threadsafe",
             _fake_run_coroutine_threadsafe,
         )
 
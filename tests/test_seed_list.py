@@ -0,0 +1,156 @@
+"""Multi-seed ``address``: a list or comma-separated string of seeds,
+raced happy-eyeballs style during leader discovery.
+
+Pins: normalisation to one canonical comma-joined string (eager
+validation of every seed, duplicates dropped), discovery surviving a
+down seed and a black-holed one without waiting out ``timeout``, the
+winning seed being preferred next time, and the all-seeds-down error.
+Driven against :class:`dqlitedbapi.testing.LoopbackCluster`.
+"""
+
+import socket
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+import dqlitedbapi
+from dqlitedbapi import InterfaceError, OperationalError
+from dqlitedbapi import connection as _conn_mod
+from dqlitedbapi.aio import aconnect
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.connection import Connection, _normalize_address
+from dqlitedbapi.pool import ConnectionPool
+from dqlitedbapi.testing import LoopbackCluster
+
+
+@pytest.fixture
+def black_hole() -> Iterator[str]:
+    """An address that accepts TCP connections but never answers."""
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(8)
+    try:
+        yield f"127.0.0.1:{sock.getsockname()[1]}"
+    finally:
+        sock.close()
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.01)
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        ["a:1", "b:2"],
+        ("a:1", "b:2"),
+        "a:1, b:2",
+        "a:1,b:2,a:1,",
+    ],
+)
+def test_normalized_to_comma_string(address: Any) -> None:
+    assert _normalize_address(address) == "a:1,b:2"
+    assert Connection(address)._address == "a:1,b:2"
+    assert AsyncConnection(address)._address == "a:1,b:2"
+
+
+def test_single_seed_unchanged() -> None:
+    assert _normalize_address("127.0.0.1:9001") == "127.0.0.1:9001"
+
+
+@pytest.mark.parametrize(
+    ("address", "match"),
+    [
+        ([], "Invalid address"),
+        (["a:1", 2], "host:port"),
+        ({"a:1"}, "host:port"),
+        ("a:1,no-port", "Invalid address"),
+        (["a:1", "b:0"], "Invalid address"),
+    ],
+)
+def test_invalid_seed_lists(address: Any, match: str) -> None:
+    with pytest.raises(InterfaceError, match=match):
+        dqlitedbapi.connect(address)
+    with pytest.raises(InterfaceError, match=match):
+        ConnectionPool(address)
+
+
+def test_down_seed_is_skipped() -> None:
+    cluster = LoopbackCluster(nodes=3)
+    with cluster.serve_in_thread():
+        seeds = cluster.addresses
+        cluster.flip_leader(2)
+        cluster.call(cluster.stop_node(1))
+        conn = dqlitedbapi.connect(seeds, timeout=5.0)
+        try:
+            assert conn.execute("SELECT 1").fetchone() == (1,)
+            assert conn._async_conn._address == seeds[1]
+        finally:
+            conn.close()
+
+
+def _probes_settled() -> bool:
+    # A cancelled loser's shared ``ClusterClient`` probe is shielded
+    # and runs on until its own timeout; let it finish before the
+    # connection's loop closes under it.
+    return not any(c._find_leader_tasks for c in _conn_mod._RESOLVE_LEADER_CACHE.values())
+
+
+def test_black_holed_seed_does_not_stall(black_hole: str) -> None:
+    cluster = LoopbackCluster(nodes=1)
+    with cluster.serve_in_thread():
+        seeds = [black_hole, cluster.addresses[0]]
+        conn = dqlitedbapi.connect(seeds, timeout=1.0)
+        try:
+            start = time.monotonic()
+            conn.connect()
+            # The second seed starts after the stagger, not after the
+            # first seed's timeout.
+            assert time.monotonic() - start < 0.75
+            assert _conn_mod._SEED_PREFERENCE[tuple(seeds)] == cluster.addresses[0]
+            _wait_for(_probes_settled)
+        finally:
+            conn.close()
+
+        # Next time the winner is probed first and answers alone.
+        conn = dqlitedbapi.connect(seeds, timeout=1.0)
+        try:
+            start = time.monotonic()
+            conn.connect()
+            assert time.monotonic() - start < _conn_mod._SEED_STAGGER_SECONDS
+        finally:
+            conn.close()
+
+
+async def test_aconnect_with_seed_list() -> None:
+    async with LoopbackCluster(nodes=3) as cluster:
+        cluster.flip_leader(3)
+        conn = await aconnect(",".join(cluster.addresses), timeout=5.0)
+        try:
+            cur = conn.cursor()
+            await cur.execute("SELECT 2")
+            assert await cur.fetchone() == (2,)
+            assert conn._async_conn._address == cluster.addresses[2]
+        finally:
+            await conn.close()
+
+
+def test_all_seeds_down() -> None:
+    cluster = LoopbackCluster(nodes=2)
+    with cluster.serve_in_thread():
+        seeds = cluster.addresses
+        cluster.call(cluster.stop_node(1))
+        cluster.call(cluster.stop_node(2))
+        conn = dqlitedbapi.connect(seeds, timeout=2.0)
+        try:
+            with pytest.raises(OperationalError, match="Failed to find leader") as info:
+                conn.connect()
+            message = str(info.value)
+            assert seeds[0] in message and seeds[1] in message
+        finally:
+            conn.close()
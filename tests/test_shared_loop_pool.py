@@ -0,0 +1,143 @@
+"""``Connection(shared_loop=True)`` runs on a process-wide, ref-counted
+pool of event-loop threads instead of a dedicated thread per
+Connection.
+
+Pins the thread-count bound (N Connections share at most
+``_SHARED_LOOP_POOL_SIZE`` threads), the refcount lifecycle (the last
+Connection out stops the runner; an earlier close must not stop a loop
+siblings are still using), the GC-path release, and the fork reset.
+"""
+
+import gc
+import os
+import threading
+import warnings
+from unittest.mock import MagicMock
+
+import pytest
+
+import dqlitedbapi
+from dqliteclient import connection as _client_conn_mod
+from dqlitedbapi import connection as _conn_mod
+from dqlitedbapi.connection import Connection
+
+
+@pytest.fixture(autouse=True)
+def _empty_shared_pool() -> None:
+    # Every test below closes what it opens; a leftover runner means a
+    # refcount leak in an earlier test, not state to reuse.
+    assert _conn_mod._SHARED_LOOP_RUNNERS == []
+
+
+def test_connections_share_bounded_number_of_threads() -> None:
+    baseline = threading.active_count()
+    conns = [Connection("localhost:19001", timeout=2.0, shared_loop=True) for _ in range(10)]
+    try:
+        for conn in conns:
+            conn._ensure_loop()
+        cap = _conn_mod._SHARED_LOOP_POOL_SIZE
+        assert threading.active_count() == baseline + cap
+        assert len({id(conn._loop) for conn in conns}) == cap
+        # Least-loaded assignment spreads 10 Connections over 4 runners.
+        counts = sorted(r.refcount for r in _conn_mod._SHARED_LOOP_RUNNERS)
+        assert sum(counts) == 10
+        assert counts[-1] - counts[0] <= 1
+    finally:
+        for conn in conns:
+            conn.close()
+    assert _conn_mod._SHARED_LOOP_RUNNERS == []
+    assert threading.active_count() == baseline
+
+
+def test_close_does_not_stop_loop_in_use_by_sibling() -> None:
+    # Fill the pool so the next Connection lands on an occupied runner.
+    fillers = [
+        Connection("localhost:19001", timeout=2.0, shared_loop=True)
+        for _ in range(_conn_mod._SHARED_LOOP_POOL_SIZE)
+    ]
+    for conn in fillers:
+        conn._ensure_loop()
+    a = Connection("localhost:19001", timeout=2.0, shared_loop=True)
+    a._ensure_loop()
+    runner = a._loop_runner
+    assert runner is not None
+    sibling = next(c for c in fillers if c._loop_runner is runner)
+
+    a.close()
+    assert a._loop is None
+    assert a._thread is None
+    assert runner.thread.is_alive()
+    assert not runner.loop.is_closed()
+
+    for conn in fillers:
+        conn.close()
+    assert sibling.closed
+    assert not runner.thread.is_alive()
+    assert runner.loop.is_closed()
+
+
+def test_force_close_transport_releases_reference() -> None:
+    conn = Connection("localhost:19001", timeout=2.0, shared_loop=True)
+    conn._ensure_loop()
+    runner = conn._loop_runner
+    assert runner is not None
+    inner = MagicMock()
+    conn._async_conn = inner
+    conn.force_close_transport()
+    assert conn._loop_runner is None
+    assert not runner.thread.is_alive()
+    assert _conn_mod._SHARED_LOOP_RUNNERS == []
+
+
+def test_gc_without_close_warns_and_releases() -> None:
+    conn = Connection("localhost:19001", timeout=2.0, shared_loop=True)
+    conn._ensure_loop()
+    runner = conn._loop_runner
+    assert runner is not None
+    with warnings.catch_warnings(record=True) as captured:
+        warnings.simplefilter("always")
+        del conn
+        gc.collect()
+    assert any(issubclass(w.category, ResourceWarning) for w in captured)
+    assert runner.refcount == 0
+    assert not runner.thread.is_alive()
+
+
+def test_fork_drops_inherited_runners(monkeypatch: pytest.MonkeyPatch) -> None:
+    conn = Connection("localhost:19001", timeout=2.0, shared_loop=True)
+    conn._ensure_loop()
+    parent_runner = conn._loop_runner
+    assert parent_runner is not None
+    try:
+        monkeypatch.setattr(_client_conn_mod, "_current_pid", os.getpid() + 1)
+        child_runner = _conn_mod._acquire_shared_loop()
+        try:
+            assert child_runner is not parent_runner
+            assert parent_runner not in _conn_mod._SHARED_LOOP_RUNNERS
+            # Releasing a parent runner from the "child" is a no-op.
+            _conn_mod._release_shared_loop(parent_runner, join_timeout=1.0)
+            assert parent_runner.refcount == 1
+        finally:
+            _conn_mod._release_shared_loop(child_runner, join_timeout=1.0)
+    finally:
+        monkeypatch.undo()
+        conn.close()
+    assert not parent_runner.thread.is_alive()
+
+
+def test_module_connect_forwards_shared_loop() -> None:
+    conn = dqlitedbapi.connect("localhost:19001", timeout=2.0, shared_loop=True)
+    try:
+        assert conn._shared_loop is True
+    finally:
+        conn.close()
+
+
+def test_default_is_dedicated_loop() -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+    try:
+        conn._ensure_loop()
+        assert conn._loop_runner is None
+        assert conn._loop not in {r.loop for r in _conn_mod._SHARED_LOOP_RUNNERS}
+    finally:
+        conn.close()
@@ -0,0 +1,186 @@
+"""``slow_query_threshold``: operations at or over the threshold are
+logged with their fingerprint, a redacted parameter shape and a
+lock-wait / connect / wire / driver time split — with no listener
+registered and never with the parameter values themselves.
+"""
+
+import logging
+import math
+from typing import Any
+
+import pytest
+
+import dqlitedbapi
+from dqlitedbapi import instrumentation
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.exceptions import ProgrammingError
+from dqlitedbapi.instrumentation import _batch_shape, _param_shape
+from dqlitewire.constants import ValueType
+
+_INT = int(ValueType.INTEGER)
+_LOGGER = "dqlitedbapi.instrumentation.slow_query"
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.in_transaction = False
+
+    async def query_raw_typed(self, sql: str, params: Any) -> tuple[Any, Any, Any, Any]:
+        return ["n"], [_INT], [[_INT]], [[1]]
+
+    async def execute(self, sql: str, params: Any = None) -> tuple[int, int]:
+        verb = sql.split()[0].upper()
+        if verb == "BEGIN":
+            self.in_transaction = True
+        elif verb in ("COMMIT", "ROLLBACK"):
+            self.in_transaction = False
+        return 1, 1
+
+
+def _sync_conn(threshold: float | None) -> Connection:
+    conn = Connection("localhost:19001", timeout=2.0, slow_query_threshold=threshold)
+    client = _FakeClient()
+
+    async def get_client() -> _FakeClient:
+        conn._async_conn = client  # type: ignore[assignment]
+        return client
+
+    conn._get_async_connection = get_client  # type: ignore[method-assign]
+    return conn
+
+
+def _close(conn: Connection) -> None:
+    conn._async_conn = None
+    conn.close()
+
+
+def _records(caplog: pytest.LogCaptureFixture) -> list[dict[str, Any]]:
+    return [r.dqlite_slow_query for r in caplog.records if r.name == _LOGGER]
+
+
+def test_slow_execute_logged_with_shape_not_values(caplog: pytest.LogCaptureFixture) -> None:
+    conn = _sync_conn(0.0)
+    try:
+        with caplog.at_level(logging.WARNING, logger=_LOGGER):
+            conn.cursor().execute("SELECT n FROM t WHERE a = ? AND b = ?", ("s3cret", None))
+    finally:
+        _close(conn)
+    (rec,) = _records(caplog)
+    assert rec["kind"] == "execute"
+    assert rec["fingerprint"] == "SELECT n FROM t WHERE a = ? AND b = ?"
+    assert rec["params"] == "(str[6], NULL)"
+    assert rec["rows"] == 1
+    assert "s3cret" not in caplog.text
+
+
+def test_time_split_adds_up(caplog: pytest.LogCaptureFixture) -> None:
+    conn = _sync_conn(0.0)
+    try:
+        with caplog.at_level(logging.WARNING, logger=_LOGGER):
+            conn.cursor().execute("SELECT n FROM t")  # connects
+            conn.cursor().execute("INSERT INTO t VALUES (1)")  # already connected
+    finally:
+        _close(conn)
+    first, second = _records(caplog)
+    for rec in (first, second):
+        parts = rec["lock_wait"] + rec["connect"] + rec["wire"] + rec["driver"]
+        assert parts == pytest.approx(rec["duration"], abs=1e-9)
+        assert min(rec["lock_wait"], rec["wire"], rec["driver"]) >= 0
+    assert first["connect"] > 0
+    assert second["connect"] == 0
+
+
+def test_fast_operations_not_logged(caplog: pytest.LogCaptureFixture) -> None:
+    conn = _sync_conn(60.0)
+    try:
+        with caplog.at_level(logging.WARNING, logger=_LOGGER):
+            conn.cursor().execute("SELECT n FROM t")
+    finally:
+        _close(conn)
+    assert _records(caplog) == []
+
+
+def test_executemany_and_commit_logged(caplog: pytest.LogCaptureFixture) -> None:
+    conn = _sync_conn(0.0)
+    try:
+        with caplog.at_level(logging.WARNING, logger=_LOGGER):
+            cur = conn.cursor()
+            cur.execute("BEGIN")
+            cur.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+            conn.commit()
+    finally:
+        _close(conn)
+    recs = _records(caplog)
+    assert [r["kind"] for r in recs] == ["execute", "executemany", "commit"]
+    assert recs[1]["params"] == "2 x (int)"
+    assert recs[2]["fingerprint"] == "COMMIT"
+
+
+def test_threshold_does_not_feed_listeners() -> None:
+    conn = _sync_conn(0.0)
+    try:
+        conn.cursor().execute("SELECT n FROM t")
+        assert conn._active_span is None
+    finally:
+        _close(conn)
+    assert instrumentation._LISTENERS == ()
+
+
+@pytest.mark.parametrize("bad", [-1, math.inf, math.nan, "1", True])
+def test_threshold_validation(bad: Any) -> None:
+    with pytest.raises(ProgrammingError):
+        dqlitedbapi.connect("localhost:19001", slow_query_threshold=bad)
+    with pytest.raises(ProgrammingError):
+        AsyncConnection("localhost:19001", slow_query_threshold=bad)
+
+
+@pytest.mark.parametrize(
+    ("params", "shape"),
+    [
+        (None, None),
+        ((), "()"),
+        ([1, 2.5, b"\x00" * 4, None], "(int, float, bytes[4], NULL)"),
+        ({"a": 1}, "dict"),
+    ],
+)
+def test_param_shape(params: Any, shape: str | None) -> None:
+    assert _param_shape(params) == shape
+
+
+@pytest.mark.asyncio
+async def test_async_slow_log(caplog: pytest.LogCaptureFixture) -> None:
+    aconn = AsyncConnection("localhost:19001", timeout=2.0, slow_query_threshold=0)
+    client = _FakeClient()
+
+    async def ensure() -> _FakeClient:
+        aconn._async_conn = client  # type: ignore[assignment]
+        return client
+
+    aconn._ensure_connection = ensure  # type: ignore[method-assign]
+    try:
+        with caplog.at_level(logging.WARNING, logger=_LOGGER):
+            cur = aconn.cursor()
+            await cur.execute("BEGIN")
+            await cur.execute("SELECT n FROM t WHERE id = ?", (7,))
+            await aconn.commit()
+    finally:
+        aconn._async_conn = None
+        await aconn.close()
+    recs = _records(caplog)
+    assert [r["kind"] for r in recs] == ["execute", "execute", "commit"]
+    assert recs[0]["connect"] > 0
+    assert recs[1]["params"] == "(int)"
+    assert aconn._active_span is None
+
+
+@pytest.mark.parametrize(
+    ("seq", "shape"),
+    [
+        ([], "0 x ()"),
+        ([("a", 1), ("bc", 2)], "2 x (str[1], int)"),
+        (iter([(1,)]), "list_iterator"),
+    ],
+)
+def test_batch_shape(seq: Any, shape: str) -> None:
+    assert _batch_shape(seq) == shape
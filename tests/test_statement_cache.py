@@ -0,0 +1,115 @@
+"""Per-connection LRU cache of SQL classification
+(``statement_cache_size``).
+
+Pins that the cached record agrees with the individual classifiers,
+that a hit skips re-classification, the LRU bound and eviction order,
+``0`` disabling retention, constructor validation, and the forwarding
+through every connect entry point.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import dqlitedbapi
+import dqlitedbapi.aio
+from dqlitedbapi import cursor as _cursor_mod
+from dqlitedbapi.aio.connection import AsyncConnection
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.cursor import (
+    _classify_statement,
+    _is_insert_or_replace,
+    _is_row_returning,
+    _lookup_statement,
+    _StatementCache,
+)
+from dqlitedbapi.exceptions import ProgrammingError
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT 1",
+        "INSERT INTO t VALUES (?, ?)",
+        "INSERT INTO t VALUES ('?') RETURNING id",
+        "REPLACE INTO t VALUES (1)",
+        "UPDATE t SET x = ? WHERE y = '; DROP'",
+        "PRAGMA foreign_keys",
+        "; /* x */ SAVEPOINT sp",
+        "WITH c AS (SELECT 1) INSERT INTO t SELECT * FROM c",
+        "SELECT 1; SELECT 2",
+        "-- only a comment",
+    ],
+)
+def test_record_matches_individual_classifiers(sql: str) -> None:
+    info = _classify_statement(sql)
+    assert info.row_returning is _is_row_returning(sql)
+    assert info.insert_or_replace is _is_insert_or_replace(sql)
+    assert info.placeholder_count == _cursor_mod._strip_sql_noise(sql).count("?")
+    assert info.multi_statement is _cursor_mod._is_multi_statement(sql)
+    assert info.empty is (not _cursor_mod._strip_leading_comments(sql))
+
+
+def test_executemany_rejection_verdicts() -> None:
+    assert _classify_statement("INSERT INTO t VALUES (?)").executemany_rejection is None
+    assert "SAVEPOINT" in (_classify_statement(";SAVEPOINT sp").executemany_rejection or "")
+    assert "PRAGMA" in (_classify_statement("PRAGMA user_version").executemany_rejection or "")
+    assert "DML" in (_classify_statement("SELECT ?").executemany_rejection or "")
+
+
+def test_hit_skips_reclassification() -> None:
+    cache = _StatementCache(8)
+    first = cache.lookup("SELECT ?")
+    with patch.object(_cursor_mod, "_classify_statement") as classify:
+        assert cache.lookup("SELECT ?") is first
+    classify.assert_not_called()
+
+
+def test_lru_eviction_order() -> None:
+    cache = _StatementCache(2)
+    cache.lookup("SELECT 1")
+    cache.lookup("SELECT 2")
+    cache.lookup("SELECT 1")  # refresh: SELECT 2 is now oldest
+    cache.lookup("SELECT 3")
+    assert len(cache) == 2
+    assert list(cache._entries) == ["SELECT 1", "SELECT 3"]
+
+
+def test_zero_size_disables_retention() -> None:
+    cache = _StatementCache(0)
+    assert cache.lookup("SELECT 1").row_returning is True
+    assert len(cache) == 0
+
+
+def test_mock_connection_bypasses_cache() -> None:
+    # MagicMock auto-attributes must not be mistaken for a cache.
+    assert _lookup_statement(MagicMock(), "SELECT 1").row_returning is True
+
+
+@pytest.mark.parametrize("bad", [-1, 1.5, "10", True, None])
+@pytest.mark.parametrize("cls", [Connection, AsyncConnection])
+def test_invalid_size_rejected(cls: type, bad: object) -> None:
+    with pytest.raises(ProgrammingError, match="statement_cache_size"):
+        cls("localhost:19001", statement_cache_size=bad)
+
+
+def test_sync_cursor_populates_connection_cache() -> None:
+    conn = Connection("localhost:19001", timeout=2.0, statement_cache_size=4)
+    try:
+        cur = conn.cursor()
+        # The pre-flight rejection runs before any wire traffic.
+        with pytest.raises(ProgrammingError, match="Incorrect number of bindings"):
+            cur.execute("SELECT ?, ?", (1,))
+        assert "SELECT ?, ?" in conn._statement_cache._entries
+    finally:
+        conn.close()
+
+
+def test_connect_entry_points_forward_size() -> None:
+    conn = dqlitedbapi.connect("localhost:19001", statement_cache_size=3)
+    try:
+        assert conn._statement_cache._maxsize == 3
+    finally:
+        conn.close()
+    aconn = dqlitedbapi.aio.connect("localhost:19001", statement_cache_size=0)
+    assert aconn._statement_cache._maxsize == 0
@@ -0,0 +1,148 @@
+"""``dqlitedbapi.stats``: per-fingerprint statistics aggregated from
+instrumentation events, with bounded memory and histogram percentiles.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from dqlitedbapi import instrumentation, stats
+from dqlitedbapi.connection import Connection
+from dqlitedbapi.exceptions import OperationalError, ProgrammingError
+from dqlitedbapi.instrumentation import Event
+from dqlitedbapi.stats import StatsCollector, _bucket, _bucket_upper
+from dqlitewire.constants import ValueType
+
+
+def _event(sql: str | None = "SELECT 1", duration: float = 0.001, **kw: Any) -> Event:
+    fields: dict[str, Any] = {
+        "kind": "execute",
+        "start": 0.0,
+        "duration": duration,
+        "address": "a:1",
+        "sql": sql,
+        "fingerprint": instrumentation.fingerprint(sql) if sql is not None else None,
+        "rowcount": -1,
+        "rows": None,
+        "nbytes": None,
+        "lock_wait": None,
+        "cached": False,
+        "error": None,
+        "code": None,
+        "leader": None,
+    }
+    fields.update(kw)
+    return Event(**fields)
+
+
+def test_literals_share_a_row() -> None:
+    c = StatsCollector()
+    c(_event("SELECT * FROM t WHERE id = 1", rows=1, rowcount=1))
+    c(_event("SELECT * FROM t WHERE id = 22", rows=3, rowcount=3, cached=True))
+    c(_event("UPDATE t SET v = 'x'", rowcount=4, error=OperationalError("busy")))
+    by_key = {s.fingerprint: s for s in c.snapshot()}
+    sel = by_key["SELECT * FROM t WHERE id = ?"]
+    assert (sel.calls, sel.rows, sel.cached, sel.errors) == (2, 4, 1, 0)
+    upd = by_key["UPDATE t SET v = ?"]
+    assert (upd.calls, upd.rows_affected, upd.errors) == (1, 0, 1)
+
+
+def test_percentiles_from_histogram() -> None:
+    c = StatsCollector()
+    for _ in range(98):
+        c(_event(duration=0.001))
+    c(_event(duration=0.5))
+    c(_event(duration=2.0))
+    (s,) = c.snapshot()
+    assert s.min_time == 0.001 and s.max_time == 2.0
+    assert 0.001 <= s.p50 <= 0.0012
+    assert s.p95 == s.p50
+    assert 0.5 <= s.p99 <= 0.6
+    assert s.mean_time == pytest.approx(s.total_time / 100)
+
+
+def test_bucket_bounds() -> None:
+    for seconds in (2e-6, 1e-4, 0.37, 12.0):
+        assert seconds <= _bucket_upper(_bucket(seconds)) <= seconds * 2 ** (1 / 4) * 1.0001
+    assert _bucket(0.0) == 0
+    assert _bucket(1e9) == _bucket(1e10)
+
+
+def test_cap_evicts_least_recently_seen() -> None:
+    c = StatsCollector(max_statements=2)
+    c(_event("SELECT a FROM hot"))
+    c(_event("SELECT a FROM cold"))
+    c(_event("SELECT a FROM hot"))
+    c(_event("SELECT a FROM new"))
+    assert len(c) == 2 and c.evicted == 1
+    assert {s.fingerprint for s in c.snapshot()} == {"SELECT a FROM hot", "SELECT a FROM new"}
+    # Fresh fingerprints evict the stale tail, not each other.
+    c(_event("SELECT a FROM newer"))
+    assert {s.fingerprint for s in c.snapshot()} == {"SELECT a FROM new", "SELECT a FROM newer"}
+
+
+def test_successful_dml_counts_rows_affected() -> None:
+    c = StatsCollector()
+    c(_event("UPDATE t SET v = 1", rowcount=3))
+    c(_event("UPDATE t SET v = 1", rowcount=5, error=OperationalError("busy")))
+    (upd,) = c.snapshot()
+    assert (upd.calls, upd.errors, upd.rows_affected) == (2, 1, 3)
+
+
+def test_sql_less_events_keyed_by_kind() -> None:
+    c = StatsCollector()
+    c(_event(None, kind="connect"))
+    assert c.snapshot()[0].fingerprint == "<connect>"
+
+
+def test_snapshot_sorted_by_total_time() -> None:
+    c = StatsCollector()
+    c(_event("SELECT 1 FROM a", duration=0.1))
+    c(_event("SELECT 1 FROM b", duration=0.3))
+    assert [s.fingerprint for s in c.snapshot()] == ["SELECT ? FROM b", "SELECT ? FROM a"]
+
+
+@pytest.mark.parametrize("bad", [0, -1, True, 1.5])
+def test_max_statements_validation(bad: Any) -> None:
+    with pytest.raises(ProgrammingError):
+        StatsCollector(max_statements=bad)
+
+
+@pytest.fixture
+def enabled() -> Iterator[None]:
+    stats.reset()
+    stats.enable()
+    stats.enable()  # idempotent
+    yield
+    stats.disable()
+    stats.reset()
+
+
+def test_module_collector_sees_driver_calls(enabled: None) -> None:
+    conn = Connection("localhost:19001", timeout=2.0)
+
+    class _Client:
+        in_transaction = False
+
+        async def query_raw_typed(self, sql: str, params: Any) -> Any:
+            t = int(ValueType.INTEGER)
+            return ["n"], [t], [[t]], [[1]]
+
+    client = _Client()
+
+    async def get_client() -> _Client:
+        return client
+
+    conn._get_async_connection = get_client  # type: ignore[method-assign]
+    try:
+        for i in range(3):
+            conn.cursor().execute(f"SELECT n FROM t WHERE n = {i}")
+    finally:
+        conn.close()
+    (s,) = stats.snapshot()
+    assert (s.fingerprint, s.calls, s.rows) == ("SELECT n FROM t WHERE n = ?", 3, 3)
+    assert instrumentation._LISTENERS.count(stats._COLLECTOR) == 1
+    stats.disable()
+    assert stats._COLLECTOR not in instrumentation._LISTENERS
+    assert len(stats.snapshot()) == 1
@@ -1,6 +1,5 @@
-"""Pin: sync ``Cursor.fetchmany``'s per-iteration ``fetchone()``
-loop preserves ``_row_index`` on cancel/exception so partially-
-iterated rows are not silently consumed.
+"""Pin: sync ``Cursor.fetchmany`` preserves ``_row_index`` on
+cancel/exception so partially-iterated rows are not silently consumed.
 
 Mirrors the async sibling pin
 (``tests/aio/test_fetchmany_cancel_atomic.py``) — the BaseException
@@ -8,12 +7,12 @@ restore arm in sync ``Cursor.fetchmany`` was uncovered while the
 async sibling had a dedicated pin. Real KI / SystemExit-mid-
 fetchmany footgun if the arm regresses to ``except Exception:``.
 
-The override raises *after* ``super().fetchone()`` advances
-``_row_index``, so the snapshot/restore arm has actual work to do —
-without the restore, the next ``fetchall()`` would skip exactly the
-row whose retrieval was interrupted. A regression that drops the
-entire try/except/restore block would leave ``_row_index`` advanced
-past ``snapshot + len(result)`` and the test would fail.
+``fetchmany`` slices the buffer and applies ``row_factory`` in one
+batched pass, so the interruption is injected from the factory on
+the Nth row — the only caller code that runs between the snapshot
+and the index commit. Without the restore arm the index would either
+stay at the snapshot (replaying delivered rows) or jump to the end of
+the slice (skipping the interrupted row and the tail).
 """
 
 from __future__ import annotations
@@ -26,23 +25,21 @@ import pytest
 from dqlitedbapi.cursor import Cursor
 
 
-class _CountingCursor(Cursor):
-    """Test-only cursor that raises on the Nth fetchone call AFTER the
-    parent has advanced ``_row_index``."""
+def _interrupting_factory(raise_on_row: int) -> Any:
+    """Row factory that raises ``BaseException`` on its Nth call."""
+    calls = [0]
 
-    raise_after_advance: int = 0
-
-    def fetchone(self) -> Any:
-        row = super().fetchone()
-        # Raise AFTER ``super().fetchone()`` increments ``_row_index``
-        # so the production restore line has real work to do.
-        if self._row_index == self.raise_after_advance:
-            raise BaseException("simulated cancel post-advance")
+    def factory(_cur: object, row: tuple[Any, ...]) -> tuple[Any, ...]:
+        calls[0] += 1
+        if calls[0] == raise_on_row:
+            raise BaseException("simulated cancel mid-batch")
         return row
 
+    return factory
+
 
-def _make_sync_counting_cursor(n: int, raise_after_advance: int) -> _CountingCursor:
-    cur = _CountingCursor.__new__(_CountingCursor)
+def _make_sync_cursor(n: int) -> Cursor:
+    cur = Cursor.__new__(Cursor)
     cur._closed = False
     cur._description = (("col", 4, None, None, None, None, None),)
     cur._rowcount = n
@@ -52,7 +49,6 @@ def _make_sync_counting_cursor(n: int, raise_after_advance: int) -> _CountingCur
     cur._row_index = 0
     cur._arraysize = 1
     cur.messages = []
-    cur.raise_after_advance = raise_after_advance
     cur._connection = MagicMock()
     cur._connection._closed = False
     cur._connection._check_thread = lambda: None
@@ -60,25 +56,21 @@ def _make_sync_counting_cursor(n: int, raise_after_advance: int) -> _CountingCur
 
 
 def test_sync_fetchmany_cancel_mid_iteration_does_not_silently_consume_rows() -> None:
-    """With raise_after_advance=4, the parent advances _row_index to
-    4 and returns row (3,); the override then raises. At raise time
-    _row_index==4 but only 3 rows were appended to result. Without the
-    restore arm, _row_index would stay at 4 and the next fetchall
-    would skip row (3,).
+    """The factory raises on row (3,) after (0,)..(2,) were delivered
+    into the batch. The index must land at snapshot + 3 so (3,) is
+    still pending.
     """
-    cur = _make_sync_counting_cursor(10, raise_after_advance=4)
+    cur = _make_sync_cursor(10)
+    cur._row_factory = _interrupting_factory(raise_on_row=4)
 
     with pytest.raises(BaseException, match="simulated cancel"):  # noqa: PT011, BLE001
         cur.fetchmany(10)
 
-    # The restore arm scrubbed _row_index back to snapshot + len(result)
-    # = 0 + 3 = 3, so the row that was advanced-but-not-delivered ((3,))
-    # is still pending.
     assert cur._row_index == 3
 
     # The interrupted row plus the remaining tail must still be
     # fetchable. If the restore arm regressed, (3,) would be silently
     # skipped.
-    cur.raise_after_advance = -1  # disable raise
+    cur._row_factory = None
     rest = cur.fetchall()
     assert rest == [(3,), (4,), (5,), (6,), (7,), (8,), (9,)]